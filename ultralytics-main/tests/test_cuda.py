@@ -154,6 +154,22 @@ def test_predict_multiple_devices():
     assert str(model.device) == cuda_device
 
 
+@pytest.mark.skipif(not DEVICES, reason="No CUDA devices available")
+def test_results_batch_tensor_cpu():
+    """Test per-image CPU copies of a batched GPU result share one transfer but not the transferred batch memory."""
+    import numpy as np
+
+    from ultralytics.engine.results import BatchTensor, Results
+
+    batch = BatchTensor([torch.rand(3, 6, device=f"cuda:{DEVICES[0]}"), torch.rand(5, 6, device=f"cuda:{DEVICES[0]}")])
+    results = [Results(np.zeros((64, 64, 3), np.uint8), "", {0: "a"}, boxes=v) for v in batch.views]
+    batch.bind(results)
+    boxes = [r.cpu().boxes.data for r in results]
+    assert len(batch._copies) == 1  # one device transfer for the whole batch
+    assert boxes[0].untyped_storage().nbytes() == boxes[0].nbytes  # not a view into the transferred batch
+    assert all(torch.equal(b, v.cpu()) for b, v in zip(boxes, batch.views))
+
+
 @pytest.mark.skipif(not DEVICES, reason="No CUDA devices available")
 def test_autobatch():
     """Check optimal batch size for YOLO model training using autobatch utility."""
@@ -155,3 +155,40 @@ def test_nan_recovery():
     trainer.add_callback("on_train_batch_end", inject_nan)
     trainer.train()
     assert nan_injected[0], "NaN injection failed"
+
+
+def test_validate_subset_flag():
+    """Test subset-only validations are tagged in the epoch metrics and full validations are not."""
+    from types import SimpleNamespace
+
+    from ultralytics.engine.trainer import BaseTrainer
+
+    trainer = BaseTrainer.__new__(BaseTrainer)  # validate() only needs the validation state
+    trainer.args = SimpleNamespace(val_period=0, val_margin=0.0)
+    trainer.ema, trainer.world_size, trainer.epoch, trainer.loss = None, 1, 0, torch.zeros(1)
+    trainer.best_fitness = None
+    trainer.val_subset_loader, trainer.test_loader = "subset", "full"
+    trainer.subset_best_fitness, trainer.subset_gaps = None, []
+    trainer.validator = lambda t: {"metrics/mAP50(B)": 0.5, "fitness": 0.5}
+    metrics, fitness = trainer.validate(subset=True)  # no full validation yet, so the full set runs
+    assert fitness == 0.5 and metrics["metrics/val_subset"] == 0.0
+    metrics, fitness = trainer.validate(subset=True)  # subset fitness not better than the best, subset only
+    assert fitness is None and metrics["metrics/val_subset"] == 1.0
+    assert list(metrics) == ["metrics/mAP50(B)", "metrics/val_subset"]  # same csv columns as full epochs
+
+
+def test_data_profile_reset():
+    """Test reporting the dataloader profile stops worker stage timing and restarts the train loader workers."""
+    from types import SimpleNamespace
+
+    from ultralytics.engine.trainer import BaseTrainer
+
+    resets = []
+    trainer = BaseTrainer.__new__(BaseTrainer)
+    trainer.args = SimpleNamespace(data_autotune=False)
+    trainer.epoch, trainer.epochs, trainer.stop, trainer.data_tuned = 0, 3, False, False
+    trainer.data_profiler = SimpleNamespace(summary=lambda: "data profile")
+    trainer.train_loader = SimpleNamespace(dataset=SimpleNamespace(profile=True), reset=lambda: resets.append(1))
+    trainer._report_data_profile()
+    assert trainer.data_profiler is None and trainer.data_profile_logged
+    assert trainer.train_loader.dataset.profile is False and resets == [1]
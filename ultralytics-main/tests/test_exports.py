@@ -28,6 +28,27 @@ def test_export_onnx():
     YOLO(file)(SOURCE, imgsz=32)  # exported model inference
 
 
+@pytest.mark.parametrize("dynamic", [False, True])
+def test_onnx_io_binding(dynamic, tmp_path):
+    """Test ONNX Runtime IO binding rotates preallocated outputs for static and dynamic input shapes on CPU."""
+    import torch
+
+    from ultralytics.nn.autobackend import ORT_BUFFERS, AutoBackend
+
+    YOLO("yolo11n.yaml").save(tmp_path / "yolo11n.pt")
+    file = YOLO(tmp_path / "yolo11n.pt").export(format="onnx", dynamic=dynamic, imgsz=32)
+    model = AutoBackend(file, device=torch.device("cpu"))
+    shapes = [(1, 3, 32, 32)] * (ORT_BUFFERS + 1) + ([(2, 3, 64, 64)] * 2 if dynamic else [])
+    results = [model(torch.rand(shape)) for shape in shapes]
+    for y, shape in zip(results, shapes):
+        y = y[0] if isinstance(y, list) else y
+        assert isinstance(y, torch.Tensor) and y.shape[0] == shape[0]
+    y = [y[0] if isinstance(y, list) else y for y in results]  # y[1:] served from bound buffers
+    assert not torch.equal(y[1], y[2]) and y[1].data_ptr() != y[2].data_ptr()  # the previous output is not overwritten
+    if not dynamic:  # no allocation per inference, the buffers of a run are reused ORT_BUFFERS runs later
+        assert y[0].data_ptr() == y[ORT_BUFFERS].data_ptr()
+
+
 @pytest.mark.skipif(not TORCH_2_1, reason="OpenVINO requires torch>=2.1")
 def test_export_openvino():
     """Test YOLO export to OpenVINO format for model inference compatibility."""
@@ -209,6 +209,41 @@ def test_val(task: str, weight: str, data: str) -> None:
         metrics.confusion_matrix.to_json()
 
 
+@pytest.mark.parametrize("task", ["detect", "obb"])
+def test_val_match_batch(task):
+    """Test batched TP matching over padded predictions and targets equals per-image matching."""
+    from ultralytics.models.yolo.detect import DetectionValidator
+    from ultralytics.models.yolo.obb import OBBValidator
+
+    validator = (DetectionValidator if task == "detect" else OBBValidator)(args={"task": task})
+    validator.device = torch.device("cpu")
+    counts, n_pred, nb = [3, 0, 5, 2], [6, 4, 0, 9], 4 + (task == "obb")
+    batch_idx = torch.cat([torch.full((n,), i) for i, n in enumerate(counts)]).float()
+    batch = {
+        "batch_idx": batch_idx,
+        "cls": torch.randint(0, 2, (len(batch_idx), 1)).float(),
+        "bboxes": torch.cat((torch.rand(len(batch_idx), 2) * 0.6 + 0.2, torch.rand(len(batch_idx), nb - 2) * 0.3), 1),
+        "img": torch.zeros(len(counts), 3, 64, 64),
+        "ori_shape": [(64, 64)] * len(counts),
+        "ratio_pad": [((1.0, 1.0), (0, 0))] * len(counts),
+        "im_file": [f"{i}.jpg" for i in range(len(counts))],
+    }
+    preds = []
+    for i, n in enumerate(n_pred):
+        gt = validator._prepare_batch(i, batch)
+        noise = torch.randn(n, nb) * torch.tensor([2.0, 2, 2, 2, 0.05][:nb])
+        bboxes = gt["bboxes"][torch.randint(0, counts[i], (n,))] + noise if counts[i] else noise.abs() * 20
+        conf = torch.rand(n).sort(descending=True)[0]
+        preds.append({"bboxes": bboxes, "conf": conf, "cls": torch.randint(0, 2, (n,))})
+    stats = validator._match_batch(preds, batch)
+    for i, pred in enumerate(preds):
+        pbatch = validator._prepare_batch(i, batch)
+        assert np.array_equal(stats[i]["tp"], validator._process_batch(pred, pbatch)["tp"])
+        assert np.array_equal(stats[i]["target_cls"], pbatch["cls"].numpy())
+        assert np.allclose(stats[i]["conf"], pred["conf"].numpy())
+    assert sum(s["tp"].any(1).sum() for s in stats) > 0  # some matches
+
+
 @pytest.mark.skipif(IS_JETSON or IS_RASPBERRYPI, reason="Edge devices not intended for training")
 def test_train_scratch():
     """Test training the YOLO model from scratch using the provided configuration."""
@@ -277,6 +312,57 @@ def test_predict_callback_and_setup():
         print(boxes)
 
 
+def test_predict_ov_async_pipeline():
+    """Test pipelined OpenVINO batch inference keeps callback order and surfaces failed infer requests."""
+    from concurrent.futures import Future
+    from types import SimpleNamespace
+
+    from ultralytics.engine.predictor import BasePredictor
+    from ultralytics.nn.autobackend import AutoBackend
+    from ultralytics.utils import ops
+
+    class StubBackend:
+        """Async backend stand-in whose jobs complete only when collected, like a saturated infer request pool."""
+
+        ov_queue, ov_requests = object(), 2
+
+        def submit(self, im):
+            events.append(("submit", int(im)))
+            return [Future()]
+
+        def collect(self, jobs):
+            jobs[0].set_result(None)
+            return jobs[0].result()
+
+    events = []
+    predictor = BasePredictor(overrides={"verbose": False})
+    predictor.model = StubBackend()
+    predictor.dataset = [([f"{i}.jpg"], [i], [""]) for i in range(4)]
+    predictor.preprocess = lambda im0s: im0s[0]
+    predictor.add_callback("on_predict_batch_start", lambda p: events.append(("start", p.batch[1][0])))
+    for batch, im, _ in predictor.batch_inference((ops.Profile(), ops.Profile())):
+        assert predictor.batch is batch and im == batch[1][0]
+        events.append(("end", im))
+    starts_ends = [e for e in events if e[0] != "submit"]
+    assert starts_ends == [(k, i) for i in range(4) for k in ("start", "end")]  # start(N) -> end(N) -> start(N+1)
+    assert events.index(("submit", 1)) < events.index(("start", 0))  # next batch in flight before collecting
+
+    class FailedRequest:
+        """Infer request whose outputs cannot be read."""
+
+        @property
+        def results(self):
+            raise RuntimeError("infer request failed")
+
+    job = Future()
+    AutoBackend._ov_done(FailedRequest(), job)
+    with pytest.raises(RuntimeError, match="infer request failed"):
+        AutoBackend._ov_gather([job])
+    job = Future()
+    AutoBackend._ov_done(SimpleNamespace(results={"out": np.ones((1, 2))}), job)
+    assert AutoBackend._ov_gather([job])[0].shape == (1, 2)
+
+
 @pytest.mark.parametrize("model", MODELS)
 def test_results(model: str, tmp_path):
     """Test YOLO model results processing and output in various formats."""
@@ -342,6 +428,184 @@ def test_data_utils(tmp_path):
     zip_directory(tmp_path / "coco8/images/val")  # zip
 
 
+def test_data_image_cache(tmp_path):
+    """Test the memory-mapped image cache returns the stored images for any ordering of its files."""
+    from ultralytics.data.cache import ImageCache
+
+    files, ims = [], []
+    for i, shape in enumerate([(32, 48, 3), (48, 32, 3), (32, 32, 3), (16, 32, 3)]):
+        files.append(str(tmp_path / f"{i}.jpg"))
+        ims.append(np.random.randint(0, 255, shape, dtype=np.uint8))
+        cv2.imwrite(files[-1], ims[-1])
+    cache = ImageCache(tmp_path / "images.32.imcache", files, key="32-3")
+    assert not cache.load() and cache.build((im, (2 * im.shape[0], 2 * im.shape[1])) for im in ims)
+    reordered = ImageCache(tmp_path / "images.32.imcache", files[::-1], key="32-3")
+    assert reordered.load()
+    for i, im in enumerate(ims[::-1]):
+        assert np.array_equal(reordered[i][0], im) and reordered[i][1] == (2 * im.shape[0], 2 * im.shape[1])
+    assert not ImageCache(tmp_path / "images.32.imcache", files, key="64-3").load()  # settings changed
+
+
+def test_data_label_store(tmp_path):
+    """Test the columnar label store round-trips label dicts through a memory-mapped file and filters classes."""
+    import pickle
+
+    from ultralytics.data.cache import LabelStore
+
+    labels = []
+    for i, n in enumerate([3, 0, 2]):
+        cls = np.arange(n, dtype=np.float32).reshape(-1, 1)
+        segments = [np.random.rand(4 + j, 2).astype(np.float32) for j in range(n)]
+        labels.append(dict(im_file=f"{i}.jpg", shape=(32, 48), cls=cls, bboxes=np.random.rand(n, 4), segments=segments))
+    LabelStore.from_labels(labels).save(tmp_path / "labels.cache", {"hash": "abc"})
+    store, meta = LabelStore.load(tmp_path / "labels.cache")
+    store = pickle.loads(pickle.dumps(store))  # as sent to spawned dataloader workers
+    assert meta == {"hash": "abc"} and store.im_files == ["0.jpg", "1.jpg", "2.jpg"] and store.num_segments == 5
+    for lb, x in zip(labels, store[[0, 1, 2]]):
+        assert np.array_equal(lb["cls"], x["cls"]) and np.allclose(lb["bboxes"], x["bboxes"])
+        assert all(np.array_equal(a, b) for a, b in zip(lb["segments"], x["segments"]))
+    store.filter(include_class=[1])
+    assert store.num_instances == 2 and [len(x["segments"]) for x in store] == [1, 0, 1]
+    assert np.array_equal(store[2]["segments"][0], labels[2]["segments"][1])
+
+
+def test_data_incremental_scan(tmp_path, monkeypatch):
+    """Test label caching only verifies new and modified files and drops removed ones."""
+    import os
+    import shutil
+
+    from ultralytics.data import YOLODataset, dataset
+
+    images, labels = tmp_path / "images", tmp_path / "labels"
+    images.mkdir()
+    labels.mkdir()
+    for i in range(6):
+        cv2.imwrite(str(images / f"{i}.jpg"), np.full((32, 32, 3), 114, dtype=np.uint8))
+        (labels / f"{i}.txt").write_text(f"0 0.5 0.5 0.{i + 1} 0.2\n")
+    ds = YOLODataset(img_path=str(images), data={"names": {0: "item"}}, augment=False, imgsz=32)
+    verified, verify = [], dataset.verify_image_label
+    monkeypatch.setattr(dataset, "verify_image_label", lambda args: verified.append(args[0]) or verify(args))
+    (labels / "1.txt").write_text("0 0.5 0.5 0.9 0.9\n")  # modified
+    (images / "4.jpg").unlink()  # removed
+    (labels / "4.txt").unlink()
+    ds.im_files = ds.get_img_files(str(images))
+    lbs = ds.get_labels()
+    assert verified == [str(images / "1.jpg")] and len(lbs) == 5
+    assert np.allclose(lbs[1]["bboxes"], [[0.5, 0.5, 0.9, 0.9]]) and np.allclose(lbs[4]["bboxes"][0, 2], 0.6)
+    ds.im_files = ds.get_img_files(str(images))
+    assert len(ds.get_labels()) == 5 and len(verified) == 1  # unchanged cache is not scanned
+    shutil.copy2(labels / "2.txt", tmp_path / "2.txt")
+    os.replace(tmp_path / "2.txt", labels / "2.txt")  # same size and mtime under a new inode, i.e. a restored copy
+    ds.im_files = ds.get_img_files(str(images))
+    assert len(ds.get_labels()) == 5 and len(verified) == 1
+
+
+def test_data_mosaic_fuse(tmp_path):
+    """Test warping mosaic tiles directly matches warping the mosaic canvas up to interpolation at tile edges."""
+    import random
+
+    from ultralytics.data import YOLODataset
+    from ultralytics.data.augment import Mosaic, RandomPerspective
+    from ultralytics.utils.ops import segment2box
+
+    (tmp_path / "images").mkdir()
+    (tmp_path / "labels").mkdir()
+    for i, (h, w) in enumerate(((48, 64), (64, 40), (56, 56), (40, 64))):
+        cv2.imwrite(str(tmp_path / "images" / f"{i}.png"), np.random.randint(0, 255, (h, w, 3), dtype=np.uint8))
+        (tmp_path / "labels" / f"{i}.txt").write_text("0 0.5 0.5 0.4 0.4\n0 0.2 0.3 0.2 0.2\n")
+    ds = YOLODataset(img_path=str(tmp_path / "images"), data={"names": {0: "item"}}, augment=False, imgsz=64)
+    ds.buffer = [1, 2, 3]
+    out = []
+    for fuse in False, True:
+        random.seed(0)
+        affine = RandomPerspective(degrees=10, translate=0.1, scale=0.5, shear=2)
+        out.append(affine(Mosaic(ds, imgsz=64, fuse=fuse)(ds.get_image_and_label(0))))
+    assert out[0]["img"].shape == out[1]["img"].shape == (64, 64, 3)
+    assert (np.abs(out[0]["img"].astype(int) - out[1]["img"]).max(-1) > 2).mean() < 0.1  # seams only
+    assert np.allclose(out[0]["instances"].bboxes, out[1]["instances"].bboxes)
+
+    segments = np.random.uniform(-20, 80, (8, 50, 2)).astype(np.float32)
+    boxes = np.stack([segment2box(x, 64, 48) for x in segments])
+    assert np.array_equal(RandomPerspective.segments2boxes(segments, 64, 48), boxes)
+
+
+def test_data_stratified_subset():
+    """Test stratified subsets are deterministic, keep every class and have the requested size."""
+    from ultralytics.data import StratifiedSubset
+
+    rng = np.random.default_rng(0)
+    labels = [{"cls": rng.integers(0, 20, (rng.integers(0, 4), 1))} for _ in range(500)]
+    labels[7]["cls"] = np.array([[99]])  # single image of a rare class
+    idx = StratifiedSubset.sample(labels, 0.1, seed=1)
+    assert np.array_equal(idx, StratifiedSubset.sample(labels, 0.1, seed=1))
+    assert np.array_equal(idx, np.unique(idx)) and 50 <= len(idx) <= 60
+    assert 7 in idx
+    classes = {c for i in idx for c in labels[i]["cls"].ravel()}
+    assert classes == {c for lb in labels for c in lb["cls"].ravel()}
+
+
+def test_data_profiler():
+    """Test exclusive stage times travel with their batches and the profiler measures data wait."""
+    import time
+
+    from torch.utils.data import default_collate
+
+    from ultralytics.data.utils import STAGE_TIMER, DataProfiler, profile_collate
+
+    def loader():
+        for _ in range(5):
+            samples = []
+            for _ in range(2):
+                with STAGE_TIMER("Mosaic"):
+                    with STAGE_TIMER("imread"):
+                        time.sleep(0.005)
+                    samples.append({"img": torch.zeros(3, 8, 8)})
+            yield profile_collate(default_collate, samples)
+
+    profiler = DataProfiler(4)
+    batches = list(profiler(loader()))
+    assert len(batches) == 5 and all("profile" not in b for b in batches)  # 5th batch passed through unprofiled
+    assert profiler.done and profiler.images == 8 and profiler.steps == 3 and dict(profiler.workers)[-1][0] == 4
+    assert profiler.stages["imread"] >= 0.04 > profiler.stages["Mosaic"]  # nested imread excluded from Mosaic
+    assert profiler.wait_fraction > 0.5 and "input-bound" in profiler.summary()
+    workers, prefetch = profiler.suggest(max_workers=4)
+    assert 1 <= workers <= 4 and 2 <= prefetch <= 8
+    assert not STAGE_TIMER.enabled and "profile" not in profile_collate(default_collate, [{"img": torch.zeros(1)}])
+
+
+def test_data_batch_augment():
+    """Test batch-level HSV and flip augmentations and their removal from the per-sample pipeline."""
+    from ultralytics.data.augment import BatchAugment, RandomFlip, RandomHSV, v8_transforms
+    from ultralytics.utils import IterableSimpleNamespace
+    from ultralytics.utils.instance import Instances
+
+    img = torch.rand(2, 3, 8, 12)
+    assert torch.allclose(BatchAugment("hsv", 0, 0, 0).hsv(img), img, atol=1e-5)  # RGB-HSV-RGB round trip
+    assert BatchAugment.parse(True) == BatchAugment.parse("hsv, flip") == {"hsv", "flip"}
+    with pytest.raises(ValueError):
+        BatchAugment.parse(["mosaic"])
+
+    bboxes, kpts = np.array([[0.2, 0.3, 0.1, 0.2]], np.float32), np.array([[[0.1, 0.2, 1], [0.7, 0.4, 1]]], np.float32)
+    batch = {
+        "img": img,
+        "bboxes": torch.tensor(bboxes),
+        "keypoints": torch.tensor(kpts),
+        "batch_idx": torch.tensor([1.0]),
+    }
+    batch = BatchAugment("flip", flipud=0.0, fliplr=1.0, flip_idx=[1, 0])(batch)
+    instances = Instances(bboxes, np.zeros((1, 0, 2)), kpts, normalized=True)
+    labels = {"img": np.zeros((8, 12, 3), np.uint8), "instances": instances}
+    labels = RandomFlip(p=1.0, direction="horizontal", flip_idx=[1, 0])(labels)
+    assert torch.equal(batch["img"], img.flip(-1))
+    assert np.allclose(batch["bboxes"].numpy(), labels["instances"].bboxes)
+    assert np.allclose(batch["keypoints"].numpy(), labels["instances"].keypoints)
+
+    dataset = type("Dataset", (), {"cache": None, "use_keypoints": False, "data": {}})()
+    hyp = IterableSimpleNamespace(**{**vars(DEFAULT_CFG), "batch_augment": "hsv,flip"})
+    transforms = v8_transforms(dataset, 64, hyp).transforms
+    assert not any(isinstance(t, (RandomHSV, RandomFlip)) for t in transforms)
+
+
 @pytest.mark.skipif(not ONLINE, reason="environment is offline")
 def test_data_converter(tmp_path):
     """Test dataset conversion functions from COCO to YOLO format and class mappings."""
@@ -354,6 +618,34 @@ def test_data_converter(tmp_path):
     coco80_to_coco91_class()
 
 
+def test_data_bbox2segment(tmp_path, monkeypatch):
+    """Test SAM segments generated from box labels are written to the label files."""
+    from types import SimpleNamespace
+
+    import ultralytics
+    from ultralytics.data.converter import yolo_bbox2segment
+
+    (tmp_path / "images").mkdir()
+    (tmp_path / "labels").mkdir()
+    for i in range(2):
+        cv2.imwrite(str(tmp_path / "images" / f"{i}.jpg"), np.zeros((32, 32, 3), dtype=np.uint8))
+        (tmp_path / "labels" / f"{i}.txt").write_text(f"{i} 0.5 0.5 0.5 0.5\n")
+    segment = np.array([[0.25, 0.25], [0.75, 0.25], [0.75, 0.75]])
+
+    class SAM:  # returns one fixed segment per box instead of running a model
+        def __init__(self, model):
+            pass
+
+        def __call__(self, im, bboxes, **kwargs):
+            return [SimpleNamespace(masks=SimpleNamespace(xyn=[segment] * len(bboxes)))]
+
+    monkeypatch.setattr(ultralytics, "SAM", SAM)
+    yolo_bbox2segment(tmp_path / "images", save_dir=tmp_path / "segments")
+    for i in range(2):
+        expected = [str(i), *(f"{x:g}" for x in segment.ravel())]
+        assert (tmp_path / "segments" / f"{i}.txt").read_text().split() == expected
+
+
 def test_data_annotator(tmp_path):
     """Test automatic annotation of data using detection and segmentation models."""
     from ultralytics.data.annotator import auto_annotate
@@ -495,6 +787,447 @@ def test_utils_ops():
     torch.allclose(boxes, xyxyxyxy2xywhr(xywhr2xyxyxyxy(boxes)), rtol=1e-3)
 
 
+def test_utils_nms_topk():
+    """Test pre-NMS top-k candidate selection keeps the highest scoring detections and their mask coefficients."""
+    from ultralytics.utils.nms import non_max_suppression
+
+    pred = torch.rand(2, 4 + 3 + 8, 2000)  # (bs, 4 + nc + nm, anchors)
+    pred[:, :2] *= 640
+    pred[:, 2:4] *= 20
+    full = non_max_suppression(pred.clone(), 0.25, 0.7, nc=3, max_det=10)
+    topk = non_max_suppression(pred.clone(), 0.25, 0.7, nc=3, max_det=10, topk_per_det=3)
+    for a, b in zip(full, topk):
+        assert b.shape[1] == 6 + 8
+        assert torch.equal(a[: len(b)], b)  # greedy NMS over the top-k is a prefix of the full result
+
+
+def test_utils_metrics_streaming():
+    """Test streaming confidence-histogram statistics match exact AP, can be read mid-run and merged across ranks."""
+    from ultralytics.utils.metrics import DetMetrics
+
+    rng = np.random.default_rng(0)
+    exact, stream, *ranks = (DetMetrics({0: "a", 1: "b", 2: "c"}) for _ in range(4))
+    for m in (stream, *ranks):
+        m.bins = 1000
+    for i in range(200):
+        n, t = rng.integers(0, 20), rng.integers(0, 3, rng.integers(0, 6)).astype(float)
+        conf = rng.random(n)
+        tp = rng.random((n, 1)) < conf[:, None] * np.linspace(1, 0.3, 10)
+        pred_cls = rng.integers(0, 3, n).astype(float)
+        stat = dict(tp=tp, conf=conf, pred_cls=pred_cls, target_cls=t, target_img=np.unique(t))
+        for m in exact, stream, ranks[i % 2]:
+            m.update_stats(stat)
+        if i == 99:
+            assert stream.process()["n"].sum() == sum(len(x) for x in exact.stats["conf"])  # partial results mid-run
+    ranks[0].hist.merge(ranks[1].hist)
+    for m in exact, stream, ranks[0]:
+        m.process()
+    assert np.array_equal(exact.nt_per_class, stream.nt_per_class)
+    assert np.array_equal(exact.nt_per_image, stream.nt_per_image)
+    assert abs(exact.fitness - stream.fitness) < 2e-3
+    assert stream.results_dict == ranks[0].results_dict
+    assert stream.hist.n.shape == (3, 1000)  # bounded memory
+
+
+def test_utils_process_mask_roi():
+    """Test decoding masks inside their boxes matches cropping and upsampling the full prototype masks."""
+    import torch.nn.functional as F
+
+    from ultralytics.utils.ops import crop_mask, process_mask
+
+    g = torch.Generator().manual_seed(0)
+    protos, ratios = torch.randn(32, 160, 160, generator=g), torch.tensor([[0.25, 0.25, 0.25, 0.25]])
+    for n in 20, 60:  # crop_mask() rounds boxes below 50 masks and compares float coordinates above
+        coeffs, xy = torch.randn(n, 32, generator=g), torch.rand(n, 2, generator=g) * 640
+        wh = torch.rand(n, 2, generator=g) * 200
+        boxes = torch.cat([xy - 100, xy + wh], 1).clamp(0, 640)  # some partly outside the image
+        dense = crop_mask((coeffs @ protos.view(32, -1)).view(-1, 160, 160), boxes * ratios)
+        dense = F.interpolate(dense[None], (640, 640), mode="bilinear")[0].gt_(0.0).byte()
+        # Summation order of the per-box matmul differs, so values within float eps of 0 may flip a few pixels
+        assert (process_mask(protos, coeffs, boxes, (640, 640), upsample=True) != dense).sum() <= 10
+
+
+def test_fused_checkpoint(tmp_path):
+    """Test the fused deploy artifact matches a freshly fused checkpoint and is only used when passed explicitly."""
+    import time
+
+    from ultralytics.nn.tasks import load_checkpoint, save_fused_checkpoint
+
+    def load_time(f):
+        """Return the fastest of three fused loads of f in seconds."""
+        t = []
+        for _ in range(3):
+            t0 = time.perf_counter()
+            load_checkpoint(f, fuse=True)
+            t.append(time.perf_counter() - t0)
+        return min(t)
+
+    file = tmp_path / "yolo11n.pt"
+    YOLO("yolo11n.yaml").save(file)  # FP16 like trained checkpoints
+    fused = save_fused_checkpoint(file)
+    assert fused.name == "yolo11n.fused.pt"
+    assert fused.stat().st_size <= file.stat().st_size and load_time(fused) < load_time(file)
+    assert load_checkpoint(file, fuse=True)[0].pt_path == str(file)  # sibling artifact is not picked up implicitly
+    model, _ = load_checkpoint(fused, fuse=True)
+    assert model.pt_path == str(fused) and model.is_fused()
+    im = torch.rand(1, 3, 64, 64)
+    assert next(model.parameters()).dtype == torch.float32
+    y = load_checkpoint(file)[0].fuse().eval()(im)[0]
+    assert torch.allclose(model(im)[0], y, rtol=1e-3, atol=1e-2)  # folded weights are rounded to FP16 once more
+    assert len(YOLO(fused).predict(np.zeros((64, 64, 3), np.uint8), imgsz=64)) == 1
+
+
+def test_checkpoint_writer(tmp_path):
+    """Test background checkpoint writes supersede queued writes per file and keep hard-linked copies consistent."""
+    from ultralytics.utils.torch_utils import (
+        CheckpointWriter,
+        convert_optimizer_state_dict_to_fp16,
+        optimizer_state_dict_to_cpu,
+    )
+
+    model = torch.nn.Linear(4, 2)
+    optimizer = torch.optim.AdamW(model.parameters())
+    model(torch.rand(3, 4)).sum().backward()
+    optimizer.step()
+    a, b = optimizer_state_dict_to_cpu(optimizer), convert_optimizer_state_dict_to_fp16(optimizer.state_dict())
+    assert all(torch.equal(v, a["state"][0][k]) and v.dtype == a["state"][0][k].dtype for k, v in b["state"][0].items())
+
+    writer = CheckpointWriter()
+    last, best, epoch = tmp_path / "last.pt", tmp_path / "best.pt", tmp_path / "epoch2.pt"
+    for i, files in enumerate(([last, best], [last], [last, epoch])):
+        writer.save({"epoch": i, "x": torch.rand(100_000)}, files)
+    writer.wait()
+    assert [torch.load(f)["epoch"] for f in (last, best, epoch)] == [2, 0, 2]
+    assert sorted(x.name for x in tmp_path.iterdir()) == ["best.pt", "epoch2.pt", "last.pt"]  # no temporary files
+
+
+def test_results_batch_tensor():
+    """Test Results sharing one batch tensor map per-image views across devices and memoize conversions."""
+    from ultralytics.engine.results import BatchTensor, Results
+
+    batch = BatchTensor([torch.rand(3, 6 + 34), torch.rand(0, 6 + 34), torch.rand(5, 6 + 34)])
+    im = np.zeros((64, 64, 3), np.uint8)
+    results = [Results(im, "", {0: "a"}, boxes=v[:, :6], keypoints=v[:, 6:].view(len(v), 17, 2)) for v in batch.views]
+    batch.bind(results)
+    for r, v in zip(results, batch.views):
+        assert torch.equal(batch.to(r.boxes.data, "cpu"), v[:, :6])
+        assert torch.equal(batch.to(r.keypoints.data, "cpu"), r.keypoints.data)
+    r = results[-1]
+    assert r.boxes.xywh is r.boxes.xywh and r.numpy() is r.numpy()
+    r.update(boxes=torch.rand(2, 6))
+    assert len(r.numpy().boxes) == 2
+    r.boxes = r.boxes[:1]  # direct assignment also drops the memoized copies
+    assert len(r.numpy().boxes) == 1 and r.numpy() is r.numpy()
+
+
+def test_annotator_box_labels():
+    """Test batched box and label rendering matches drawing the same box with box_label()."""
+    from ultralytics.utils.plotting import Annotator, colors
+
+    im = np.random.randint(0, 255, (320, 480, 3), dtype=np.uint8)
+    for box in ([100, 100, 300, 200], [5, 2, 60, 40], [450, 150, 479, 319]):
+        a, b = Annotator(im.copy()), Annotator(im.copy())
+        a.box_label(box, "person 0.87", colors(0, True))
+        b.box_labels(np.array([box]), ["person 0.87"], [colors(0, True)])
+        d = np.abs(a.result().astype(int) - b.result().astype(int))
+        assert d.max() <= 2 and (d > 1).sum() <= 3  # blend rounding, anti-aliased lines clipped at the image edge
+
+    boxes = [[100, 100, 300, 200], [150, 60, 350, 180]]  # second box line crosses the first label
+    a, b = Annotator(im.copy()), Annotator(im.copy())
+    for i, box in enumerate(boxes):
+        a.box_label(box, f"person 0.{9 - i}", colors(i, True))
+    b.box_labels(np.array(boxes), ["person 0.9", "person 0.8"], [colors(i, True) for i in range(2)])
+    d = np.abs(a.result().astype(int) - b.result().astype(int)).max(2)
+    (w, h), _ = cv2.getTextSize("person 0.9", 0, fontScale=a.sf, thickness=a.tf)
+    label = np.zeros_like(d, bool)
+    label[100 - h - 5 : 103, 98 : 103 + w] = True  # first label box plus its anti-aliased spill
+    assert d[label].max() > 1 and d[~label].max() <= 2  # only the label covered by the second box line differs
+
+
+def test_annotator_masks_overlap():
+    """Test the last of overlapping masks sets the pixel color on the numpy path, as with masks drawn one by one."""
+    from ultralytics.utils.plotting import Annotator
+
+    masks = np.zeros((3, 64, 64), np.uint8)
+    masks[0, :40], masks[1, 20:], masks[2, 30:50, 30:50] = 1, 1, 1
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    a, b = Annotator(np.zeros((64, 64, 3), np.uint8)), np.zeros((64, 64, 3), np.uint8)
+    a.masks(masks, colors)
+    for mask, color in zip(masks, colors):
+        b[mask.astype(bool)] = color
+    assert np.array_equal(a.result(), cv2.addWeighted(np.zeros_like(b), 0.5, b, 0.5, 0))
+
+
+def test_trackers_import():
+    """Test tracker modules import and only use PEP 604 or builtin generic annotations with postponed evaluation."""
+    import ast
+    import importlib
+
+    for f in sorted((ROOT / "trackers").rglob("*.py")):
+        importlib.import_module(".".join(f.relative_to(ROOT.parent).with_suffix("").parts))  # TypeError on Python<3.10
+        tree = ast.parse(f.read_text(encoding="utf-8"))
+        if any(isinstance(n, ast.ImportFrom) and n.module == "__future__" for n in tree.body):
+            continue
+        for node in ast.walk(tree):
+            args = node.args.args + node.args.kwonlyargs if isinstance(node, ast.FunctionDef) else []
+            for ann in [a.annotation for a in args] + [getattr(node, "returns", None)]:
+                for x in ast.walk(ann) if ann is not None else ():
+                    assert not isinstance(x, ast.BinOp), f"{f.name}:{node.lineno} needs postponed annotations"
+
+
+def test_strack_state_bank():
+    """Test batched Kalman updates of banked tracks match per-track updates and slots are recycled."""
+    from ultralytics.trackers.byte_tracker import STrack
+    from ultralytics.trackers.utils.kalman_filter import KalmanFilterXYAH, StateBank
+
+    kf, bank = KalmanFilterXYAH(), StateBank(capacity=2)
+    tracks = [STrack(np.array([50.0 * i, 40.0, 20.0, 30.0, i]), 0.9, 0) for i in range(1, 6)]
+    for t in tracks:
+        t.activate(kf, 1, bank)
+    dets = [STrack(np.array([50.0 * i + 2, 41.0, 21.0, 29.0, i]), 0.9, 0) for i in range(1, 6)]
+    STrack.multi_predict(tracks)
+    expected = [kf.update(t.mean.copy(), t.covariance.copy(), t.convert_coords(d.tlwh)) for t, d in zip(tracks, dets)]
+    STrack.multi_update(tracks, dets)
+    for t, (mean, cov) in zip(tracks, expected):
+        assert np.allclose(t.mean, mean) and np.allclose(t.covariance, cov)
+    mean = tracks[0].mean.copy()
+    bank.sweep(tracks[1:])
+    assert tracks[0].slot is None and np.array_equal(tracks[0].mean, mean) and len(bank) == 4
+
+
+def test_sparse_matching():
+    """Test grid-gated IoU and per-component assignment match their dense counterparts."""
+    from ultralytics.trackers.utils.matching import gated_iou, linear_assignment, split_assignment
+    from ultralytics.utils.metrics import bbox_ioa
+
+    rng = np.random.default_rng(0)
+    xy, wh = rng.uniform(0, 2000, (400, 2)), rng.uniform(10, 80, (400, 2))
+    a = np.concatenate([xy, xy + wh], 1).astype(np.float32)
+    b = (a + rng.normal(0, 5, a.shape)).astype(np.float32)[rng.permutation(400)]
+    ious = bbox_ioa(a, b, iou=True)
+    assert np.array_equal(gated_iou(a, b), ious)
+    matches, ua, ub = linear_assignment(1 - ious, thresh=0.8)
+    assert len(matches) + len(ua) == 400 and len(matches) + len(ub) == 400
+    dense = linear_assignment(1 - ious[:200, :200], thresh=0.8)  # lapjv on the full matrix below SPLIT_SIZE
+    split = split_assignment(1 - ious[:200, :200], thresh=0.8)
+    assert all(np.array_equal(x, y) for x, y in zip(split, dense))
+
+
+def test_multi_stream_tracker(tmp_path):
+    """Test the multi-stream tracking service tracks every frame of streams with different lengths."""
+    from ultralytics.trackers import MultiStreamTracker
+
+    sources = []
+    for name, n in (("a", 12), ("b", 5)):
+        sources.append(str(tmp_path / f"{name}.avi"))
+        writer = cv2.VideoWriter(sources[-1], cv2.VideoWriter_fourcc(*"MJPG"), 25, (160, 120))
+        for _ in range(n):
+            writer.write(np.full((120, 160, 3), 114, dtype=np.uint8))
+        writer.release()
+    service = MultiStreamTracker(YOLO("yolo11n.yaml"), sources, imgsz=64)
+    counts = [0, 0]
+    for i, result in service:
+        counts[i] += 1
+        assert result.path == sources[i]
+    assert counts == [12, 5]
+    assert [m["frames"] for m in service.metrics()] == [12, 5]
+
+
+def test_video_reader_writer(tmp_path):
+    """Test threaded video writing and strided read-ahead decoding return the frames of in-loop cv2 I/O."""
+    from ultralytics.data.loaders import LoadImagesAndVideos
+    from ultralytics.data.video import VideoWriter
+
+    file = str(tmp_path / "video.avi")
+    writer = VideoWriter(file, cv2.VideoWriter_fourcc(*"MJPG"), 25, (64, 48))
+    for i in range(10):
+        writer.write(np.full((48, 64, 3), 20 * i, dtype=np.uint8))
+    writer.release()
+    cap, expected = cv2.VideoCapture(file), []
+    while all(cap.grab() for _ in range(3)):
+        expected.append(cap.retrieve()[1])
+    frames = [im for _, ims, _ in LoadImagesAndVideos(file, batch=2, vid_stride=3) for im in ims]
+    assert len(frames) == len(expected) == 3
+    assert all(np.array_equal(a, b) for a, b in zip(frames, expected))
+
+    class FailingWriter:
+        def write(self, im):
+            raise OSError("disk full")
+
+        def release(self):
+            pass
+
+    writer = VideoWriter(str(tmp_path / "failed.avi"), cv2.VideoWriter_fourcc(*"MJPG"), 25, (64, 48), queue_size=1)
+    writer.writer.release()
+    writer.writer = FailingWriter()
+    with pytest.raises(RuntimeError, match="failed"):  # raised instead of blocking on the full queue
+        for _ in range(5):
+            writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+    with pytest.raises(RuntimeError, match="failed"):
+        writer.release()
+
+
+def test_video_reader_pyav(tmp_path):
+    """Test strided PyAV decoding that skips unreferenced B-frames returns the same frames as full decoding."""
+    av = pytest.importorskip("av")
+    from ultralytics.data.video import VideoReader
+
+    file = str(tmp_path / "video.mp4")
+    with av.open(file, "w") as container:
+        stream = container.add_stream("libx264", rate=25, options={"bf": "3", "g": "30"})
+        stream.width, stream.height, stream.pix_fmt = 64, 48, "yuv420p"
+        for i in range(40):
+            im = np.roll(np.arange(64 * 48 * 3, dtype=np.uint8).reshape(48, 64, 3), 2 * i, 1)
+            container.mux(stream.encode(av.VideoFrame.from_ndarray(im, format="bgr24")))
+        container.mux(stream.encode())
+    with av.open(file) as container:
+        expected = [f.to_ndarray(format="bgr24") for f in container.decode(video=0)][2::3]
+    reader, frames = VideoReader(file, vid_stride=3, backend="pyav"), []
+    while (frame := reader.read())[0]:
+        frames.append(frame[1])
+    reader.release()
+    assert len(frames) == len(expected) == 13
+    assert all(np.array_equal(a, b) for a, b in zip(frames, expected))
+
+
+def test_frame_ring(tmp_path):
+    """Test the stream frame ring in buffered and latest-frame modes, and LoadStreams reading through it."""
+    from ultralytics.data.loaders import LoadStreams
+    from ultralytics.data.video import FrameRing
+
+    for buffered, expected in ((True, [0, 1, 2]), (False, [2])):
+        ring = FrameRing((4, 4, 3), capacity=3, buffered=buffered)
+        for i in range(3):
+            ring.reserve()[:] = i
+            ring.commit()
+        ring.close()
+        values, out = [], np.empty((4, 4, 3), np.uint8)
+        while (im := ring.get(out=out if buffered else None)) is not None:
+            assert (im is out) == buffered  # copied into the caller's array, else into a new one
+            values.append(int(im[0, 0, 0]))
+        assert values == expected
+
+    file = str(tmp_path / "video.avi")
+    writer = cv2.VideoWriter(file, cv2.VideoWriter_fourcc(*"MJPG"), 25, (64, 48))
+    for i in range(6):
+        writer.write(np.full((48, 64, 3), 40 * i, dtype=np.uint8))
+    writer.release()
+    (tmp_path / "video.streams").write_text(file)
+    frames = [ims[0] for _, ims, _ in LoadStreams(str(tmp_path / "video.streams"), buffer=True, channels=1)]
+    assert len(frames) == 6 and frames[0].shape == (48, 64, 1)
+    streams = LoadStreams(str(tmp_path / "video.streams"), buffer=False)
+    assert streams.rings[0].capacity == 2  # latest-frame mode keeps a write and a read slot per stream
+    streams.close()
+
+
+def test_gmc_klt():
+    """Test KLT camera motion recovers a frame shift, skips still frames and returns the same result when prefetched."""
+    from ultralytics.trackers.utils.gmc import GMC
+
+    rng = np.random.default_rng(0)
+    im = cv2.GaussianBlur(rng.integers(0, 255, (480, 640, 3), dtype=np.uint8), (7, 7), 0)
+    frames = [cv2.warpAffine(im, np.float32([[1, 0, 3 * i], [0, 1, -2 * i]]), (640, 480)) for i in range(4)]
+    sync, prefetched = GMC(method="klt"), GMC(method="klt")
+    for i, frame in enumerate(frames + [frames[-1]]):
+        prefetched.prefetch(frame)
+        H = sync.apply(frame)
+        assert np.array_equal(prefetched.apply(frame), H)
+        if 0 < i < 4:
+            assert np.allclose(H, [[1, 0, 3], [0, 1, -2]], atol=0.2)
+    assert np.array_equal(H, np.eye(2, 3))  # unchanged frame
+    sync, prefetched = GMC(method="klt"), GMC(method="klt")
+    for gmc in sync, prefetched:
+        gmc.apply(frames[0])
+    prefetched.prefetch(frames[1])
+    prefetched.prefetch(frames[2])  # frames[1] is never applied, its estimate must not leak into frames[2]
+    assert np.array_equal(prefetched.apply(frames[2]), sync.apply(frames[2]))
+    assert not prefetched.pending
+
+
+def test_botsort_reid_cache():
+    """Test BoT-SORT embeds stale or ambiguous detections only, in one forward pass shared by several trackers."""
+    from functools import partial
+
+    from ultralytics.engine.results import Boxes
+    from ultralytics.trackers.bot_sort import BOTSORT, ReID
+    from ultralytics.trackers.utils.matching import embedding_distance
+    from ultralytics.utils import IterableSimpleNamespace
+
+    args = {"with_reid": True, "model": "yolo11n.yaml", "gmc_method": "none", "reid_refresh": 3}
+    cfg = IterableSimpleNamespace(**{**YAML.load(ROOT / "cfg/trackers/botsort.yaml"), **args})
+    encoder = ReID(cfg.model)
+    encoder.model(np.zeros((32, 32, 3), np.uint8), embed=[len(encoder.model.model.model) - 2], imgsz=32, verbose=False)
+    crops, embed = [], encoder.embed
+    encoder.embed = lambda x: crops.append(len(x)) or embed(x)
+    trackers = [BOTSORT(cfg, encoder=encoder) for _ in range(2)]
+    im = np.random.randint(0, 255, (256, 256, 3), dtype=np.uint8)
+    data = np.array([[20, 20, 60, 80, 0.9, 0], [120, 40, 170, 120, 0.8, 0], [180, 150, 240, 230, 0.9, 0]], np.float32)
+    for _ in range(6):
+        results = encoder.run_batched([partial(t.update, Boxes(data, im.shape[:2]), im) for t in trackers])
+    assert crops == [6, 6]  # new tracks on frame 1, refresh on frame 4
+    assert all(len(r) == 3 for r in results)
+    executor, low = encoder.executor, data.copy()
+    low[1, 4] = 0.2  # matched in the second, IoU-only stage
+    encoder.run_batched([partial(t.update, Boxes(low, im.shape[:2]), im) for t in trackers])
+    assert encoder.executor is executor  # threads are reused across frames
+    assert all(t.feat_frame == 7 for tracker in trackers for t in tracker.tracked_stracks)
+    ids = [t.track_id for tracker in trackers for t in tracker.tracked_stracks]
+    assert len(set(ids)) == len(ids) == 6
+    tracks = trackers[0].tracked_stracks
+    expected = 1 - np.stack([t.smooth_feat for t in tracks]) @ np.stack([t.curr_feat for t in tracks[::-1]]).T
+    assert np.allclose(embedding_distance(tracks, tracks[::-1]), np.maximum(0, expected), atol=1e-6)
+
+
+def test_tracker_snapshot(tmp_path):
+    """Test trackers restored from a snapshot continue with the same tracks and IDs as the originals."""
+    from ultralytics.engine.results import Boxes
+    from ultralytics.trackers.track import TRACKER_MAP, load_tracker_cfg, load_trackers, save_trackers
+
+    rng = np.random.default_rng(0)
+    pos, wh, frames = rng.uniform(50, 550, (20, 2)), rng.uniform(20, 60, (20, 2)), []
+    for _ in range(20):
+        pos += rng.normal(0, 3, pos.shape)
+        data = np.concatenate([pos - wh / 2, pos + wh / 2, rng.uniform(0.05, 1, (20, 1)), np.zeros((20, 1))], 1)
+        frames.append(Boxes(data.astype(np.float32), (640, 640)))
+    for tracker in ("bytetrack.yaml", "botsort.yaml"):
+        cfg = load_tracker_cfg(tracker)
+        original = TRACKER_MAP[cfg.tracker_type](cfg)
+        for boxes in frames[:10]:
+            original.update(boxes)
+        save_trackers([original], tmp_path / "tracks.npz").join()
+        expected = [original.update(boxes) for boxes in frames[10:]]
+        restored = TRACKER_MAP[cfg.tracker_type](cfg)  # resets the global ID counter
+        load_trackers([restored], tmp_path / "tracks.npz")
+        assert all(np.array_equal(restored.update(boxes), e) for boxes, e in zip(frames[10:], expected))
+
+
+
+def test_tracker_snapshot_persist(tmp_path):
+    """Test persisted tracking only writes periodic snapshots per call and saves the final one at predictor teardown."""
+    import gc
+
+    from ultralytics.trackers.track import TRACKER_MAP, _flush_on_teardown, load_tracker_cfg, on_predict_end
+
+    class Predictor:
+        pass
+
+    cfg = load_tracker_cfg("bytetrack.yaml")
+    cfg.snapshot, cfg.snapshot_interval = str(tmp_path / "tracks.npz"), 1000
+    predictor = Predictor()
+    predictor.trackers = [TRACKER_MAP[cfg.tracker_type](cfg)]
+    _flush_on_teardown(predictor)
+    on_predict_end(predictor, persist=True)  # e.g. model.track(frame, persist=True) once per frame
+    assert not Path(cfg.snapshot).exists()
+    del predictor
+    gc.collect()
+    assert Path(cfg.snapshot).is_file()
+
+    Path(cfg.snapshot).unlink()
+    predictor = Predictor()
+    predictor.trackers = [TRACKER_MAP[cfg.tracker_type](cfg)]
+    on_predict_end(predictor)  # stream ended
+    assert Path(cfg.snapshot).is_file()
+
 def test_utils_files(tmp_path):
     """Test file handling utilities including file age, date, and paths with spaces."""
     from ultralytics.utils.files import file_age, file_date, get_latest_run, spaces_in_path
@@ -151,6 +151,7 @@ CLI_HELP_MSG = f"""
 CFG_FLOAT_KEYS = frozenset(
     {  # integer or float arguments, i.e. x=2 and x=2.0
         "warmup_epochs",
+        "val_margin",
         "box",
         "cls",
         "dfl",
@@ -164,6 +165,7 @@ CFG_FLOAT_KEYS = frozenset(
 CFG_FRACTION_KEYS = frozenset(
     {  # fractional float arguments with 0.0<=values<=1.0
         "dropout",
+        "val_fraction",
         "lr0",
         "lrf",
         "momentum",
@@ -193,10 +195,16 @@ CFG_INT_KEYS = frozenset(
         "epochs",
         "patience",
         "workers",
+        "data_profile",
         "seed",
         "close_mosaic",
         "mask_ratio",
         "max_det",
+        "topk_per_det",
+        "val_bins",
+        "val_period",
+        "ort_intra_threads",
+        "ort_inter_threads",
         "vid_stride",
         "line_width",
         "nbs",
@@ -211,6 +219,7 @@ CFG_BOOL_KEYS = frozenset(
         "deterministic",
         "single_cls",
         "rect",
+        "data_autotune",
         "cos_lr",
         "overlap_mask",
         "val",
@@ -223,11 +232,18 @@ CFG_BOOL_KEYS = frozenset(
         "save_conf",
         "save_crop",
         "save_frames",
+        "stream_process",
         "show_labels",
         "show_conf",
         "visualize",
         "augment",
         "agnostic_nms",
+        "ort_parallel",
+        "ort_cache",
+        "ort_mem_arena",
+        "ort_mem_pattern",
+        "ort_spin",
+        "ov_async",
         "retina_masks",
         "show_boxes",
         "keras",
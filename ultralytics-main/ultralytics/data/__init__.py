@@ -6,6 +6,7 @@ from .dataset import (
     ClassificationDataset,
     GroundingDataset,
     SemanticDataset,
+    StratifiedSubset,
     YOLOConcatDataset,
     YOLODataset,
     YOLOMultiModalDataset,
@@ -16,6 +17,7 @@ __all__ = (
     "ClassificationDataset",
     "GroundingDataset",
     "SemanticDataset",
+    "StratifiedSubset",
     "YOLOConcatDataset",
     "YOLODataset",
     "YOLOMultiModalDataset",
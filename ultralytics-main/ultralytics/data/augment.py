@@ -13,12 +13,12 @@ import torch
 from PIL import Image
 from torch.nn import functional as F
 
-from ultralytics.data.utils import polygons2masks, polygons2masks_overlap
+from ultralytics.data.utils import STAGE_TIMER, polygons2masks, polygons2masks_overlap
 from ultralytics.utils import LOGGER, IterableSimpleNamespace, colorstr
 from ultralytics.utils.checks import check_version
 from ultralytics.utils.instance import Instances
 from ultralytics.utils.metrics import bbox_ioa
-from ultralytics.utils.ops import segment2box, xywh2xyxy, xyxyxyxy2xywhr
+from ultralytics.utils.ops import xywh2xyxy, xyxyxyxy2xywhr
 from ultralytics.utils.torch_utils import TORCHVISION_0_10, TORCHVISION_0_11, TORCHVISION_0_13
 
 DEFAULT_MEAN = (0.0, 0.0, 0.0)
@@ -184,7 +184,11 @@ class Compose:
             >>> transformed_data = compose(input_data)
         """
         for t in self.transforms:
-            data = t(data)
+            if isinstance(t, Compose):
+                data = t(data)
+            else:
+                with STAGE_TIMER(type(t).__name__):  # per-transform loading profile, no-op unless enabled
+                    data = t(data)
         return data
 
     def append(self, transform):
@@ -467,10 +471,13 @@ class Mosaic(BaseMixTransform):
         p (float): Probability of applying the mosaic augmentation. Must be in the range 0-1.
         n (int): The grid size, either 4 (for 2x2) or 9 (for 3x3).
         border (tuple[int, int]): Border size for width and height.
+        fuse (bool): Whether the output is consumed directly by a RandomPerspective, which then warps the 2x2 tiles
+            straight into its output image and the mosaic canvas is reused between calls.
 
     Methods:
         get_indexes: Return a list of random indexes from the dataset.
         _mix_transform: Apply mixup transformation to the input image and labels.
+        _canvas: Return a mosaic canvas filled with the padding value.
         _mosaic3: Create a 1x3 image mosaic.
         _mosaic4: Create a 2x2 image mosaic.
         _mosaic9: Create a 3x3 image mosaic.
@@ -484,7 +491,7 @@ class Mosaic(BaseMixTransform):
         >>> augmented_labels = mosaic_aug(original_labels)
     """
 
-    def __init__(self, dataset, imgsz: int = 640, p: float = 1.0, n: int = 4):
+    def __init__(self, dataset, imgsz: int = 640, p: float = 1.0, n: int = 4, fuse: bool = False):
         """Initialize the Mosaic augmentation object.
 
         This class performs mosaic augmentation by combining multiple (4 or 9) images into a single mosaic image. The
@@ -495,6 +502,8 @@ class Mosaic(BaseMixTransform):
             imgsz (int): Image size (height and width) after mosaic pipeline of a single image.
             p (float): Probability of applying the mosaic augmentation. Must be in the range 0-1.
             n (int): The grid size, either 4 (for 2x2) or 9 (for 3x3).
+            fuse (bool): Leave the 2x2 tile placement to a directly following RandomPerspective and reuse the canvas
+                between calls. The output 'img' is then None or a view of the reused canvas.
         """
         assert 0 <= p <= 1.0, f"The probability should be in range [0, 1], but got {p}."
         assert n in {4, 9}, "grid must be equal to 4 or 9."
@@ -502,7 +511,9 @@ class Mosaic(BaseMixTransform):
         self.imgsz = imgsz
         self.border = (-imgsz // 2, -imgsz // 2)  # width, height
         self.n = n
+        self.fuse = fuse
         self.buffer_enabled = self.dataset.cache != "ram"
+        self._buffer = None  # reused canvas, per dataloader worker as each worker holds its own transforms
 
     def get_indexes(self):
         """Return a list of random indexes from the dataset for mosaic augmentation.
@@ -524,6 +535,25 @@ class Mosaic(BaseMixTransform):
         else:  # select any images
             return [random.randint(0, len(self.dataset) - 1) for _ in range(self.n - 1)]
 
+    def _canvas(self, shape: tuple[int, int, int]) -> np.ndarray:
+        """Return a mosaic canvas of the given shape filled with the padding value 114.
+
+        A fused mosaic is warped by the following RandomPerspective before the next call, so its canvas is allocated
+        once and refilled; otherwise a new canvas is returned as the caller may keep the image.
+
+        Args:
+            shape (tuple[int, int, int]): Canvas shape (H, W, C).
+
+        Returns:
+            (np.ndarray): The uint8 canvas.
+        """
+        if not self.fuse:
+            return np.full(shape, 114, dtype=np.uint8)
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.empty(shape, dtype=np.uint8)
+        self._buffer.fill(114)
+        return self._buffer
+
     def _mix_transform(self, labels: dict[str, Any]) -> dict[str, Any]:
         """Apply mosaic augmentation to the input image and labels.
 
@@ -588,7 +618,7 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img3
             if i == 0:  # center
-                img3 = np.full((s * 3, s * 3, img.shape[2]), 114, dtype=np.uint8)  # base image with 3 tiles
+                img3 = self._canvas((s * 3, s * 3, img.shape[2]))  # base image with 3 tiles
                 h0, w0 = h, w
                 c = s, s, s + w, s + h  # xmin, ymin, xmax, ymax (base) coordinates
             elif i == 1:  # right
@@ -633,8 +663,14 @@ class Mosaic(BaseMixTransform):
             ... }
             >>> result = mosaic._mosaic4(labels)
             >>> assert result["img"].shape == (1280, 1280, 3)
+
+        Notes:
+            With `fuse=True` no canvas is drawn: 'img' is None and 'mosaic_tiles' lists (image crop, x, y) placements
+            on the (imgsz * 2, imgsz * 2) canvas for RandomPerspective to warp. Crops extend one pixel into their
+            neighbours, still within the canvas, so bilinear sampling across the seams is covered by a tile.
         """
         mosaic_labels = []
+        tiles = []
         s = self.imgsz
         yc, xc = (int(random.uniform(-x, 2 * s + x)) for x in self.border)  # mosaic center x, y
         for i in range(4):
@@ -645,7 +681,7 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img4
             if i == 0:  # top left
-                img4 = np.full((s * 2, s * 2, img.shape[2]), 114, dtype=np.uint8)  # base image with 4 tiles
+                img4 = None if self.fuse else np.full((s * 2, s * 2, img.shape[2]), 114, dtype=np.uint8)
                 x1a, y1a, x2a, y2a = max(xc - w, 0), max(yc - h, 0), xc, yc  # xmin, ymin, xmax, ymax (large image)
                 x1b, y1b, x2b, y2b = w - (x2a - x1a), h - (y2a - y1a), w, h  # xmin, ymin, xmax, ymax (small image)
             elif i == 1:  # top right
@@ -658,14 +694,21 @@ class Mosaic(BaseMixTransform):
                 x1a, y1a, x2a, y2a = xc, yc, min(xc + w, s * 2), min(s * 2, yc + h)
                 x1b, y1b, x2b, y2b = 0, 0, min(w, x2a - x1a), min(y2a - y1a, h)
 
-            img4[y1a:y2a, x1a:x2a] = img[y1b:y2b, x1b:x2b]  # img4[ymin:ymax, xmin:xmax]
             padw = x1a - x1b
             padh = y1a - y1b
+            if self.fuse:  # crop with a 1 pixel margin where both the image and the canvas allow it
+                x1c, y1c = max(x1b - 1, 0, -padw), max(y1b - 1, 0, -padh)
+                x2c, y2c = min(x2b + 1, w, s * 2 - padw), min(y2b + 1, h, s * 2 - padh)
+                tiles.append((img[y1c:y2c, x1c:x2c], x1c + padw, y1c + padh))
+            else:
+                img4[y1a:y2a, x1a:x2a] = img[y1b:y2b, x1b:x2b]  # img4[ymin:ymax, xmin:xmax]
 
             labels_patch = self._update_labels(labels_patch, padw, padh)
             mosaic_labels.append(labels_patch)
         final_labels = self._cat_labels(mosaic_labels)
         final_labels["img"] = img4
+        if self.fuse:
+            final_labels["mosaic_tiles"] = tiles
         return final_labels
 
     def _mosaic9(self, labels: dict[str, Any]) -> dict[str, Any]:
@@ -705,7 +748,7 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img9
             if i == 0:  # center
-                img9 = np.full((s * 3, s * 3, img.shape[2]), 114, dtype=np.uint8)  # base image with 4 tiles
+                img9 = self._canvas((s * 3, s * 3, img.shape[2]))  # base image with 4 tiles
                 h0, w0 = h, w
                 c = s, s, s + w, s + h  # xmin, ymin, xmax, ymax (base) coordinates
             elif i == 1:  # top
@@ -1006,7 +1049,9 @@ class RandomPerspective:
         pre_transform (Callable | None): Optional transform to apply before the random perspective.
 
     Methods:
+        get_matrix: Sample a random 3x3 transformation matrix.
         affine_transform: Apply affine transformations to the input image.
+        warp_tiles: Warp mosaic tiles directly into the output image.
         apply_bboxes: Transform bounding boxes using the affine matrix.
         apply_segments: Transform segments and generate new bounding boxes.
         apply_keypoints: Transform keypoints using the affine matrix.
@@ -1055,33 +1100,30 @@ class RandomPerspective:
         self.border = border  # mosaic border
         self.pre_transform = pre_transform
 
-    def affine_transform(self, img: np.ndarray, border: tuple[int, int]) -> tuple[np.ndarray, np.ndarray, float]:
-        """Apply a sequence of affine transformations centered around the image center.
+    def get_matrix(self, w: int, h: int) -> tuple[np.ndarray, float]:
+        """Sample a random transformation matrix centered around the center of a w x h image.
 
-        This function performs a series of geometric transformations on the input image, including translation,
-        perspective change, rotation, scaling, and shearing. The transformations are applied in a specific order to
-        maintain consistency.
+        The matrix combines translation, perspective change, rotation, scaling, and shearing, applied in a specific
+        order to maintain consistency, and maps input pixels to pixels of an output image of size `self.size`.
 
         Args:
-            img (np.ndarray): Input image to be transformed.
-            border (tuple[int, int]): Border dimensions for the transformed image.
+            w (int): Input image width.
+            h (int): Input image height.
 
         Returns:
-            img (np.ndarray): Transformed image.
             M (np.ndarray): 3x3 transformation matrix.
             s (float): Scale factor applied during the transformation.
 
         Examples:
-            >>> import numpy as np
-            >>> img = np.random.rand(100, 100, 3)
-            >>> border = (10, 10)
-            >>> transformed_img, matrix, scale = affine_transform(img, border)
+            >>> transform = RandomPerspective(degrees=10)
+            >>> transform.size = (640, 640)
+            >>> M, scale = transform.get_matrix(1280, 1280)
         """
         # Center
         C = np.eye(3, dtype=np.float32)
 
-        C[0, 2] = -img.shape[1] / 2  # x translation (pixels)
-        C[1, 2] = -img.shape[0] / 2  # y translation (pixels)
+        C[0, 2] = -w / 2  # x translation (pixels)
+        C[1, 2] = -h / 2  # y translation (pixels)
 
         # Perspective
         P = np.eye(3, dtype=np.float32)
@@ -1107,7 +1149,31 @@ class RandomPerspective:
         T[1, 2] = random.uniform(0.5 - self.translate, 0.5 + self.translate) * self.size[1]  # y translation (pixels)
 
         # Combined rotation matrix
-        M = T @ S @ R @ P @ C  # order of operations (right to left) is IMPORTANT
+        return T @ S @ R @ P @ C, s  # order of operations (right to left) is IMPORTANT
+
+    def affine_transform(self, img: np.ndarray, border: tuple[int, int]) -> tuple[np.ndarray, np.ndarray, float]:
+        """Apply a sequence of affine transformations centered around the image center.
+
+        This function performs a series of geometric transformations on the input image, including translation,
+        perspective change, rotation, scaling, and shearing. The transformations are applied in a specific order to
+        maintain consistency.
+
+        Args:
+            img (np.ndarray): Input image to be transformed.
+            border (tuple[int, int]): Border dimensions for the transformed image.
+
+        Returns:
+            img (np.ndarray): Transformed image.
+            M (np.ndarray): 3x3 transformation matrix.
+            s (float): Scale factor applied during the transformation.
+
+        Examples:
+            >>> import numpy as np
+            >>> img = np.random.rand(100, 100, 3)
+            >>> border = (10, 10)
+            >>> transformed_img, matrix, scale = affine_transform(img, border)
+        """
+        M, s = self.get_matrix(img.shape[1], img.shape[0])
         # Affine image
         if (border[0] != 0) or (border[1] != 0) or (M != np.eye(3)).any():  # image changed
             if self.perspective:
@@ -1118,6 +1184,52 @@ class RandomPerspective:
                 img = img[..., None]
         return img, M, s
 
+    def warp_tiles(self, tiles: list, shape: tuple[int, int]) -> tuple[np.ndarray, np.ndarray, float]:
+        """Warp mosaic tiles directly into the output image, without drawing the mosaic canvas first.
+
+        Each tile is warped once with the transformation matrix shifted to its canvas position. Output pixels outside a
+        tile are left untouched, so the result equals warping the 114-filled canvas up to interpolation at tile edges.
+
+        Args:
+            tiles (list[tuple[np.ndarray, int, int]]): Image crops with their (x, y) position on the canvas, see
+                `Mosaic._mosaic4`.
+            shape (tuple[int, int]): Canvas shape (H, W) the tile positions refer to.
+
+        Returns:
+            img (np.ndarray): Transformed image of size `self.size`.
+            M (np.ndarray): 3x3 transformation matrix from canvas to output pixels.
+            s (float): Scale factor applied during the transformation.
+
+        Examples:
+            >>> transform = RandomPerspective(degrees=10)
+            >>> transform.size = (640, 640)
+            >>> tiles = [(np.zeros((640, 640, 3), np.uint8), 0, 0), (np.zeros((640, 640, 3), np.uint8), 640, 640)]
+            >>> img, M, scale = transform.warp_tiles(tiles, (1280, 1280))
+        """
+        M, s = self.get_matrix(shape[1], shape[0])
+        w, h = self.size
+        img = np.full((h, w, tiles[0][0].shape[2]), 114, dtype=tiles[0][0].dtype)
+        T = np.eye(3, dtype=M.dtype)
+        for tile, x, y in tiles:
+            th, tw = tile.shape[:2]
+            T[0, 2], T[1, 2] = x, y
+            A = M @ T  # tile to output pixels
+            xy = A @ np.array([[0, tw, 0, tw], [0, 0, th, th], [1, 1, 1, 1]], dtype=A.dtype)  # corners
+            xy = xy[:2] / xy[2]
+            # Only warp the output region covered by the tile, each output pixel is sampled about once overall
+            x1, y1 = np.floor(xy.min(1)).clip(0, (w, h)).astype(int)
+            x2, y2 = np.ceil(xy.max(1) + 1).clip(0, (w, h)).astype(int)
+            if x2 <= x1 or y2 <= y1 or not tile.size:
+                continue
+            T[0, 2], T[1, 2] = -x1, -y1
+            A = T @ A
+            kwargs = dict(dsize=(x2 - x1, y2 - y1), dst=img[y1:y2, x1:x2], borderMode=cv2.BORDER_TRANSPARENT)
+            if self.perspective:
+                cv2.warpPerspective(tile, A, **kwargs)
+            else:  # affine
+                cv2.warpAffine(tile, A[:2], **kwargs)
+        return img, M, s
+
     def apply_bboxes(self, bboxes: np.ndarray, M: np.ndarray) -> np.ndarray:
         """Apply affine transformation to bounding boxes.
 
@@ -1181,11 +1293,45 @@ class RandomPerspective:
         xy = xy @ M.T  # transform
         xy = xy[:, :2] / xy[:, 2:3]
         segments = xy.reshape(n, -1, 2)
-        bboxes = np.stack([segment2box(xy, self.size[0], self.size[1]) for xy in segments], 0)
+        bboxes = self.segments2boxes(segments, *self.size)
         segments[..., 0] = segments[..., 0].clip(bboxes[:, 0:1], bboxes[:, 2:3])
         segments[..., 1] = segments[..., 1].clip(bboxes[:, 1:2], bboxes[:, 3:4])
         return bboxes, segments
 
+    @staticmethod
+    def segments2boxes(segments: np.ndarray, width: int, height: int) -> np.ndarray:
+        """Convert segments to boxes at once, equivalent to `segment2box` applied to each segment.
+
+        Args:
+            segments (np.ndarray): Segments with shape (N, M, 2) in absolute coordinates.
+            width (int): Width of the image in pixels.
+            height (int): Height of the image in pixels.
+
+        Returns:
+            (np.ndarray): Boxes with shape (N, 4) in xyxy format, zeros for segments without points inside the image.
+
+        Examples:
+            >>> segments = np.random.rand(10, 500, 2) * 640
+            >>> boxes = RandomPerspective.segments2boxes(segments, 640, 640)
+        """
+        x, y = segments[..., 0], segments[..., 1]
+        # Clip coordinates of segments with 3 out of 4 sides outside the image
+        clip = (x.min(1) < 0).astype(int) + (y.min(1) < 0) + (x.max(1) > width) + (y.max(1) > height) >= 3
+        x = np.where(clip[:, None], x.clip(0, width), x)
+        y = np.where(clip[:, None], y.clip(0, height), y)
+        inside = (x >= 0) & (y >= 0) & (x <= width) & (y <= height)
+        boxes = np.stack(
+            (
+                np.where(inside, x, np.inf).min(1),
+                np.where(inside, y, np.inf).min(1),
+                np.where(inside, x, -np.inf).max(1),
+                np.where(inside, y, -np.inf).max(1),
+            ),
+            1,
+        )
+        boxes[~(inside & (x != 0)).any(1)] = 0  # segment2box returns zeros unless any inside x is non-zero
+        return boxes.astype(segments.dtype)
+
     def apply_keypoints(self, keypoints: np.ndarray, M: np.ndarray) -> np.ndarray:
         """Apply affine transformation to keypoints.
 
@@ -1260,17 +1406,19 @@ class RandomPerspective:
         labels.pop("ratio_pad", None)  # do not need ratio pad
 
         img = labels["img"]
+        tiles = labels.pop("mosaic_tiles", None)  # from Mosaic(fuse=True), img is None
+        h, w = img.shape[:2] if tiles is None else labels["resized_shape"]
         cls = labels["cls"]
         instances = labels.pop("instances")
         # Make sure the coord formats are right
         instances.convert_bbox(format="xyxy")
-        instances.denormalize(*img.shape[:2][::-1])
+        instances.denormalize(w, h)
 
         border = labels.pop("mosaic_border", self.border)
-        self.size = img.shape[1] + border[1] * 2, img.shape[0] + border[0] * 2  # w, h
+        self.size = w + border[1] * 2, h + border[0] * 2  # w, h
         # M is affine matrix
         # Scale for func:`box_candidates`
-        img, M, scale = self.affine_transform(img, border)
+        img, M, scale = self.affine_transform(img, border) if tiles is None else self.warp_tiles(tiles, (h, w))
 
         bboxes = self.apply_bboxes(instances.bboxes, M)
 
@@ -2153,6 +2301,169 @@ class Format:
         return masks, instances, cls
 
 
+class BatchAugment:
+    """Apply HSV and flip augmentations to collated training batches as tensor operations on the training device.
+
+    This is the batch-level counterpart of RandomHSV and RandomFlip for training nodes where dataloader workers are the
+    bottleneck. Transforms selected with the `batch_augment` hyperparameter are removed from the per-sample pipeline by
+    `v8_transforms` and applied here instead, after the batch is moved to the device and scaled to [0, 1].
+
+    Attributes:
+        names (set[str]): Selected transforms, a subset of {'hsv', 'flip'}.
+        hgain (float): Maximum variation for hue, as a fraction of the hue circle.
+        sgain (float): Maximum variation for saturation.
+        vgain (float): Maximum variation for value.
+        flipud (float): Probability of a vertical flip per image.
+        fliplr (float): Probability of a horizontal flip per image.
+        flip_idx (list[int] | None): Index mapping for flipping keypoints, if applicable.
+        mask_overlap (bool): Whether segmentation masks are overlapped, i.e. one mask per image.
+
+    Methods:
+        parse: Parse the `batch_augment` hyperparameter into transform names.
+        hsv: Apply random HSV jitter to a batch of images.
+        flip: Flip images and labels of a batch along one axis.
+        __call__: Apply the selected transforms to a collated batch.
+
+    Examples:
+        >>> augment = BatchAugment("hsv,flip", hgain=0.015, sgain=0.7, vgain=0.4, fliplr=0.5)
+        >>> batch = {"img": torch.rand(16, 3, 640, 640), "bboxes": torch.rand(4, 4), "batch_idx": torch.zeros(4)}
+        >>> batch = augment(batch)
+    """
+
+    NAMES = frozenset({"hsv", "flip"})
+
+    def __init__(
+        self,
+        names: str | list[str] | bool | None,
+        hgain: float = 0.5,
+        sgain: float = 0.5,
+        vgain: float = 0.5,
+        flipud: float = 0.0,
+        fliplr: float = 0.5,
+        flip_idx: list[int] | None = None,
+        mask_overlap: bool = True,
+    ) -> None:
+        """Initialize the BatchAugment object with the selected transforms and their parameters.
+
+        Args:
+            names (str | list[str] | bool | None): Transforms to apply, see `BatchAugment.parse`.
+            hgain (float): Maximum variation for hue, as in RandomHSV.
+            sgain (float): Maximum variation for saturation, as in RandomHSV.
+            vgain (float): Maximum variation for value, as in RandomHSV.
+            flipud (float): Probability of a vertical flip per image.
+            fliplr (float): Probability of a horizontal flip per image.
+            flip_idx (list[int] | None): Index mapping for flipping keypoints, if any.
+            mask_overlap (bool): Whether segmentation masks are overlapped, i.e. one mask per image.
+        """
+        self.names = self.parse(names)
+        self.hgain = hgain
+        self.sgain = sgain
+        self.vgain = vgain
+        self.flipud = flipud
+        self.fliplr = fliplr
+        self.flip_idx = flip_idx
+        self.mask_overlap = mask_overlap
+
+    @classmethod
+    def parse(cls, names: str | list[str] | bool | None) -> set[str]:
+        """Parse the `batch_augment` hyperparameter into a set of transform names.
+
+        Args:
+            names (str | list[str] | bool | None): Comma-separated string or list of names from {'hsv', 'flip'}, True
+                for all of them, or None/False for none.
+
+        Returns:
+            (set[str]): The selected transform names.
+
+        Raises:
+            ValueError: If a name is not a supported batch transform.
+
+        Examples:
+            >>> BatchAugment.parse("hsv, flip")
+            {'flip', 'hsv'}
+        """
+        if names is True:
+            return set(cls.NAMES)
+        names = {x.strip() for x in (names.split(",") if isinstance(names, str) else names or ())} - {""}
+        if names - cls.NAMES:
+            raise ValueError(f"batch_augment={sorted(names)} must be a subset of {sorted(cls.NAMES)}")
+        return names
+
+    def hsv(self, img: torch.Tensor) -> torch.Tensor:
+        """Apply a random hue, saturation and value jitter per image, like RandomHSV on each image.
+
+        Args:
+            img (torch.Tensor): Float images with shape (B, 3, H, W) and values in [0, 1].
+
+        Returns:
+            (torch.Tensor): Jittered images with the same shape.
+        """
+        r = (torch.rand(len(img), 3, 1, 1, device=img.device) * 2 - 1) * img.new_tensor(
+            [self.hgain, self.sgain, self.vgain]
+        ).view(1, 3, 1, 1)
+        v, vi = img.max(1)
+        d = v - img.min(1)[0]
+        s = torch.where(v > 0, d / v.clamp(min=1e-12), torch.zeros_like(v))
+        red, green, blue = img.unbind(1)
+        dc = d.clamp(min=1e-12)
+        h = torch.where(vi == 1, (blue - red) / dc + 2, (red - green) / dc + 4)
+        h = torch.where(vi == 0, (green - blue) / dc, h)
+        h = torch.where(d > 0, h / 6, torch.zeros_like(h))
+        h = (h + r[:, 0]) % 1  # hue shift on the hue circle
+        s = (s * (1 + r[:, 1])).clamp(0, 1)
+        v = (v * (1 + r[:, 2])).clamp(0, 1)
+        k = (img.new_tensor([5, 3, 1]).view(1, 3, 1, 1) + h[:, None] * 6) % 6  # HSV to RGB
+        return v[:, None] - (v * s)[:, None] * torch.minimum(k, 4 - k).clamp(0, 1)
+
+    def flip(self, batch: dict[str, Any], p: float, dim: int) -> None:
+        """Flip a random subset of images in place along one axis and update their boxes, keypoints and masks.
+
+        Args:
+            batch (dict[str, Any]): Collated batch with normalized 'bboxes' in xywh or xywhr format and 'batch_idx'.
+            p (float): Probability of flipping each image.
+            dim (int): Image dimension to flip, -1 for horizontal or -2 for vertical.
+        """
+        img = batch["img"]
+        f = torch.rand(len(img), device=img.device) < p
+        if not f.any():
+            return
+        batch["img"] = torch.where(f.view(-1, 1, 1, 1), img.flip(dim), img)
+        fi = f[batch["batch_idx"].long()]  # per instance
+        xy = 0 if dim == -1 else 1
+        bboxes = batch["bboxes"]
+        bboxes[fi, xy] = 1 - bboxes[fi, xy]
+        if bboxes.shape[-1] == 5:  # xywhr, the mirrored angle -r is kept in (0, pi/2] as pi/2 - r with w and h swapped
+            h, w = img.shape[2:]
+            wh = bboxes[fi, 2:4].flip(-1) * bboxes.new_tensor([h / w, w / h])  # normalized by w and h respectively
+            bboxes[fi, 2:4] = wh
+            bboxes[fi, 4] = math.pi / 2 - bboxes[fi, 4]
+        if "keypoints" in batch and len(batch["keypoints"]):
+            kpts = batch["keypoints"]
+            kpts[fi, :, xy] = 1 - kpts[fi, :, xy]
+            if self.flip_idx is not None:
+                kpts[fi] = kpts[fi][:, self.flip_idx]
+        if "masks" in batch:
+            masks = batch["masks"]
+            mf = f if self.mask_overlap else fi
+            batch["masks"] = torch.where(mf.view(-1, 1, 1), masks.flip(dim), masks)
+
+    def __call__(self, batch: dict[str, Any]) -> dict[str, Any]:
+        """Apply the selected transforms to a collated batch, in the order of the per-sample pipeline.
+
+        Args:
+            batch (dict[str, Any]): Collated batch with float 'img' in [0, 1] and normalized labels on one device.
+
+        Returns:
+            (dict[str, Any]): The augmented batch.
+        """
+        if "hsv" in self.names and (self.hgain or self.sgain or self.vgain) and batch["img"].shape[1] == 3:
+            batch["img"] = self.hsv(batch["img"])
+        if "flip" in self.names:
+            self.flip(batch, self.flipud, dim=-2)
+            self.flip(batch, self.fliplr, dim=-1)
+        return batch
+
+
 class LoadVisualPrompt:
     """Create visual prompts from bounding boxes or masks for model input."""
 
@@ -2398,7 +2709,8 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
         >>> hyp.augmentations = augmentations
         >>> transforms = v8_transforms(dataset, imgsz=640, hyp=hyp)
     """
-    mosaic = Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic)
+    fuse = hyp.copy_paste_mode != "flip" or not hyp.copy_paste  # no flip CopyPaste between mosaic and affine
+    mosaic = Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic, fuse=fuse)
     affine = RandomPerspective(
         degrees=hyp.degrees,
         translate=hyp.translate,
@@ -2415,7 +2727,7 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
         pre_transform.append(
             CopyPaste(
                 dataset,
-                pre_transform=Compose([Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic), affine]),
+                pre_transform=Compose([Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic, fuse=True), affine]),
                 p=hyp.copy_paste,
                 mode=hyp.copy_paste_mode,
             )
@@ -2429,17 +2741,21 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
         elif flip_idx and (len(flip_idx) != kpt_shape[0]):
             raise ValueError(f"data.yaml flip_idx={flip_idx} length must be equal to kpt_shape[0]={kpt_shape[0]}")
 
-    return Compose(
+    transforms = Compose(
         [
             pre_transform,
             MixUp(dataset, pre_transform=pre_transform, p=hyp.mixup),
             CutMix(dataset, pre_transform=pre_transform, p=hyp.cutmix),
             Albumentations(p=1.0, transforms=getattr(hyp, "augmentations", None)),
-            RandomHSV(hgain=hyp.hsv_h, sgain=hyp.hsv_s, vgain=hyp.hsv_v),
-            RandomFlip(direction="vertical", p=hyp.flipud, flip_idx=flip_idx),
-            RandomFlip(direction="horizontal", p=hyp.fliplr, flip_idx=flip_idx),
         ]
-    )  # transforms
+    )
+    batch_augment = BatchAugment.parse(getattr(hyp, "batch_augment", None))  # applied by the trainer instead
+    if "hsv" not in batch_augment:
+        transforms.append(RandomHSV(hgain=hyp.hsv_h, sgain=hyp.hsv_s, vgain=hyp.hsv_v))
+    if "flip" not in batch_augment:
+        transforms.append(RandomFlip(direction="vertical", p=hyp.flipud, flip_idx=flip_idx))
+        transforms.append(RandomFlip(direction="horizontal", p=hyp.fliplr, flip_idx=flip_idx))
+    return transforms
 
 
 # Classification augmentations -----------------------------------------------------------------------------------------
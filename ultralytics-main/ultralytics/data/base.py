@@ -15,7 +15,8 @@ import cv2
 import numpy as np
 from torch.utils.data import Dataset
 
-from ultralytics.data.utils import FORMATS_HELP_MSG, HELP_URL, IMG_FORMATS, check_file_speeds
+from ultralytics.data.cache import ImageCache, LabelStore
+from ultralytics.data.utils import FORMATS_HELP_MSG, HELP_URL, IMG_FORMATS, STAGE_TIMER, check_file_speeds
 from ultralytics.utils import DEFAULT_CFG, LOCAL_RANK, LOGGER, NUM_THREADS, TQDM
 from ultralytics.utils.patches import imread
 
@@ -36,7 +37,7 @@ class BaseDataset(Dataset):
         channels (int): Number of channels in the images (1 for grayscale, 3 for RGB).
         cv2_flag (int): OpenCV flag for reading images.
         im_files (list[str]): List of image file paths.
-        labels (list[dict]): List of label data dictionaries.
+        labels (list[dict] | LabelStore): Label data dictionaries, or a columnar store indexable as them.
         ni (int): Number of images in the dataset.
         rect (bool): Whether to use rectangular training.
         batch_size (int): Size of batches.
@@ -47,7 +48,7 @@ class BaseDataset(Dataset):
         ims (list): List of loaded images.
         im_hw0 (list): List of original image dimensions (h, w).
         im_hw (list): List of resized image dimensions (h, w).
-        npy_files (list[Path]): List of numpy file paths.
+        im_cache (ImageCache | None): Memory-mapped cache of resized images when caching to disk.
         cache (str): Cache images to RAM or disk during training.
         transforms (callable): Image transformation function.
         batch_shapes (np.ndarray): Batch shapes for rectangular training.
@@ -58,7 +59,7 @@ class BaseDataset(Dataset):
         update_labels: Update labels to include only specified classes.
         load_image: Load an image from the dataset.
         cache_images: Cache images to memory or disk.
-        cache_images_to_disk: Save an image as an *.npy file for faster loading.
+        cache_images_to_disk: Write all resized images to a memory-mapped disk cache.
         check_cache_disk: Check image caching requirements vs available disk space.
         check_cache_ram: Check image caching requirements vs available memory.
         set_rectangle: Set the shape of bounding boxes as rectangles.
@@ -130,7 +131,7 @@ class BaseDataset(Dataset):
 
         # Cache images (options are cache = True, False, None, "ram", "disk")
         self.ims, self.im_hw0, self.im_hw = [None] * self.ni, [None] * self.ni, [None] * self.ni
-        self.npy_files = [Path(f).with_suffix(".npy") for f in self.im_files]
+        self.im_cache = None
         self.cache = cache.lower() if isinstance(cache, str) else "ram" if cache is True else None
         if self.cache == "ram" and self.check_cache_ram():
             if hyp.deterministic:
@@ -139,8 +140,16 @@ class BaseDataset(Dataset):
                     "Consider cache='disk' as a deterministic alternative if your disk space allows."
                 )
             self.cache_images()
-        elif self.cache == "disk" and self.check_cache_disk():
-            self.cache_images()
+        elif self.cache == "disk":
+            parent = Path(self.im_files[0]).parent  # i.e. images/train -> images/train.640.imcache
+            self.im_cache = ImageCache(
+                parent.parent / f"{parent.name}.{self.imgsz}.imcache", self.im_files, f"{self.imgsz}-{channels}"
+            )
+            if not self.im_cache.load():  # built once, then shared by all later runs, workers and ranks
+                if self.check_cache_disk():
+                    self.cache_images()
+                else:
+                    self.im_cache = None
 
         # Transforms
         self.transforms = self.build_transforms(hyp=hyp)
@@ -188,6 +197,8 @@ class BaseDataset(Dataset):
         Args:
             include_class (list[int], optional): List of classes to include. If None, all classes are included.
         """
+        if isinstance(self.labels, LabelStore):
+            return self.labels.filter(include_class, self.single_cls)
         include_class_array = np.array(include_class).reshape(1, -1)
         for i in range(len(self.labels)):
             if include_class is not None:
@@ -220,28 +231,29 @@ class BaseDataset(Dataset):
         Raises:
             FileNotFoundError: If the image file is not found.
         """
-        im, f, fn = self.ims[i], self.im_files[i], self.npy_files[i]
+        im, f = self.ims[i], self.im_files[i]
         if im is None:  # not cached in RAM
-            if fn.exists():  # load npy
-                try:
-                    im = np.load(fn)
-                except Exception as e:
-                    LOGGER.warning(f"{self.prefix}Removing corrupt *.npy image file {fn} due to: {e}")
-                    Path(fn).unlink(missing_ok=True)
+            with STAGE_TIMER("imread"):
+                if self.im_cache is not None and self.im_cache.index is not None:  # already resized on disk
+                    im, (h0, w0) = self.im_cache[i]
+                    im = im.copy()  # transforms may write in place, the memory map is read-only
+                else:  # read image
                     im = imread(f, flags=self.cv2_flag)  # BGR
-            else:  # read image
-                im = imread(f, flags=self.cv2_flag)  # BGR
-            if im is None:
-                raise FileNotFoundError(f"Image Not Found {f}")
-
-            h0, w0 = im.shape[:2]  # orig hw
-            if rect_mode:  # resize long side to imgsz while maintaining aspect ratio
-                r = self.imgsz / max(h0, w0)  # ratio
-                if r != 1:  # if sizes are not equal
-                    w, h = (min(math.ceil(w0 * r), self.imgsz), min(math.ceil(h0 * r), self.imgsz))
-                    im = cv2.resize(im, (w, h), interpolation=cv2.INTER_LINEAR)
-            elif not (h0 == w0 == self.imgsz):  # resize by stretching image to square imgsz
-                im = cv2.resize(im, (self.imgsz, self.imgsz), interpolation=cv2.INTER_LINEAR)
+                    if im is None:
+                        raise FileNotFoundError(f"Image Not Found {f}")
+                    h0, w0 = im.shape[:2]  # orig hw
+
+            h1, w1 = im.shape[:2]
+            with STAGE_TIMER("resize"):
+                if rect_mode:  # resize long side to imgsz while maintaining aspect ratio
+                    r = self.imgsz / max(h0, w0)  # ratio
+                    w, h = (w0, h0)
+                    if r != 1:
+                        w, h = min(math.ceil(w0 * r), self.imgsz), min(math.ceil(h0 * r), self.imgsz)
+                    if (h1, w1) != (h, w):  # if sizes are not equal
+                        im = cv2.resize(im, (w, h), interpolation=cv2.INTER_LINEAR)
+                elif not (h1 == w1 == self.imgsz):  # resize by stretching image to square imgsz
+                    im = cv2.resize(im, (self.imgsz, self.imgsz), interpolation=cv2.INTER_LINEAR)
             if im.ndim == 2:
                 im = im[..., None]
 
@@ -260,25 +272,36 @@ class BaseDataset(Dataset):
 
     def cache_images(self) -> None:
         """Cache images to memory or disk for faster training."""
+        if self.cache == "disk":
+            return self.cache_images_to_disk()
         b, gb = 0, 1 << 30  # bytes of cached images, bytes per gigabytes
-        fcn, storage = (self.cache_images_to_disk, "Disk") if self.cache == "disk" else (self.load_image, "RAM")
         with ThreadPool(NUM_THREADS) as pool:
-            results = pool.imap(fcn, range(self.ni))
+            results = pool.imap(self.load_image, range(self.ni))
             pbar = TQDM(enumerate(results), total=self.ni, disable=LOCAL_RANK > 0)
             for i, x in pbar:
-                if self.cache == "disk":
-                    b += self.npy_files[i].stat().st_size
-                else:  # 'ram'
-                    self.ims[i], self.im_hw0[i], self.im_hw[i] = x  # im, hw_orig, hw_resized = load_image(self, i)
-                    b += self.ims[i].nbytes
-                pbar.desc = f"{self.prefix}Caching images ({b / gb:.1f}GB {storage})"
+                self.ims[i], self.im_hw0[i], self.im_hw[i] = x  # im, hw_orig, hw_resized = load_image(self, i)
+                b += self.ims[i].nbytes
+                pbar.desc = f"{self.prefix}Caching images ({b / gb:.1f}GB RAM)"
             pbar.close()
 
-    def cache_images_to_disk(self, i: int) -> None:
-        """Save an image as an *.npy file for faster loading."""
-        f = self.npy_files[i]
-        if not f.exists():
-            np.save(f.as_posix(), imread(self.im_files[i]), allow_pickle=False)
+    def cache_images_to_disk(self) -> None:
+        """Write all images resized to the rect_mode long side into a single memory-mapped disk cache."""
+        b, gb = 0, 1 << 30  # bytes of cached images, bytes per gigabytes
+
+        def images():
+            """Yield resized images and their original shapes in dataset order."""
+            nonlocal b
+            with ThreadPool(NUM_THREADS) as pool:
+                results = pool.imap(lambda i: self.load_image(i, rect_mode=True), range(self.ni))
+                pbar = TQDM(results, total=self.ni, disable=LOCAL_RANK > 0)
+                for im, hw0, _ in pbar:
+                    b += im.nbytes
+                    pbar.desc = f"{self.prefix}Caching images ({b / gb:.1f}GB Disk)"
+                    yield im, hw0
+                pbar.close()
+
+        if not self.im_cache.build(images(), prefix=self.prefix):
+            self.im_cache, self.cache = None, None
 
     def check_cache_disk(self, safety_margin: float = 0.5) -> bool:
         """Check if there's enough disk space for caching images.
@@ -293,18 +316,18 @@ class BaseDataset(Dataset):
 
         b, gb = 0, 1 << 30  # bytes of cached images, bytes per gigabytes
         n = min(self.ni, 30)  # extrapolate from 30 random images
+        if not os.access(self.im_cache.path.parent, os.W_OK):
+            self.cache = None
+            LOGGER.warning(f"{self.prefix}Skipping caching images to disk, directory not writable")
+            return False
         for _ in range(n):
-            im_file = random.choice(self.im_files)
-            im = imread(im_file)
+            im = imread(random.choice(self.im_files), flags=self.cv2_flag)  # sample image
             if im is None:
                 continue
-            b += im.nbytes
-            if not os.access(Path(im_file).parent, os.W_OK):
-                self.cache = None
-                LOGGER.warning(f"{self.prefix}Skipping caching images to disk, directory not writable")
-                return False
+            ratio = self.imgsz / max(im.shape[0], im.shape[1])  # images are cached resized to imgsz
+            b += im.nbytes * ratio**2
         disk_required = b * self.ni / n * (1 + safety_margin)  # bytes required to cache dataset to disk
-        total, _used, free = shutil.disk_usage(Path(self.im_files[0]).parent)
+        total, _used, free = shutil.disk_usage(self.im_cache.path.parent)
         if disk_required > free:
             self.cache = None
             LOGGER.warning(
@@ -349,11 +372,12 @@ class BaseDataset(Dataset):
         bi = np.floor(np.arange(self.ni) / self.batch_size).astype(int)  # batch index
         nb = bi[-1] + 1  # number of batches
 
-        s = np.array([x.pop("shape") for x in self.labels])  # hw
+        store = isinstance(self.labels, LabelStore)
+        s = self.labels.shapes if store else np.array([x.pop("shape") for x in self.labels])  # hw
         ar = s[:, 0] / s[:, 1]  # aspect ratio
         irect = ar.argsort()
         self.im_files = [self.im_files[i] for i in irect]
-        self.labels = [self.labels[i] for i in irect]
+        self.labels = self.labels[irect] if store else [self.labels[i] for i in irect]
         ar = ar[irect]
 
         # Set training image shapes
@@ -382,7 +406,9 @@ class BaseDataset(Dataset):
         Returns:
             (dict[str, Any]): Label dictionary with image and metadata.
         """
-        label = deepcopy(self.labels[index])  # requires deepcopy() https://github.com/ultralytics/ultralytics/pull/1948
+        label = self.labels[index]  # LabelStore returns a new dict owning copies of its arrays
+        if not isinstance(self.labels, LabelStore):
+            label = deepcopy(label)  # requires deepcopy() https://github.com/ultralytics/ultralytics/pull/1948
         label.pop("shape", None)  # shape is for rect, remove it
         label["img"], label["ori_shape"], label["resized_shape"] = self.load_image(index)
         label["ratio_pad"] = (
@@ -6,6 +6,7 @@ import math
 import os
 import random
 from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlsplit
@@ -28,7 +29,7 @@ from ultralytics.data.loaders import (
     SourceTypes,
     autocast_list,
 )
-from ultralytics.data.utils import IMG_FORMATS, VID_FORMATS
+from ultralytics.data.utils import IMG_FORMATS, STAGE_TIMER, VID_FORMATS, profile_collate
 from ultralytics.utils import RANK, colorstr
 from ultralytics.utils.checks import check_file
 from ultralytics.utils.torch_utils import TORCH_2_0
@@ -215,10 +216,11 @@ class ContiguousDistributedSampler(torch.utils.data.Sampler):
 
 
 def seed_worker(worker_id: int) -> None:
-    """Set dataloader worker seed for reproducibility across worker processes."""
+    """Set dataloader worker seed for reproducibility across worker processes and enable profiling if requested."""
     worker_seed = torch.initial_seed() % 2**32
     np.random.seed(worker_seed)
     random.seed(worker_seed)
+    STAGE_TIMER.enabled = getattr(torch.utils.data.get_worker_info().dataset, "profile", False)
 
 
 def build_yolo_dataset(
@@ -291,6 +293,7 @@ def build_dataloader(
     rank: int = -1,
     drop_last: bool = False,
     pin_memory: bool = True,
+    prefetch_factor: int = 4,
 ) -> InfiniteDataLoader:
     """Create and return an InfiniteDataLoader or DataLoader for training or validation.
 
@@ -302,6 +305,7 @@ def build_dataloader(
         rank (int, optional): Process rank in distributed training. -1 for single-GPU training.
         drop_last (bool, optional): Whether to drop the last incomplete batch.
         pin_memory (bool, optional): Whether to use pinned memory for dataloader.
+        prefetch_factor (int, optional): Number of batches loaded in advance by each worker.
 
     Returns:
         (InfiniteDataLoader): A dataloader that can be used for training or validation.
@@ -329,9 +333,9 @@ def build_dataloader(
         shuffle=shuffle and sampler is None,
         num_workers=nw,
         sampler=sampler,
-        prefetch_factor=4 if nw > 0 else None,  # increase over default 2
+        prefetch_factor=prefetch_factor if nw > 0 else None,  # default 4, increase over torch default 2
         pin_memory=nd > 0 and pin_memory,
-        collate_fn=getattr(dataset, "collate_fn", None),
+        collate_fn=partial(profile_collate, getattr(dataset, "collate_fn", None) or dataloader.default_collate),
         worker_init_fn=seed_worker,
         generator=generator,
         drop_last=drop_last and len(dataset) % batch != 0,
@@ -394,6 +398,8 @@ def load_inference_source(
     vid_stride: int = 1,
     buffer: bool = False,
     channels: int = 3,
+    vid_backend: str = "cv2",
+    stream_process: bool = False,
 ):
     """Load an inference source for object detection and apply necessary transformations.
 
@@ -403,6 +409,8 @@ def load_inference_source(
         vid_stride (int, optional): The frame interval for video sources.
         buffer (bool, optional): Whether stream frames will be buffered.
         channels (int, optional): The number of input channels for the model.
+        vid_backend (str, optional): Video file decoding backend, 'cv2' or 'pyav'.
+        stream_process (bool, optional): Decode each stream in a separate process instead of a thread.
 
     Returns:
         (Dataset): A dataset object for the specified input source with attached source_type attribute.
@@ -423,13 +431,17 @@ def load_inference_source(
     elif in_memory:
         dataset = source
     elif stream:
-        dataset = LoadStreams(source, vid_stride=vid_stride, buffer=buffer, channels=channels)
+        dataset = LoadStreams(
+            source, vid_stride=vid_stride, buffer=buffer, channels=channels, process=stream_process
+        )
     elif screenshot:
         dataset = LoadScreenshots(source, channels=channels)
     elif from_img:
         dataset = LoadPilAndNumpy(source, channels=channels)
     else:
-        dataset = LoadImagesAndVideos(source, batch=batch, vid_stride=vid_stride, channels=channels)
+        dataset = LoadImagesAndVideos(
+            source, batch=batch, vid_stride=vid_stride, channels=channels, vid_backend=vid_backend
+        )
 
     # Attach source types to the dataset
     setattr(dataset, "source_type", source_type)
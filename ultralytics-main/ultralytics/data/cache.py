@@ -0,0 +1,452 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from ultralytics.utils import LOGGER, is_dir_writeable
+
+IMAGE_CACHE_VERSION = "1.0.0"
+SHARD_BYTES = 4 << 30  # maximum size of one image cache shard file
+
+
+def file_stats(files: list[str]) -> np.ndarray:
+    """Return the (size, mtime_ns) of each file as an int64 array of shape (n, 2), -1 for missing files."""
+    stats = np.full((len(files), 2), -1, dtype=np.int64)
+    for i, f in enumerate(files):
+        try:
+            s = os.stat(f)
+        except OSError:
+            continue
+        stats[i] = s.st_size, s.st_mtime_ns
+    return stats
+
+
+def files_hash(files: list[str], key: str = "", stats: np.ndarray | None = None) -> str:
+    """Return a hash of the paths and file statistics of files together with an arbitrary key string.
+
+    Args:
+        files (list[str]): File paths.
+        key (str): Additional settings to include in the hash.
+        stats (np.ndarray, optional): Precomputed statistics to hash, sizes and modification times if None.
+    """
+    stats = file_stats(files) if stats is None else stats
+    h = hashlib.sha256(key.encode())
+    h.update("\n".join(files).encode())
+    h.update(np.ascontiguousarray(stats).tobytes())
+    return h.hexdigest()
+
+
+def _ranges(offsets: np.ndarray, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the concatenated element indices of the given rows of a ragged offsets array and their new offsets."""
+    counts = offsets[rows + 1] - offsets[rows]
+    new = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    return np.repeat(offsets[rows] - new[:-1], counts) + np.arange(new[-1]), new
+
+
+class ImageCache:
+    """Memory-mapped cache of resized dataset images shared by all dataloader workers and DDP ranks.
+
+    Images are stored back to back as raw uint8 pixels in a few large shard files next to an index holding the file
+    names, shard, byte offset, resized shape and original (h, w) of every image. Workers map the shards read-only, so
+    all of them read the same page cache instead of holding private copies, and a cached image is returned without
+    decoding or resizing. The index is keyed by image path, so the same cache serves any ordering or subset of the
+    files it was built from, and it is rebuilt whenever the hash of the files, image size or channels changes.
+
+    Attributes:
+        path (Path): Index file path, shards are stored alongside as '<path>.<k>'.
+        hash (str): Hash of the image files and cache settings the index must match.
+        positions (np.ndarray | None): Position in the index of each dataset image once loaded or built.
+
+    Methods:
+        load: Load and validate the index of an existing cache.
+        build: Write images to new shard files and an index.
+
+    Examples:
+        >>> cache = ImageCache("images/train.640.imcache", im_files, key="640-3")
+        >>> if not cache.load():
+        ...     cache.build(dataset.load_image(i)[:2] for i in range(len(im_files)))
+        >>> im, hw0 = cache[0]
+    """
+
+    def __init__(self, path: str | Path, im_files: list[str], key: str = ""):
+        """Initialize the cache for a list of image files.
+
+        Args:
+            path (str | Path): Index file path.
+            im_files (list[str]): Image files in dataset order.
+            key (str): Settings the cached pixels depend on, such as image size and channels.
+        """
+        self.path = Path(path)
+        self.hash = files_hash(sorted(im_files), f"{IMAGE_CACHE_VERSION}-{key}")
+        self.im_files = im_files
+        self.positions = None
+        self.index = None
+        self._shards = None  # np.memmap per shard, opened lazily in each process
+
+    def load(self) -> bool:
+        """Load the index of an existing cache, returning True if it is valid and covers every dataset image."""
+        try:
+            with np.load(self.path, allow_pickle=False) as x:
+                index = {k: x[k] for k in x.files}
+            assert str(index["hash"]) == self.hash
+            lookup = {f: j for j, f in enumerate(bytes(index["files"]).decode().split("\n"))}
+            self.positions = np.array([lookup[f] for f in self.im_files], dtype=np.int64)
+            assert all(self._shard_path(k).exists() for k in range(int(index["shard"].max(initial=-1)) + 1))
+        except Exception:  # missing, outdated or corrupt cache
+            return False
+        self.index, self._shards = index, None
+        return True
+
+    def build(self, images: Iterable[tuple[np.ndarray, tuple[int, int]]], prefix: str = "") -> bool:
+        """Write images to new shard files and an index, returning True on success.
+
+        Args:
+            images (Iterable[tuple[np.ndarray, tuple[int, int]]]): Resized image and original (h, w) of each dataset
+                image, in dataset order.
+            prefix (str): Prefix for log messages.
+        """
+        if not is_dir_writeable(self.path.parent):
+            LOGGER.warning(f"{prefix}Cache directory {self.path.parent} is not writable, not caching images to disk.")
+            return False
+        n = len(self.im_files)
+        shard, offset, shape, hw0 = (np.zeros(n, np.int32), np.zeros(n, np.int64), np.zeros((n, 3), np.int32), [])
+        k, f = 0, open(self._shard_path(0, ".tmp"), "wb")
+        try:
+            for i, (im, hw) in enumerate(images):
+                im = np.ascontiguousarray(im if im.ndim == 3 else im[..., None], dtype=np.uint8)
+                if f.tell() and f.tell() + im.nbytes > SHARD_BYTES:  # start a new shard
+                    f.close()
+                    k += 1
+                    f = open(self._shard_path(k, ".tmp"), "wb")
+                shard[i], offset[i], shape[i] = k, f.tell(), im.shape
+                f.write(memoryview(im).cast("B"))
+                hw0.append(hw)
+        finally:
+            f.close()
+        for j in range(k + 1):
+            os.replace(self._shard_path(j, ".tmp"), self._shard_path(j))
+        order = np.argsort(self.im_files, kind="stable")  # index in sorted file order, independent of dataset order
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp, "wb") as file:  # index written last so a partial cache is never considered valid
+            np.savez(
+                file,
+                hash=np.array(self.hash),
+                version=np.array(IMAGE_CACHE_VERSION),
+                files=np.frombuffer("\n".join(self.im_files[i] for i in order).encode(), dtype=np.uint8),
+                shard=shard[order],
+                offset=offset[order],
+                shape=shape[order],
+                hw0=np.array(hw0, dtype=np.int32).reshape(-1, 2)[order],
+            )
+        os.replace(tmp, self.path)
+        return self.load()
+
+    def __getitem__(self, i: int) -> tuple[np.ndarray, tuple[int, int]]:
+        """Return a read-only view of the cached image of dataset index i and its original (h, w)."""
+        if self._shards is None:
+            self._shards = {}
+        j = self.positions[i]
+        k = int(self.index["shard"][j])
+        if k not in self._shards:
+            self._shards[k] = np.memmap(self._shard_path(k), dtype=np.uint8, mode="r")
+        shape, start = self.index["shape"][j], int(self.index["offset"][j])
+        im = self._shards[k][start : start + int(shape.prod())].reshape(shape)
+        return im, tuple(int(x) for x in self.index["hw0"][j])
+
+    def __getstate__(self) -> dict:
+        """Drop the shard maps when pickled so each dataloader worker maps the files itself."""
+        return {**self.__dict__, "_shards": None}
+
+    def _shard_path(self, k: int, suffix: str = "") -> Path:
+        """Return the path of shard k."""
+        return self.path.with_name(f"{self.path.name}.{k}{suffix}")
+
+
+class LabelStore:
+    """Columnar store of YOLO dataset labels that behaves as a read-only sequence of per-image label dicts.
+
+    Boxes, classes and keypoints of all images are concatenated into flat arrays sliced by per-image offsets, and
+    segments are kept in one ragged point buffer with per-image and per-segment offsets. Stores saved to disk are loaded
+    as memory maps, so startup does not rebuild any per-image Python objects and dataloader workers share the same
+    pages. Label dicts, including their segments and keypoints, are only materialized when an image is indexed.
+
+    Attributes:
+        columns (dict[str, np.ndarray]): Flat label arrays and offsets over all stored images.
+        index (np.ndarray): Stored image row of each dataset position, changed by subsetting or reordering.
+
+    Methods:
+        from_labels: Build a store from a list of label dicts.
+        cat: Concatenate the rows of several stores into a new one.
+        save: Write the store and its metadata to a single memory-mappable file.
+        load: Load a store and its metadata saved with save().
+        filter: Keep only instances of the given classes and optionally set all classes to 0.
+        drop_segments: Remove all segments.
+        close: Release the memory-mapped columns.
+
+    Examples:
+        >>> store = LabelStore.from_labels(labels)
+        >>> store.save(Path("labels.cache"), {"hash": "abc"})
+        >>> store, meta = LabelStore.load(Path("labels.cache"))
+        >>> label = store[0]  # dict with im_file, shape, cls, bboxes, segments, keypoints, ...
+        >>> rect = store[np.argsort(store.shapes[:, 0] / store.shapes[:, 1])]  # reordered view
+    """
+
+    MAGIC = b"ULSTORE1"
+    INSTANCE_COLUMNS = ("cls", "bboxes", "keypoints")  # one row per box, other non-offset columns have one per image
+
+    def __init__(self, columns: dict[str, np.ndarray], index: np.ndarray | None = None, path: Path | None = None):
+        """Initialize the store from its columns.
+
+        Args:
+            columns (dict[str, np.ndarray]): Label columns as written by from_labels().
+            index (np.ndarray, optional): Stored image rows to expose, all rows in order if None.
+            path (Path, optional): File the columns are memory-mapped from.
+        """
+        self.columns = columns
+        self.index = np.arange(len(columns["shape"])) if index is None else np.asarray(index, dtype=np.int64)
+        self.path = path
+        self.specs = {}  # dtype, shape and file offset of the columns that are memory-mapped from path
+        self._files = None  # decoded file names of all stored rows
+
+    @classmethod
+    def from_labels(cls, labels: list[dict], **rows: np.ndarray) -> LabelStore:
+        """Build a store from a list of label dicts with im_file, shape, cls, bboxes, segments and keypoints keys.
+
+        Args:
+            labels (list[dict]): Label dicts of each image.
+            **rows (np.ndarray): Additional columns with one row per image, i.e. file statistics.
+        """
+        segments = [s for lb in labels for s in lb["segments"]]
+        columns = {
+            "files": np.frombuffer("\n".join(str(lb["im_file"]) for lb in labels).encode(), dtype=np.uint8),
+            "shape": np.array([lb["shape"] for lb in labels], dtype=np.int32).reshape(-1, 2),
+            "box_idx": np.cumsum([0] + [len(lb["cls"]) for lb in labels], dtype=np.int64),
+            "cls": np.concatenate([lb["cls"] for lb in labels] or [np.zeros((0, 1))]).astype(np.float32),
+            "bboxes": np.concatenate([lb["bboxes"] for lb in labels] or [np.zeros((0, 4))]).astype(np.float32),
+            "seg_idx": np.cumsum([0] + [len(lb["segments"]) for lb in labels], dtype=np.int64),
+            "seg_pts": np.cumsum([0] + [len(s) for s in segments], dtype=np.int64),
+            "points": np.concatenate(segments or [np.zeros((0, 2))]).astype(np.float32).reshape(-1, 2),
+        }
+        if labels and labels[0].get("keypoints") is not None:
+            columns["keypoints"] = np.concatenate([lb["keypoints"] for lb in labels]).astype(np.float32)
+        return cls({**columns, **rows})
+
+    def _gather(self) -> dict[str, np.ndarray]:
+        """Return the columns of the dataset positions in index order."""
+        c, r = self.columns, self.index
+        if np.array_equal(r, np.arange(len(c["shape"]))):
+            return dict(c)
+        files = self._file_names()
+        out = {"files": np.frombuffer("\n".join(files[i] for i in r).encode(), dtype=np.uint8)}
+        inst, out["box_idx"] = _ranges(c["box_idx"], r)
+        segs, out["seg_idx"] = _ranges(c["seg_idx"], r)
+        pts, out["seg_pts"] = _ranges(c["seg_pts"], segs)
+        out["points"] = c["points"][pts]
+        for k, v in c.items():
+            if k not in out:
+                out[k] = v[inst] if k in self.INSTANCE_COLUMNS else v[r]
+        return out
+
+    @classmethod
+    def cat(cls, stores: list[LabelStore]) -> LabelStore:
+        """Concatenate the dataset positions of stores with the same columns into a new in-memory store."""
+        columns = [s._gather() for s in stores if len(s)]
+        if len(columns) < 2:
+            return cls({k: np.array(v) for k, v in (columns or [stores[0]._gather()])[0].items()})
+        out = {"files": np.concatenate([np.concatenate((c["files"], [ord("\n")])) for c in columns])[:-1]}
+        for k in ("box_idx", "seg_idx", "seg_pts"):
+            ends = np.cumsum([0] + [c[k][-1] for c in columns[:-1]])
+            out[k] = np.concatenate([[0]] + [c[k][1:] + e for c, e in zip(columns, ends)]).astype(np.int64)
+        for k in columns[0]:
+            if k not in out:
+                out[k] = np.concatenate([c[k] for c in columns])
+        return cls(out)
+
+    def save(self, path: Path, meta: dict) -> None:
+        """Write the dataset positions in index order and JSON-serializable metadata to one memory-mappable file."""
+        specs, offset, columns = {}, 0, {k: np.ascontiguousarray(v) for k, v in self._gather().items()}
+        for k, v in columns.items():
+            specs[k] = [v.dtype.str, list(v.shape), offset]
+            offset += -(-v.nbytes // 64) * 64
+        header = json.dumps({"meta": meta, "columns": specs}).encode()
+        header += b" " * (-(len(self.MAGIC) + 8 + len(header)) % 64)
+        tmp = path.with_name(f"{path.name}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(self.MAGIC + len(header).to_bytes(8, "little") + header)
+            for k, v in columns.items():
+                f.write(memoryview(v.reshape(-1)).cast("B"))
+                f.write(b"\0" * (-v.nbytes % 64))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> tuple[LabelStore, dict]:
+        """Load a store saved with save() as read-only memory maps, returning the store and its metadata."""
+        with open(path, "rb") as f:
+            assert f.read(len(cls.MAGIC)) == cls.MAGIC, "not a label store"
+            n = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(n))
+        start = len(cls.MAGIC) + 8 + n
+        specs = {k: [dtype, shape, start + offset] for k, (dtype, shape, offset) in header["columns"].items()}
+        store = cls(cls._map(path, specs), path=path)
+        store.specs = specs
+        return store, header["meta"]
+
+    @staticmethod
+    def _map(path: Path, specs: dict) -> dict[str, np.ndarray]:
+        """Memory-map the columns described by specs from path."""
+        columns = {}
+        for k, (dtype, shape, offset) in specs.items():
+            shape = tuple(shape)
+            if math.prod(shape):
+                columns[k] = np.memmap(path, dtype=np.dtype(dtype), mode="r", offset=offset, shape=shape)
+            else:  # empty arrays can not be mapped
+                columns[k] = np.zeros(shape, dtype=np.dtype(dtype))
+        return columns
+
+    def _file_names(self) -> list[str]:
+        """Return the file names of all stored rows, decoded once."""
+        if self._files is None:
+            self._files = bytes(self.columns["files"]).decode().split("\n") if len(self.columns["shape"]) else []
+        return self._files
+
+    def _replace(self, columns: dict[str, np.ndarray]) -> None:
+        """Replace the columns, forgetting the file location of those that are no longer memory-mapped."""
+        self.specs = {k: v for k, v in self.specs.items() if columns[k] is self.columns[k]}
+        self.columns = columns
+
+    @property
+    def im_files(self) -> list[str]:
+        """Return the image file of each dataset position."""
+        files = self._file_names()
+        return [files[r] for r in self.index]
+
+    @property
+    def shapes(self) -> np.ndarray:
+        """Return the original (h, w) of each dataset position."""
+        return self.columns["shape"][self.index]
+
+    @property
+    def num_instances(self) -> int:
+        """Return the number of boxes over all dataset positions."""
+        box_idx = self.columns["box_idx"]
+        return int((box_idx[self.index + 1] - box_idx[self.index]).sum())
+
+    @property
+    def num_segments(self) -> int:
+        """Return the number of segments over all dataset positions."""
+        seg_idx = self.columns["seg_idx"]
+        return int((seg_idx[self.index + 1] - seg_idx[self.index]).sum())
+
+    def __len__(self) -> int:
+        """Return the number of dataset positions."""
+        return len(self.index)
+
+    def __iter__(self):
+        """Iterate over the label dicts of all dataset positions."""
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, i):
+        """Return a new label dict for an integer position, or a reordered or subset view for an index array.
+
+        Args:
+            i (int | list[int] | np.ndarray): Dataset position, or positions to keep in the new order.
+
+        Returns:
+            (dict | LabelStore): Label dict owning copies of its arrays, or a store sharing the same columns.
+        """
+        if not isinstance(i, (int, np.integer)):
+            store = LabelStore(self.columns, self.index[i], self.path)
+            store.specs, store._files = self.specs, self._files
+            return store
+        c, r = self.columns, self.index[i]
+        a, b = c["box_idx"][r], c["box_idx"][r + 1]
+        pts, segs = c["seg_pts"], range(c["seg_idx"][r], c["seg_idx"][r + 1])
+        return {
+            "im_file": self._file_names()[r],
+            "shape": tuple(int(x) for x in c["shape"][r]),
+            "cls": np.array(c["cls"][a:b]),
+            "bboxes": np.array(c["bboxes"][a:b]),
+            "segments": [np.array(c["points"][pts[k] : pts[k + 1]]) for k in segs],
+            "keypoints": np.array(c["keypoints"][a:b]) if "keypoints" in c else None,
+            "normalized": True,
+            "bbox_format": "xywh",
+        }
+
+    def filter(self, include_class: list[int] | None = None, single_cls: bool = False) -> None:
+        """Keep only instances of the given classes, with their segments and keypoints, and optionally set classes to 0.
+
+        Args:
+            include_class (list[int], optional): Classes to keep, all if None.
+            single_cls (bool): Whether to set all classes to 0.
+        """
+        c = dict(self.columns)
+        if include_class is not None:
+            keep = np.isin(c["cls"][:, 0], include_class)
+            box_idx = c["box_idx"]
+            c["box_idx"] = np.concatenate([[0], np.cumsum(keep)])[box_idx]
+            for k in ("cls", "bboxes", "keypoints"):
+                if k in c:
+                    c[k] = c[k][keep]
+            # Segments belong to the boxes at the same position of their image, as in BaseDataset.update_labels()
+            seg_idx, seg_pts = c["seg_idx"], c["seg_pts"]
+            image = np.repeat(np.arange(len(seg_idx) - 1), np.diff(seg_idx))
+            pos = np.arange(seg_idx[-1]) - seg_idx[image]
+            valid = pos < np.diff(box_idx)[image]
+            seg_keep = np.zeros(len(pos), dtype=bool)
+            seg_keep[valid] = keep[box_idx[image[valid]] + pos[valid]]
+            c["seg_idx"] = np.concatenate([[0], np.cumsum(seg_keep)])[seg_idx]
+            c["seg_pts"] = np.cumsum(np.concatenate([[0], np.diff(seg_pts)[seg_keep]]), dtype=np.int64)
+            c["points"] = c["points"][np.repeat(seg_keep, np.diff(seg_pts))]
+        if single_cls:
+            c["cls"] = np.zeros(c["cls"].shape, dtype=np.float32)
+        self._replace(c)
+
+    def drop_segments(self) -> None:
+        """Remove all segments, keeping boxes and keypoints."""
+        self._replace(
+            {
+                **self.columns,
+                "seg_idx": np.zeros(len(self.columns["seg_idx"]), dtype=np.int64),
+                "seg_pts": np.zeros(1, dtype=np.int64),
+                "points": np.zeros((0, 2), dtype=np.float32),
+            }
+        )
+
+    def close(self) -> None:
+        """Release the memory-mapped columns so that the file they are mapped from can be replaced."""
+        self.columns = {k: v for k, v in self.columns.items() if k not in self.specs}
+        self.specs = {}
+
+    def __getstate__(self) -> dict:
+        """Pickle columns that are still memory-mapped by their location so workers re-map instead of copying them."""
+        columns = {k: v for k, v in self.columns.items() if k not in self.specs}
+        return {**self.__dict__, "_files": None, "columns": columns}
+
+    def __setstate__(self, state: dict) -> None:
+        """Re-map the memory-mapped columns of a pickled store."""
+        self.__dict__.update(state)
+        self.columns.update(self._map(self.path, self.specs))
+
+
+def load_label_store(path: Path) -> dict:
+    """Load an Ultralytics label store *.cache file as a dictionary with a memory-mapped LabelStore under 'labels'."""
+    labels, meta = LabelStore.load(path)
+    return {**meta, "labels": labels}
+
+
+def save_label_store(prefix: str, path: Path, x: dict, version: str) -> None:
+    """Save a dataset *.cache dictionary x holding a LabelStore under 'labels' and JSON-serializable metadata."""
+    x["version"] = version  # add cache version
+    if is_dir_writeable(path.parent):
+        x["labels"].save(path, {k: v for k, v in x.items() if k != "labels"})
+        LOGGER.info(f"{prefix}New cache created: {path}")
+    else:
+        LOGGER.warning(f"{prefix}Cache directory {path.parent} is not writable, cache not saved.")
@@ -13,7 +13,7 @@ import cv2
 import numpy as np
 import torch
 from PIL import Image
-from torch.utils.data import ConcatDataset
+from torch.utils.data import ConcatDataset, Dataset
 
 from ultralytics.utils import LOCAL_RANK, LOGGER, NUM_THREADS, TQDM, colorstr
 from ultralytics.utils.instance import Instances
@@ -30,6 +30,7 @@ from .augment import (
     v8_transforms,
 )
 from .base import BaseDataset
+from .cache import LabelStore, file_stats, files_hash, load_label_store, save_label_store
 from .converter import merge_multi_segment
 from .utils import (
     HELP_URL,
@@ -43,7 +44,7 @@ from .utils import (
 )
 
 # Ultralytics dataset *.cache version, >= 1.0.0 for Ultralytics YOLO models
-DATASET_CACHE_VERSION = "1.0.3"
+DATASET_CACHE_VERSION = "1.1.1"
 
 
 class YOLODataset(BaseDataset):
@@ -87,31 +88,59 @@ class YOLODataset(BaseDataset):
         assert not (self.use_segments and self.use_keypoints), "Can not use both segments and keypoints."
         super().__init__(*args, channels=self.data.get("channels", 3), **kwargs)
 
-    def cache_labels(self, path: Path = Path("./labels.cache")) -> dict:
+    def cache_labels(
+        self, path: Path = Path("./labels.cache"), stats: np.ndarray | None = None, previous: dict | None = None
+    ) -> dict:
         """Cache dataset labels, check images and read shapes.
 
+        Only images whose image or label file is new or changed since the previous cache, by path, size and
+        modification time, are verified. Labels of unchanged images are taken from the previous cache, labels of
+        removed images are dropped and the cache file is rewritten with the result.
+
         Args:
             path (Path): Path where to save the cache file.
+            stats (np.ndarray, optional): Image and label file statistics from file_stats() with shape (n, 4).
+            previous (dict, optional): Previously cached labels and related information to update.
 
         Returns:
-            (dict): Dictionary containing cached labels and related information.
+            (dict): Dictionary containing cached labels as a LabelStore and related information.
         """
+        if stats is None:
+            stats = np.concatenate((file_stats(self.im_files), file_stats(self.label_files)), 1)
+        keep, corrupt, msgs = np.zeros(len(self.im_files), dtype=bool), {}, {}
+        store = previous["labels"] if previous else None
+        if store is not None and len(store):
+            rows = {f: j for j, f in enumerate(store.im_files)}
+            j = np.array([rows.get(f, -1) for f in self.im_files], dtype=np.int64)
+            old = np.concatenate((store.columns["im_stat"], store.columns["lb_stat"]), 1)[j]
+            keep = (j >= 0) & (old == stats).all(1)  # unchanged images with valid labels
+        if previous:
+            for i in np.flatnonzero(~keep):
+                if previous["corrupt"].get(self.im_files[i]) == stats[i].tolist():  # unchanged corrupt image
+                    corrupt[self.im_files[i]] = previous["corrupt"][self.im_files[i]]
+            kept = {self.im_files[i] for i in np.flatnonzero(keep)} | corrupt.keys()
+            msgs = {f: m for f, m in previous["msgs"].items() if f in kept}
+        scan = [i for i in np.flatnonzero(~keep) if self.im_files[i] not in corrupt]  # new or changed images
+
         x = {"labels": []}
-        nm, nf, ne, nc, msgs = 0, 0, 0, 0, []  # number missing, found, empty, corrupt, messages
+        scanned = store.columns["scan"][j[keep]].sum(0) if keep.any() else np.zeros(3, dtype=np.int64)
+        nm, nf, ne, nc = (*(int(n) for n in scanned), len(corrupt))  # number missing, found, empty, corrupt
         desc = f"{self.prefix}Scanning {path.parent / path.stem}..."
-        total = len(self.im_files)
+        if previous:
+            desc += f" {len(self.im_files) - len(scan)} unchanged,"
         nkpt, ndim = self.data.get("kpt_shape", (0, 0))
         if self.use_keypoints and (nkpt <= 0 or ndim not in {2, 3}):
             raise ValueError(
                 "'kpt_shape' in data.yaml missing or incorrect. Should be a list with [number of "
                 "keypoints, number of dims (2 for x,y or 3 for x,y,visible)], i.e. 'kpt_shape: [17, 3]'"
             )
+        found, flags = [], []  # dataset position and (missing, found, empty) of each newly verified image
         with ThreadPool(NUM_THREADS) as pool:
             results = pool.imap(
                 func=verify_image_label,
                 iterable=zip(
-                    self.im_files,
-                    self.label_files,
+                    [self.im_files[i] for i in scan],
+                    [self.label_files[i] for i in scan],
                     repeat(self.prefix),
                     repeat(self.use_keypoints),
                     repeat(len(self.data["names"])),
@@ -120,8 +149,8 @@ class YOLODataset(BaseDataset):
                     repeat(self.single_cls),
                 ),
             )
-            pbar = TQDM(results, desc=desc, total=total)
-            for im_file, lb, shape, segments, keypoint, nm_f, nf_f, ne_f, nc_f, msg in pbar:
+            pbar = TQDM(zip(scan, results), desc=desc, total=len(scan))
+            for i, (im_file, lb, shape, segments, keypoint, nm_f, nf_f, ne_f, nc_f, msg) in pbar:
                 nm += nm_f
                 nf += nf_f
                 ne += ne_f
@@ -139,37 +168,58 @@ class YOLODataset(BaseDataset):
                             "bbox_format": "xywh",
                         }
                     )
+                    found.append(i)
+                    flags.append((nm_f, nf_f, ne_f))
+                else:
+                    corrupt[self.im_files[i]] = stats[i].tolist()
                 if msg:
-                    msgs.append(msg)
+                    msgs[self.im_files[i]] = msg
                 pbar.desc = f"{desc} {nf} images, {nm + ne} backgrounds, {nc} corrupt"
             pbar.close()
 
         if msgs:
-            LOGGER.info("\n".join(msgs))
+            LOGGER.info("\n".join(msgs.values()))
         if nf == 0:
             LOGGER.warning(f"{self.prefix}No labels found in {path}. {HELP_URL}")
-        x["hash"] = get_hash(self.label_files + self.im_files)
+        found = np.array(found, dtype=np.int64)
+        labels = LabelStore.from_labels(
+            x["labels"],
+            im_stat=stats[found, :2],
+            lb_stat=stats[found, 2:],
+            scan=np.array(flags, dtype=np.int8).reshape(-1, 3),
+        )
+        if keep.any():  # merge with the unchanged labels in dataset order
+            labels = LabelStore.cat([store[j[keep]], labels])
+            labels = labels[np.argsort(np.concatenate((np.flatnonzero(keep), found)), kind="stable")]
+        if store is not None:
+            store.close()  # the cache file is replaced below
+        x["labels"] = labels
+        x["hash"] = files_hash(self.im_files + self.label_files, stats=stats)
         x["results"] = nf, nm, ne, nc, len(self.im_files)
-        x["msgs"] = msgs  # warnings
-        save_dataset_cache_file(self.prefix, path, x, DATASET_CACHE_VERSION)
+        x["msgs"] = msgs  # warnings by image file
+        x["corrupt"] = corrupt  # file statistics of corrupt images, not verified again until they change
+        save_label_store(self.prefix, path, x, DATASET_CACHE_VERSION)
         return x
 
-    def get_labels(self) -> list[dict]:
-        """Return dictionary of labels for YOLO training.
+    def get_labels(self) -> LabelStore:
+        """Return the labels for YOLO training.
 
         This method loads labels from disk or cache, verifies their integrity, and prepares them for training.
 
         Returns:
-            (list[dict]): List of label dictionaries, each containing information about an image and its annotations.
+            (LabelStore): Columnar labels indexable as label dictionaries, each containing information about an image
+                and its annotations.
         """
         self.label_files = img2label_paths(self.im_files)
         cache_path = Path(self.label_files[0]).parent.with_suffix(".cache")
+        stats = np.concatenate((file_stats(self.im_files), file_stats(self.label_files)), 1)  # (n, 4)
         try:
-            cache, exists = load_dataset_cache_file(cache_path), True  # attempt to load a *.cache file
+            cache, exists = load_label_store(cache_path), True  # attempt to memory-map a *.cache file
             assert cache["version"] == DATASET_CACHE_VERSION  # matches current version
-            assert cache["hash"] == get_hash(self.label_files + self.im_files)  # identical hash
-        except (FileNotFoundError, AssertionError, AttributeError, ModuleNotFoundError):
-            cache, exists = self.cache_labels(cache_path), False  # run cache ops
+        except (FileNotFoundError, AssertionError, AttributeError, KeyError, ValueError):
+            cache, exists = None, False
+        if not exists or cache["hash"] != files_hash(self.im_files + self.label_files, stats=stats):
+            cache, exists = self.cache_labels(cache_path, stats, cache), False  # verify new and changed files only
 
         # Display cache
         nf, nm, ne, nc, n = cache.pop("results")  # found, missing, empty, corrupt, total
@@ -177,28 +227,27 @@ class YOLODataset(BaseDataset):
             d = f"Scanning {cache_path}... {nf} images, {nm + ne} backgrounds, {nc} corrupt"
             TQDM(None, desc=self.prefix + d, total=n, initial=n)  # display results
             if cache["msgs"]:
-                LOGGER.info("\n".join(cache["msgs"]))  # display warnings
+                LOGGER.info("\n".join(cache["msgs"].values()))  # display warnings
 
         # Read cache
-        [cache.pop(k) for k in ("hash", "version", "msgs")]  # remove items
+        [cache.pop(k) for k in ("hash", "version", "msgs", "corrupt")]  # remove items
         labels = cache["labels"]
         if not labels:
             raise RuntimeError(
                 f"No valid images found in {cache_path}. Images with incorrectly formatted labels are ignored. {HELP_URL}"
             )
-        self.im_files = [lb["im_file"] for lb in labels]  # update im_files
+        self.im_files = labels.im_files  # update im_files
 
         # Check if the dataset is all boxes or all segments
-        lengths = ((len(lb["cls"]), len(lb["bboxes"]), len(lb["segments"])) for lb in labels)
-        len_cls, len_boxes, len_segments = (sum(x) for x in zip(*lengths))
+        len_cls = len_boxes = labels.num_instances
+        len_segments = labels.num_segments
         if len_segments and len_boxes != len_segments:
             LOGGER.warning(
                 f"Box and segment counts should be equal, but got len(segments) = {len_segments}, "
                 f"len(boxes) = {len_boxes}. To resolve this only boxes will be used and all segments will be removed. "
                 "To avoid this please supply either a detect or segment dataset, not a detect-segment mixed dataset."
             )
-            for lb in labels:
-                lb["segments"] = []
+            labels.drop_segments()
         if len_cls == 0:
             LOGGER.warning(f"Labels are missing or empty in {cache_path}, training may not work correctly. {HELP_URL}")
         return labels
@@ -678,6 +727,85 @@ class YOLOConcatDataset(ConcatDataset):
             dataset.close_mosaic(hyp)
 
 
+class StratifiedSubset(Dataset):
+    """Fixed class-stratified subset of a YOLO dataset, e.g. for fast validation during training.
+
+    Images are sampled so that every class keeps about `fraction` of the images containing it (at least one), starting
+    from the rarest class, and the remainder up to `fraction` of all images is filled at random, including background
+    images. Subset indices keep the dataset order, and with rectangular batches the batch shapes are recomputed as the
+    largest original shape of each subset batch so that images from different original batches can be collated.
+
+    Attributes:
+        dataset (BaseDataset): The full dataset.
+        indices (np.ndarray): Sorted dataset indices of the subset.
+        batch_size (int): Batch size used to group subset images into rectangular batches.
+        batch_shapes (np.ndarray | None): Letterbox shape of each subset batch if the dataset uses rectangular batches.
+
+    Methods:
+        sample: Select stratified image indices from a sequence of labels.
+
+    Examples:
+        >>> subset = StratifiedSubset(val_dataset, fraction=0.1, seed=0)
+        >>> loader = build_dataloader(subset, batch=32, workers=4, shuffle=False)
+    """
+
+    def __init__(self, dataset: BaseDataset, fraction: float, seed: int = 0):
+        """Initialize the subset.
+
+        Args:
+            dataset (BaseDataset): Dataset to sample from.
+            fraction (float): Fraction of images to keep.
+            seed (int): Random seed, the same seed always selects the same images.
+        """
+        self.dataset = dataset
+        self.indices = self.sample(dataset.labels, fraction, seed)
+        self.batch_size = dataset.batch_size
+        self.collate_fn = dataset.collate_fn
+        self.batch_shapes = None
+        if dataset.rect:
+            shapes = dataset.batch_shapes[dataset.batch[self.indices]]
+            self.batch_shapes = np.maximum.reduceat(shapes, np.arange(0, len(shapes), self.batch_size), axis=0)
+
+    @staticmethod
+    def sample(labels, fraction: float, seed: int = 0) -> np.ndarray:
+        """Select stratified image indices.
+
+        Args:
+            labels (list[dict] | LabelStore): Labels of each image with a 'cls' array.
+            fraction (float): Fraction of images to keep.
+            seed (int): Random seed.
+
+        Returns:
+            (np.ndarray): Sorted indices of the selected images.
+        """
+        rng = np.random.default_rng(seed)
+        images = defaultdict(list)  # class -> images containing it
+        for i, lb in enumerate(labels):
+            for c in np.unique(lb["cls"]).astype(int):
+                images[c].append(i)
+        chosen = np.zeros(len(labels), dtype=bool)
+        for c in sorted(images, key=lambda c: len(images[c])):  # rarest classes first
+            idx = np.array(images[c])
+            n = max(round(len(idx) * fraction), 1) - chosen[idx].sum()
+            if n > 0:
+                chosen[rng.choice(idx[~chosen[idx]], n, replace=False)] = True
+        n = max(round(len(labels) * fraction), 1) - chosen.sum()
+        if n > 0:
+            chosen[rng.choice(np.flatnonzero(~chosen), n, replace=False)] = True
+        return np.flatnonzero(chosen)
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        """Return the transformed label of the subset image at `index`."""
+        label = self.dataset.get_image_and_label(self.indices[index])
+        if self.batch_shapes is not None:
+            label["rect_shape"] = self.batch_shapes[index // self.batch_size]
+        return self.dataset.transforms(label)
+
+    def __len__(self) -> int:
+        """Return the number of subset images."""
+        return len(self.indices)
+
+
 # TODO: support semantic segmentation
 class SemanticDataset(BaseDataset):
     """Semantic Segmentation Dataset."""
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import glob
 import math
+import multiprocessing as mp
 import os
-import time
 import urllib
 from dataclasses import dataclass
 from pathlib import Path
@@ -18,6 +18,7 @@ import torch
 from PIL import Image
 
 from ultralytics.data.utils import FORMATS_HELP_MSG, IMG_FORMATS, VID_FORMATS
+from ultralytics.data.video import FrameRing, VideoReader, decode_stream
 from ultralytics.utils import IS_COLAB, IS_KAGGLE, LOGGER, ops
 from ultralytics.utils.checks import check_requirements
 from ultralytics.utils.patches import imread
@@ -60,19 +61,19 @@ class LoadStreams:
         sources (list[str]): The source input paths or URLs for the video streams.
         vid_stride (int): Video frame-rate stride.
         buffer (bool): Whether to buffer input streams.
+        process (bool): Whether streams are decoded in separate processes instead of threads.
         running (bool): Flag to indicate if the streaming thread is running.
         mode (str): Set to 'stream' indicating real-time capture.
-        imgs (list[list[np.ndarray]]): List of image frames for each stream.
+        rings (list[FrameRing]): Preallocated frame ring buffer for each stream.
         fps (list[float]): List of FPS for each stream.
         frames (list[int]): List of total frames for each stream.
-        threads (list[Thread]): List of threads for each stream.
+        threads (list[Thread | multiprocessing.Process]): List of decoder threads or processes for each stream.
         shape (list[tuple[int, int, int]]): List of shapes for each stream.
-        caps (list[cv2.VideoCapture]): List of cv2.VideoCapture objects for each stream.
+        caps (list[cv2.VideoCapture]): List of cv2.VideoCapture objects for each stream, None for decoder processes.
         bs (int): Batch size for processing.
         cv2_flag (int): OpenCV flag for image reading (grayscale or RGB).
 
     Methods:
-        update: Read stream frames in daemon thread.
         close: Close stream loader and release resources.
         __iter__: Returns an iterator object for the class.
         __next__: Returns source paths, transformed, and original images for processing.
@@ -86,12 +87,19 @@ class LoadStreams:
         >>> stream_loader.close()
 
     Notes:
-        - The class uses threading to efficiently load frames from multiple streams simultaneously.
+        - The class uses threads or processes to efficiently load frames from multiple streams simultaneously.
         - It automatically handles YouTube links, converting them to the best available stream URL.
-        - The class implements a buffer system to manage frame storage and retrieval.
+        - Frames are decoded into preallocated ring buffers of 30 slots per stream, see `FrameRing`.
     """
 
-    def __init__(self, sources: str = "file.streams", vid_stride: int = 1, buffer: bool = False, channels: int = 3):
+    def __init__(
+        self,
+        sources: str = "file.streams",
+        vid_stride: int = 1,
+        buffer: bool = False,
+        channels: int = 3,
+        process: bool = False,
+    ):
         """Initialize stream loader for multiple video sources, supporting various stream types.
 
         Args:
@@ -99,9 +107,11 @@ class LoadStreams:
             vid_stride (int): Video frame-rate stride.
             buffer (bool): Whether to buffer input streams.
             channels (int): Number of image channels (1 for grayscale, 3 for RGB).
+            process (bool): Decode each stream in a separate process through shared memory instead of a thread.
         """
         torch.backends.cudnn.benchmark = True  # faster for fixed-size inference
         self.buffer = buffer  # buffer input streams
+        self.process = process
         self.running = True  # running flag for Thread
         self.mode = "stream"
         self.vid_stride = vid_stride  # video frame-rate stride
@@ -114,7 +124,7 @@ class LoadStreams:
         self.frames = [0] * n
         self.threads = [None] * n
         self.caps = [None] * n  # video capture objects
-        self.imgs = [[] for _ in range(n)]  # images
+        self.rings = [None] * n  # frame ring buffers
         self.shape = [[] for _ in range(n)]  # image shapes
         self.sources = [ops.clean_str(x).replace(os.sep, "_") for x in sources]  # clean source names for later
         for i, s in enumerate(sources):  # index, source
@@ -144,47 +154,48 @@ class LoadStreams:
             im = cv2.cvtColor(im, cv2.COLOR_BGR2GRAY)[..., None] if self.cv2_flag == cv2.IMREAD_GRAYSCALE else im
             if not success or im is None:
                 raise ConnectionError(f"{st}Failed to read images from {s}")
-            self.imgs[i].append(im)
             self.shape[i] = im.shape
-            self.threads[i] = Thread(target=self.update, args=([i, self.caps[i], s]), daemon=True)
+            capacity = 30 if self.buffer else 2  # newest-frame mode only needs a write and a read slot
+            self.rings[i] = FrameRing(im.shape, capacity=capacity, buffered=self.buffer, shared=self.process)
+            gray = self.cv2_flag == cv2.IMREAD_GRAYSCALE
+            if self.process:  # decoder process re-opens the source, no GIL shared with inference
+                self.caps[i].release()
+                self.caps[i] = None
+                kwargs = dict(frames=self.frames[i], vid_stride=self.vid_stride, gray=gray)
+                self.threads[i] = mp.get_context("spawn").Process(
+                    target=decode_stream, args=(s, self.rings[i]), kwargs=kwargs, daemon=True
+                )
+            else:
+                self.rings[i].reserve()[:] = im  # guaranteed first frame
+                self.rings[i].commit()
+                kwargs = dict(frames=self.frames[i] - 1, vid_stride=self.vid_stride, gray=gray)
+                self.threads[i] = Thread(
+                    target=decode_stream, args=(s, self.rings[i], self.caps[i]), kwargs=kwargs, daemon=True
+                )
             LOGGER.info(f"{st}Success ✅ ({self.frames[i]} frames of shape {w}x{h} at {self.fps[i]:.2f} FPS)")
             self.threads[i].start()
         LOGGER.info("")  # newline
 
-    def update(self, i: int, cap: cv2.VideoCapture, stream: str):
-        """Read stream frames in daemon thread and update image buffer."""
-        n, f = 0, self.frames[i]  # frame number, frame array
-        while self.running and cap.isOpened() and n < (f - 1):
-            if len(self.imgs[i]) < 30:  # keep a <=30-image buffer
-                n += 1
-                cap.grab()  # .read() = .grab() followed by .retrieve()
-                if n % self.vid_stride == 0:
-                    success, im = cap.retrieve()
-                    im = (
-                        cv2.cvtColor(im, cv2.COLOR_BGR2GRAY)[..., None] if self.cv2_flag == cv2.IMREAD_GRAYSCALE else im
-                    )
-                    if not success:
-                        im = np.zeros(self.shape[i], dtype=np.uint8)
-                        LOGGER.warning("Video stream unresponsive, please check your IP camera connection.")
-                        cap.open(stream)  # re-open stream if signal was lost
-                    if self.buffer:
-                        self.imgs[i].append(im)
-                    else:
-                        self.imgs[i] = [im]
-            else:
-                time.sleep(0.01)  # wait until the buffer is empty
-
     def close(self):
-        """Terminate stream loader, stop threads, and release video capture resources."""
+        """Terminate stream loader, stop decoders, and release video capture and shared memory resources."""
+        if not self.running:  # already closed
+            return
         self.running = False  # stop flag for Thread
+        for ring in self.rings:
+            if ring is not None:
+                ring.close()  # wakes and stops decoders
         for thread in self.threads:
-            if thread.is_alive():
+            if thread is not None and thread.is_alive():
                 thread.join(timeout=5)  # Add timeout
         for cap in self.caps:  # Iterate through the stored VideoCapture objects
             try:
-                cap.release()  # release video capture
+                if cap is not None:
+                    cap.release()  # release video capture
             except Exception as e:
                 LOGGER.warning(f"Could not release VideoCapture object: {e}")
+        for ring in self.rings:
+            if ring is not None:
+                ring.release()
 
     def __iter__(self):
         """Iterate through YOLO image feed and re-open unresponsive streams."""
@@ -196,25 +207,14 @@ class LoadStreams:
         self.count += 1
 
         images = []
-        for i, x in enumerate(self.imgs):
-            # Wait until a frame is available in each buffer
-            while not x:
-                if not self.threads[i].is_alive():
+        for i, ring in enumerate(self.rings):
+            # Wait until a frame is available in each buffer: the oldest if buffered, else the newest
+            while (im := ring.get(timeout=1)) is None:
+                if ring.closed:  # stream ended or decoder stopped
                     self.close()
                     raise StopIteration
-                time.sleep(1 / min(self.fps))
-                x = self.imgs[i]
-                if not x:
-                    LOGGER.warning(f"Waiting for stream {i}")
-
-            # Get and remove the first frame from imgs buffer
-            if self.buffer:
-                images.append(x.pop(0))
-
-            # Get the last frame, and clear the rest from the imgs buffer
-            else:
-                images.append(x.pop(-1) if x else np.zeros(self.shape[i], dtype=np.uint8))
-                x.clear()
+                LOGGER.warning(f"Waiting for stream {i}")
+            images.append(im)
 
         return self.sources, images, [""] * self.bs
 
@@ -313,8 +313,9 @@ class LoadImagesAndVideos:
         video_flag (list[bool]): Flags indicating whether a file is a video (True) or an image (False).
         mode (str): Current mode, 'image' or 'video'.
         vid_stride (int): Stride for video frame-rate.
+        vid_backend (str): Video decoding backend, 'cv2' or 'pyav'.
         bs (int): Batch size.
-        cap (cv2.VideoCapture): Video capture object for OpenCV.
+        cap (VideoReader): Threaded video reader decoding ahead of inference.
         frame (int): Frame counter for video.
         frames (int): Total number of frames in the video.
         count (int): Counter for iteration, initialized at 0 during __iter__().
@@ -340,7 +341,14 @@ class LoadImagesAndVideos:
         - Can read from a text file containing paths to images and videos.
     """
 
-    def __init__(self, path: str | Path | list, batch: int = 1, vid_stride: int = 1, channels: int = 3):
+    def __init__(
+        self,
+        path: str | Path | list,
+        batch: int = 1,
+        vid_stride: int = 1,
+        channels: int = 3,
+        vid_backend: str = "cv2",
+    ):
         """Initialize dataloader for images and videos, supporting various input formats.
 
         Args:
@@ -348,6 +356,7 @@ class LoadImagesAndVideos:
             batch (int): Batch size for processing.
             vid_stride (int): Video frame-rate stride.
             channels (int): Number of image channels (1 for grayscale, 3 for RGB).
+            vid_backend (str): Video decoding backend, 'cv2' or 'pyav'.
         """
         parent = None
         if isinstance(path, str) and Path(path).suffix in {".txt", ".csv"}:  # txt/csv file with source paths
@@ -384,6 +393,7 @@ class LoadImagesAndVideos:
         self.video_flag = [False] * ni + [True] * nv
         self.mode = "video" if ni == 0 else "image"  # default to video if no images
         self.vid_stride = vid_stride  # video frame-rate stride
+        self.vid_backend = vid_backend
         self.bs = batch
         self.cv2_flag = cv2.IMREAD_GRAYSCALE if channels == 1 else cv2.IMREAD_COLOR  # grayscale or RGB
         if any(videos):
@@ -414,27 +424,20 @@ class LoadImagesAndVideos:
                 if not self.cap or not self.cap.isOpened():
                     self._new_video(path)
 
-                success = False
-                for _ in range(self.vid_stride):
-                    success = self.cap.grab()
-                    if not success:
-                        break  # end of video or failure
-
+                success, im0 = self.cap.read()  # next vid_stride-th frame, decoded ahead in a thread
                 if success:
-                    success, im0 = self.cap.retrieve()
                     im0 = (
                         cv2.cvtColor(im0, cv2.COLOR_BGR2GRAY)[..., None]
                         if self.cv2_flag == cv2.IMREAD_GRAYSCALE
                         else im0
                     )
-                    if success:
-                        self.frame += 1
-                        paths.append(path)
-                        imgs.append(im0)
-                        info.append(f"video {self.count + 1}/{self.nf} (frame {self.frame}/{self.frames}) {path}: ")
-                        if self.frame == self.frames:  # end of video
-                            self.count += 1
-                            self.cap.release()
+                    self.frame += 1
+                    paths.append(path)
+                    imgs.append(im0)
+                    info.append(f"video {self.count + 1}/{self.nf} (frame {self.frame}/{self.frames}) {path}: ")
+                    if self.frame == self.frames:  # end of video
+                        self.count += 1
+                        self.cap.release()
                 else:
                     # Move to the next file if the current video ended or failed to open
                     self.count += 1
@@ -471,11 +474,9 @@ class LoadImagesAndVideos:
     def _new_video(self, path: str):
         """Create a new video capture object for the given path and initialize video-related attributes."""
         self.frame = 0
-        self.cap = cv2.VideoCapture(path)
-        self.fps = int(self.cap.get(cv2.CAP_PROP_FPS))
-        if not self.cap.isOpened():
-            raise FileNotFoundError(f"Failed to open video {path}")
-        self.frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT) / self.vid_stride)
+        self.cap = VideoReader(path, vid_stride=self.vid_stride, backend=self.vid_backend)
+        self.fps = int(self.cap.fps)
+        self.frames = int(self.cap.frames / self.vid_stride)
 
     def __len__(self) -> int:
         """Return the number of files (images and videos) in the dataset."""
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 import random
 import subprocess
 import time
 import zipfile
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from tarfile import is_tarfile
@@ -16,6 +19,7 @@ from typing import Any
 import cv2
 import numpy as np
 from PIL import Image, ImageOps
+from torch.utils.data import get_worker_info
 
 from ultralytics.nn.autobackend import check_class_names
 from ultralytics.utils import (
@@ -796,3 +800,193 @@ def save_dataset_cache_file(prefix: str, path: Path, x: dict, version: str):
         LOGGER.info(f"{prefix}New cache created: {path}")
     else:
         LOGGER.warning(f"{prefix}Cache directory {path.parent} is not writable, cache not saved.")
+
+
+class StageTimer:
+    """Accumulate exclusive wall time per named stage of sample loading in the current process.
+
+    Nested stages are subtracted from the stage that encloses them, so e.g. Mosaic excludes the imread and resize of its
+    tiles. Timing is disabled by default; dataloader workers enable it for datasets with `profile=True` and
+    `profile_collate` collects and resets the times with every batch.
+
+    Attributes:
+        enabled (bool): Whether stages are timed.
+        times (defaultdict[str, float]): Exclusive seconds per stage since the last `pop()`.
+
+    Examples:
+        >>> with STAGE_TIMER("imread"):
+        ...     im = cv2.imread("image.jpg")
+        >>> times = STAGE_TIMER.pop()
+    """
+
+    def __init__(self):
+        """Initialize a disabled StageTimer with no recorded times."""
+        self.enabled = False
+        self.times = defaultdict(float)
+        self._children = []  # seconds spent in nested stages, one entry per open stage
+
+    def __call__(self, name: str):
+        """Return a context manager timing stage `name`, or a no-op context if timing is disabled."""
+        return self._time(name) if self.enabled else nullcontext()
+
+    @contextmanager
+    def _time(self, name: str):
+        """Time the enclosed block as stage `name`, excluding nested stages."""
+        self._children.append(0.0)
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t
+            self.times[name] += dt - self._children.pop()
+            if self._children:
+                self._children[-1] += dt
+
+    def pop(self) -> dict[str, float]:
+        """Return the recorded stage times and reset them."""
+        times, self.times = dict(self.times), defaultdict(float)
+        return times
+
+
+STAGE_TIMER = StageTimer()  # per-process stage timer, see DataProfiler
+
+
+def profile_collate(collate_fn, samples: list) -> Any:
+    """Collate `samples` and, while stage timing is enabled, attach the stage times spent loading them.
+
+    Args:
+        collate_fn (callable): Collate function of the dataset.
+        samples (list): Samples of one batch.
+
+    Returns:
+        (Any): The collated batch, with a 'profile' dict of stage seconds, 'images' and 'worker' (-1 for the main
+            process) added to dict batches when timing is enabled.
+    """
+    if not STAGE_TIMER.enabled:
+        return collate_fn(samples)
+    with STAGE_TIMER("collate"):
+        batch = collate_fn(samples)
+    if isinstance(batch, dict):
+        info = get_worker_info()
+        batch["profile"] = {**STAGE_TIMER.pop(), "images": len(samples), "worker": info.id if info else -1}
+    return batch
+
+
+class DataProfiler:
+    """Profile a training dataloader: per-stage and per-worker loading times and the time the loop waits for batches.
+
+    Calling the profiler on a loader yields its batches while timing each blocking `next(batch)` and collecting the
+    stage times that `profile_collate` attaches to the first `n` batches. A loop that spends a large share of its time
+    waiting is input-bound, and `suggest()` sizes workers and prefetch depth from the measured costs.
+
+    Attributes:
+        n (int): Number of batches to profile.
+        count (int): Batches profiled so far.
+        images (int): Images in the profiled batches.
+        stages (defaultdict[str, float]): Total exclusive seconds per loading stage.
+        workers (defaultdict[int, list]): Batches and loading seconds per worker id, -1 for the main process.
+        batch_times (list[float]): Loading seconds of each profiled batch.
+        wait (float): Seconds the loop blocked on `next(batch)`.
+        total (float): Seconds between consecutive batches, covering the same steps as `wait`.
+        steps (int): Number of steps in `wait` and `total`; the first batch of each iterator is excluded as warmup.
+
+    Examples:
+        >>> profiler = DataProfiler(100)
+        >>> for batch in profiler(train_loader):
+        ...     train_step(batch)
+        >>> LOGGER.info(profiler.summary())
+    """
+
+    def __init__(self, n: int):
+        """Initialize the profiler for the first `n` batches."""
+        self.n = n
+        self.count = self.images = self.steps = 0
+        self.wait = self.total = 0.0
+        self.stages = defaultdict(float)
+        self.workers = defaultdict(lambda: [0, 0.0])
+        self.batch_times = []
+
+    @property
+    def done(self) -> bool:
+        """Whether all `n` batches have been profiled."""
+        return self.count >= self.n
+
+    @property
+    def wait_fraction(self) -> float:
+        """Return the fraction of loop time spent waiting for batches."""
+        return self.wait / self.total if self.total else 0.0
+
+    def __call__(self, loader):
+        """Yield the batches of `loader`, profiling them until `n` batches have been seen.
+
+        Stage timing is enabled in this process only while fetching, so loaders with `num_workers=0` are profiled
+        without timing other datasets loaded in the main process. The 'profile' entry is always removed from batches.
+        """
+        it, last = iter(loader), None
+        while True:
+            STAGE_TIMER.enabled = not self.done
+            t = time.perf_counter()
+            try:
+                batch = next(it)
+            except StopIteration:
+                return
+            finally:
+                STAGE_TIMER.enabled = False
+            now = time.perf_counter()
+            profile = batch.pop("profile", None) if isinstance(batch, dict) else None
+            if not self.done:
+                self.update(profile, now - t, None if last is None else now - last)
+            last = now
+            yield batch
+
+    def update(self, profile: dict | None, wait: float, interval: float | None = None):
+        """Add one batch with its stage profile, the seconds waited for it and the seconds since the previous batch."""
+        self.count += 1
+        if profile:
+            worker, self.images = profile.pop("worker"), self.images + profile.pop("images")
+            for k, v in profile.items():
+                self.stages[k] += v
+            t = sum(profile.values())
+            self.workers[worker][0] += 1
+            self.workers[worker][1] += t
+            self.batch_times.append(t)
+        if interval is not None:
+            self.wait += wait
+            self.total += interval
+            self.steps += 1
+
+    def suggest(self, max_workers: int) -> tuple[int, int] | None:
+        """Suggest dataloader workers and prefetch factor from the profile.
+
+        Workers are sized so their combined throughput exceeds the loop's own time per batch by 25%, and the prefetch
+        factor grows with the spread of batch loading times so slow batches are absorbed by the queue.
+
+        Args:
+            max_workers (int): Upper bound on workers, i.e. CPUs per device.
+
+        Returns:
+            (tuple[int, int] | None): Workers and prefetch factor, or None if too few batches were profiled.
+        """
+        if not self.batch_times or not self.steps:
+            return None
+        b = np.array(self.batch_times)
+        step = max((self.total - self.wait) / self.steps, 1e-6)  # loop seconds per batch excluding waits
+        workers = min(max(math.ceil(1.25 * b.mean() / step), 1), max(max_workers, 1))
+        prefetch = int(np.clip(math.ceil(2 * np.percentile(b, 95) / max(np.median(b), 1e-9)), 2, 8))
+        return workers, prefetch
+
+    def summary(self, threshold: float = 0.1) -> str:
+        """Return a table of stage and worker times and the data wait, flagging input-bound loops above `threshold`."""
+        n, total = max(self.images, 1), sum(self.stages.values())
+        s = [f"Dataloader profile over {self.count} batches ({self.images} images)"]
+        s.append(f"{'Stage':>20}{'ms/img':>10}{'share':>8}")
+        s += [
+            f"{k:>20}{1e3 * v / n:>10.2f}{v / max(total, 1e-9):>8.1%}"
+            for k, v in sorted(self.stages.items(), key=lambda x: -x[1])
+        ]
+        s += [f"{'total':>20}{1e3 * total / n:>10.2f}", f"{'Worker':>20}{'batches':>10}{'ms/batch':>10}"]
+        s += [f"{'main' if k < 0 else k:>20}{b:>10}{1e3 * t / b:>10.1f}" for k, (b, t) in sorted(self.workers.items())]
+        s.append(f"Data wait {self.wait:.2f}s of {self.total:.2f}s ({self.wait_fraction:.1%}) over {self.steps} steps")
+        if self.wait_fraction > threshold:
+            s[-1] += ", input-bound: consider more workers, cache='ram' or data_autotune=True"
+        return "\n".join(s)
@@ -0,0 +1,398 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import threading
+from multiprocessing import shared_memory
+from pathlib import Path
+from queue import Full, Queue
+from threading import Event, Thread
+
+import cv2
+import numpy as np
+
+from ultralytics.utils import LOGGER
+from ultralytics.utils.checks import check_requirements
+
+VIDEO_BACKENDS = {"cv2", "pyav"}
+
+
+class VideoReader:
+    """Decode a video file in a background thread, keeping up to `buffer` frames decoded ahead of the consumer.
+
+    Mirrors the `cv2.VideoCapture` calls used by the loaders (`read`, `isOpened`, `release`), so that decoding of the
+    next frames overlaps inference on the current ones. With `vid_stride > 1` every `vid_stride`-th frame is returned,
+    and the skipped frames are never color-converted to BGR arrays. PyAV does not even decode skipped frames that no
+    other frame references, and numbers frames by presentation timestamp for this.
+
+    Backends:
+        - 'cv2': `cv2.VideoCapture` with `grab()` for skipped frames, returning the same frames as an in-loop reader.
+        - 'pyav': FFmpeg through PyAV with multi-threaded (frame and slice) decoding, for high resolution video.
+
+    Attributes:
+        path (str): Video file path.
+        vid_stride (int): Return every `vid_stride`-th frame.
+        backend (str): Decoding backend, 'cv2' or 'pyav'.
+        fps (float): Frame rate of the video.
+        frames (int): Number of frames in the video, 0 if unknown.
+
+    Methods:
+        read: Return the next frame as `(success, image)`.
+        isOpened: Return whether the reader is open.
+        release: Stop the decoding thread and close the video.
+
+    Examples:
+        >>> reader = VideoReader("video.mp4", vid_stride=2, backend="pyav")
+        >>> success, im = reader.read()
+        >>> reader.release()
+    """
+
+    def __init__(self, path: str, vid_stride: int = 1, backend: str = "cv2", buffer: int = 16):
+        """Open a video file and start decoding it ahead in a daemon thread.
+
+        Args:
+            path (str): Video file path.
+            vid_stride (int): Return every `vid_stride`-th frame.
+            backend (str): Decoding backend, 'cv2' or 'pyav'.
+            buffer (int): Maximum number of decoded frames held ahead of the consumer.
+        """
+        if backend not in VIDEO_BACKENDS:
+            raise ValueError(f"Invalid video backend '{backend}', valid backends are {VIDEO_BACKENDS}")
+        self.path, self.vid_stride, self.backend = str(path), max(int(vid_stride), 1), backend
+        if backend == "pyav":
+            check_requirements("av")
+            import av  # scope for faster 'import ultralytics'
+
+            self.container = av.open(self.path)
+            stream = self.container.streams.video[0]
+            stream.thread_type = "AUTO"  # frame and slice threading
+            self.fps = float(stream.average_rate or stream.guessed_rate or 30)
+            self.frames = stream.frames
+        else:
+            self.container = cv2.VideoCapture(self.path)
+            if not self.container.isOpened():
+                raise FileNotFoundError(f"Failed to open video {path}")
+            self.fps = self.container.get(cv2.CAP_PROP_FPS)
+            self.frames = int(self.container.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.queue = Queue(maxsize=max(buffer, 1))
+        self.stopped, self.opened = Event(), True
+        self.thread = Thread(target=self._decode, daemon=True)
+        self.thread.start()
+
+    def _put(self, item: tuple[bool, np.ndarray | None]) -> bool:
+        """Put a frame in the queue, waiting while it is full, and return False once the reader is released."""
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _decode(self):
+        """Decode strided frames into the queue until the video ends or the reader is released."""
+        try:
+            if self.backend == "pyav":
+                stream = self.container.streams.video[0]
+                rate, start, i = stream.average_rate or stream.guessed_rate, stream.start_time or 0, -1
+
+                def index(pts: int) -> int:
+                    """Return the frame number of a presentation timestamp, assuming a constant frame rate."""
+                    return round(float((pts - start) * stream.time_base * rate))
+
+                for packet in self.container.demux(stream):
+                    if self.vid_stride > 1 and rate and packet.pts is not None:
+                        # Skip decoding frames that are not returned and not referenced by other frames, i.e. B-frames
+                        returned = (index(packet.pts) + 1) % self.vid_stride == 0
+                        stream.codec_context.skip_frame = "DEFAULT" if returned else "NONREF"
+                    for frame in packet.decode():
+                        i = index(frame.pts) if rate and frame.pts is not None else i + 1
+                        if (i + 1) % self.vid_stride == 0 and not self._put((True, frame.to_ndarray(format="bgr24"))):
+                            return
+            else:
+                cap = self.container
+                while not self.stopped.is_set():
+                    if not all(cap.grab() for _ in range(self.vid_stride)):  # .read() = .grab() + .retrieve()
+                        break
+                    success, im = cap.retrieve()
+                    if not success or not self._put((True, im)):
+                        break
+        except Exception as e:
+            LOGGER.warning(f"Video decoding of {self.path} stopped: {e}")
+        self._put((False, None))  # end of video
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        """Return the next strided frame as `(success, image)`, or `(False, None)` at the end of the video."""
+        if not self.opened:
+            return False, None
+        success, im = self.queue.get()
+        if not success:
+            self.queue.put((False, None))  # keep reporting the end of the video
+        return success, im
+
+    def isOpened(self) -> bool:
+        """Return whether the reader is open."""
+        return self.opened
+
+    def release(self):
+        """Stop the decoding thread and close the video."""
+        if not self.opened:
+            return
+        self.opened = False
+        self.stopped.set()
+        self.thread.join(timeout=5)
+        self.container.release() if self.backend == "cv2" else self.container.close()
+
+
+class VideoWriter:
+    """Encode video frames with `cv2.VideoWriter` in a background thread fed by a bounded queue.
+
+    `write()` returns as soon as the frame is queued, blocking only when `queue_size` frames are waiting to be encoded,
+    so that encoding overlaps inference instead of running inside the prediction loop. Frames must not be modified after
+    they are written.
+
+    Attributes:
+        filename (str): Output video file path.
+        writer (cv2.VideoWriter): Underlying OpenCV writer, used by the encoding thread only.
+
+    Methods:
+        write: Queue a frame for encoding.
+        release: Encode all queued frames and close the file.
+
+    Examples:
+        >>> writer = VideoWriter("out.avi", cv2.VideoWriter_fourcc(*"MJPG"), 30, (640, 480))
+        >>> writer.write(np.zeros((480, 640, 3), dtype=np.uint8))
+        >>> writer.release()
+    """
+
+    def __init__(self, filename: str | Path, fourcc: int, fps: float, frameSize: tuple[int, int], queue_size: int = 32):
+        """Open an OpenCV video writer and start its encoding thread.
+
+        Args:
+            filename (str | Path): Output video file path.
+            fourcc (int): Codec code from `cv2.VideoWriter_fourcc()`.
+            fps (float): Frame rate of the output video.
+            frameSize (tuple[int, int]): Frame (width, height).
+            queue_size (int): Maximum number of frames waiting to be encoded.
+        """
+        self.filename = str(filename)
+        self.writer = cv2.VideoWriter(self.filename, fourcc, fps, frameSize)
+        self.queue = Queue(maxsize=max(queue_size, 1))
+        self.error = None  # exception that stopped the encoding thread, raised by write() and release()
+        self.thread = Thread(target=self._encode, daemon=True)
+        self.thread.start()
+
+    def _encode(self):
+        """Encode queued frames until the None sentinel arrives or encoding fails."""
+        try:
+            while (im := self.queue.get()) is not None:
+                self.writer.write(im)
+        except Exception as e:
+            self.error = e
+
+    def write(self, im: np.ndarray):
+        """Queue a frame for encoding, raising the error of the encoding thread if it has stopped."""
+        while self.error is None:
+            try:
+                self.queue.put(im, timeout=0.1)
+                return
+            except Full:
+                pass
+        raise RuntimeError(f"Video encoding of {self.filename} failed") from self.error
+
+    def isOpened(self) -> bool:
+        """Return whether the underlying writer is open."""
+        return self.writer.isOpened()
+
+    def release(self):
+        """Encode all queued frames and close the file, raising the error of the encoding thread if it has stopped."""
+        if self.thread.is_alive():
+            while self.error is None:
+                try:
+                    self.queue.put(None, timeout=0.1)
+                    break
+                except Full:
+                    pass
+            self.thread.join()
+        self.writer.release()
+        if self.error is not None:
+            raise RuntimeError(f"Video encoding of {self.filename} failed") from self.error
+
+
+class FrameRing:
+    """Fixed-size ring of preallocated frame slots shared by one stream decoder and one consumer.
+
+    The decoder writes each frame straight into a free slot (`reserve()` and `commit()`), so no arrays are allocated per
+    frame. The consumer wakes on a condition variable instead of polling with `time.sleep()`. In buffered mode the
+    consumer receives every frame in order and the decoder waits while the ring is full. Otherwise the consumer receives
+    the newest frame and older unread frames are skipped. With `shared=True` the slots and counters live in shared
+    memory and the condition comes from a 'spawn' multiprocessing context, so the decoder can run in a separate process
+    that does not share the GIL with inference.
+
+    Attributes:
+        shape (tuple[int, ...]): Frame shape.
+        capacity (int): Number of frame slots.
+        buffered (bool): Whether every frame is delivered in order, rather than only the newest one.
+        slots (np.ndarray): Frame storage of shape (capacity, *shape).
+
+    Methods:
+        reserve: Return the slot to decode the next frame into.
+        commit: Publish the frame written to the reserved slot.
+        get: Return a copy of the next frame, optionally into a caller-provided array, waiting until one is available.
+        close: Mark the stream as ended and wake all waiters.
+        release: Free the shared memory.
+
+    Examples:
+        >>> ring = FrameRing((480, 640, 3), capacity=4)
+        >>> slot = ring.reserve()
+        >>> slot[:] = 114
+        >>> ring.commit()
+        >>> frame = ring.get()
+    """
+
+    def __init__(self, shape: tuple[int, ...], capacity: int = 30, buffered: bool = False, shared: bool = False):
+        """Allocate the frame slots, in shared memory if the decoder runs in another process.
+
+        Args:
+            shape (tuple[int, ...]): Frame shape, e.g. (height, width, channels).
+            capacity (int): Number of frame slots, at least 2.
+            buffered (bool): Deliver every frame in order instead of only the newest one.
+            shared (bool): Place the ring in shared memory for a decoder process.
+        """
+        self.shape, self.capacity, self.buffered = tuple(shape), max(capacity, 2), buffered
+        size = self.capacity * int(np.prod(self.shape)) + 24  # frames + (written, read, closed) int64 counters
+        self.shm = shared_memory.SharedMemory(create=True, size=size) if shared else None
+        self.cond = mp.get_context("spawn").Condition() if shared else threading.Condition()
+        self._map(self.shm.buf if shared else bytearray(size))
+        self.counters[:] = 0
+
+    def _map(self, buf):
+        """Create the slot and counter array views over a buffer."""
+        self.counters = np.ndarray(3, dtype=np.int64, buffer=buf)
+        self.slots = np.ndarray((self.capacity, *self.shape), dtype=np.uint8, buffer=buf, offset=24)
+
+    def __getstate__(self) -> dict:
+        """Pickle the ring for a decoder process by the name of its shared memory."""
+        if self.shm is None:
+            raise TypeError("Only rings created with shared=True can be passed to another process")
+        state = self.__dict__.copy()
+        del state["counters"], state["slots"]
+        state["shm"] = self.shm.name
+        return state
+
+    def __setstate__(self, state: dict):
+        """Attach to the shared memory of a pickled ring."""
+        self.__dict__.update(state)
+        try:
+            self.shm = shared_memory.SharedMemory(name=state["shm"], track=False)  # Python>=3.13, owner unlinks
+        except TypeError:
+            self.shm = shared_memory.SharedMemory(name=state["shm"])
+        self._map(self.shm.buf)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream has ended or the consumer has stopped."""
+        return bool(self.counters[2])
+
+    def reserve(self, timeout: float | None = None) -> np.ndarray | None:
+        """Return the slot to decode the next frame into, or None once closed or on timeout.
+
+        In buffered mode this waits until the consumer has read a slot when the ring is full.
+        """
+        with self.cond:
+            ok = self.cond.wait_for(
+                lambda: self.counters[2] or not self.buffered or self.counters[0] - self.counters[1] < self.capacity,
+                timeout,
+            )
+            return self.slots[self.counters[0] % self.capacity] if ok and not self.counters[2] else None
+
+    def commit(self):
+        """Publish the frame written to the reserved slot and wake the consumer."""
+        with self.cond:
+            self.counters[0] += 1
+            self.cond.notify_all()
+
+    def get(self, timeout: float | None = None, out: np.ndarray | None = None) -> np.ndarray | None:
+        """Return a copy of the oldest (buffered) or newest unread frame, or None if closed and drained, or on timeout.
+
+        Frames are copied out of the ring so that they stay valid after their slot is reused. Pass a preallocated `out`
+        array of the frame shape to copy into it instead of allocating a new array per frame.
+        """
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.counters[0] > self.counters[1] or self.counters[2], timeout):
+                return None
+            written, read = self.counters[:2]
+            if written == read:  # closed and drained
+                return None
+            read = read if self.buffered else written - 1  # skip to the newest frame
+            if out is None:
+                out = self.slots[read % self.capacity].copy()
+            else:
+                out[:] = self.slots[read % self.capacity]
+            self.counters[1] = read + 1
+            self.cond.notify_all()
+            return out
+
+    def close(self):
+        """Mark the stream as ended and wake all waiters."""
+        with self.cond:
+            self.counters[2] = 1
+            self.cond.notify_all()
+
+    def release(self):
+        """Free the shared memory, called by the owner once the decoder has stopped."""
+        if self.shm is not None:
+            self.counters = self.slots = None  # drop views before closing the buffer
+            self.shm.close()
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+            self.shm = None
+
+
+def decode_stream(
+    source: str | int,
+    ring: FrameRing,
+    cap: cv2.VideoCapture | None = None,
+    frames: float = float("inf"),
+    vid_stride: int = 1,
+    gray: bool = False,
+):
+    """Decode video stream frames into a ring until the stream ends or the ring is closed, then close the ring.
+
+    Runs in a decoder thread with an open capture, or as the target of a decoder process that opens the source itself.
+
+    Args:
+        source (str | int): Stream URL or webcam index, re-opened if the stream becomes unresponsive.
+        ring (FrameRing): Ring to decode frames into.
+        cap (cv2.VideoCapture, optional): Open capture of the source, opened and released here if None.
+        frames (float): Number of frames left to read from the stream, inf for live streams.
+        vid_stride (int): Video frame-rate stride.
+        gray (bool): Convert frames to single-channel grayscale.
+    """
+    own = cap is None
+    cap = cv2.VideoCapture(source) if own else cap
+    n = 0
+    while not ring.closed and cap.isOpened() and n < frames:
+        n += 1
+        cap.grab()  # .read() = .grab() followed by .retrieve()
+        if n % vid_stride:
+            continue
+        slot = ring.reserve()  # waits for a free slot in buffered mode
+        if slot is None:
+            break
+        success, im = cap.retrieve() if gray else cap.retrieve(slot)  # decode straight into the slot
+        if success and gray:
+            cv2.cvtColor(im, cv2.COLOR_BGR2GRAY, dst=slot[..., 0])
+        elif success and not np.shares_memory(im, slot):  # stream resolution changed
+            slot[:] = cv2.resize(im, slot.shape[1::-1]).reshape(slot.shape)
+        if not success:
+            slot[:] = 0
+            LOGGER.warning("Video stream unresponsive, please check your IP camera connection.")
+            cap.open(source)  # re-open stream if signal was lost
+        ring.commit()
+    if own:
+        cap.release()
+    ring.close()
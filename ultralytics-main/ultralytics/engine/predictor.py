@@ -38,6 +38,7 @@ from __future__ import annotations
 import platform
 import re
 import threading
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -48,6 +49,7 @@ import torch
 from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data import load_inference_source
 from ultralytics.data.augment import LetterBox
+from ultralytics.data.video import VideoWriter
 from ultralytics.nn.autobackend import AutoBackend
 from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
 from ultralytics.utils.checks import check_imgsz, check_imshow
@@ -81,7 +83,7 @@ class BasePredictor:
         data (dict): Data configuration.
         device (torch.device): Device used for prediction.
         dataset (Dataset): Dataset used for prediction.
-        vid_writer (dict[str, cv2.VideoWriter]): Dictionary of {save_path: video_writer} for saving video output.
+        vid_writer (dict[str, VideoWriter]): Dictionary of {save_path: video_writer} for saving video output.
         plotted_img (np.ndarray): Last plotted image.
         source_type (SimpleNamespace): Type of input source.
         seen (int): Number of images processed.
@@ -100,6 +102,7 @@ class BasePredictor:
         predict_cli: Run prediction for command line interface.
         setup_source: Set up input source and inference mode.
         stream_inference: Stream inference on input source.
+        batch_inference: Preprocess and run inference on dataset batches, pipelined on async backends.
         setup_model: Initialize and configure the model.
         write_results: Write inference results to files.
         save_predicted_images: Save prediction visualizations.
@@ -258,6 +261,8 @@ class BasePredictor:
             vid_stride=self.args.vid_stride,
             buffer=self.args.stream_buffer,
             channels=getattr(self.model, "ch", 3),
+            vid_backend=self.args.vid_backend,
+            stream_process=self.args.stream_process,
         )
         self.source_type = self.dataset.source_type
         if (
@@ -315,20 +320,11 @@ class BasePredictor:
                 ops.Profile(device=self.device),
             )
             self.run_callbacks("on_predict_start")
-            for self.batch in self.dataset:
-                self.run_callbacks("on_predict_batch_start")
+            for self.batch, im, preds in self.batch_inference(profilers, *args, **kwargs):
                 paths, im0s, s = self.batch
-
-                # Preprocess
-                with profilers[0]:
-                    im = self.preprocess(im0s)
-
-                # Inference
-                with profilers[1]:
-                    preds = self.inference(im, *args, **kwargs)
-                    if self.args.embed:
-                        yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
-                        continue
+                if self.args.embed:
+                    yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
+                    continue
 
                 # Postprocess
                 with profilers[2]:
@@ -359,7 +355,7 @@ class BasePredictor:
 
         # Release assets
         for v in self.vid_writer.values():
-            if isinstance(v, cv2.VideoWriter):
+            if isinstance(v, (cv2.VideoWriter, VideoWriter)):
                 v.release()
 
         if self.args.show:
@@ -378,6 +374,53 @@ class BasePredictor:
             LOGGER.info(f"Results saved to {colorstr('bold', self.save_dir)}{s}")
         self.run_callbacks("on_predict_end")
 
+    def batch_inference(self, profilers, *args, **kwargs):
+        """Preprocess and run inference on each dataset batch, yielding results in dataset order.
+
+        With an OpenVINO model loaded in throughput mode (`ov_async=True`), up to `ov_requests` batches are kept in
+        flight on the model's asynchronous infer request pool while the next batches are read and preprocessed. Batch
+        callbacks keep their order: `on_predict_batch_start` of a pipelined batch runs once the previous batch has been
+        yielded, just before its outputs are collected.
+
+        Args:
+            profilers (tuple[ops.Profile, ...]): Preprocess and inference profilers.
+            *args (Any): Additional arguments for the inference method.
+            **kwargs (Any): Additional keyword arguments for the inference method.
+
+        Yields:
+            batch (tuple): Dataset batch of (paths, im0s, s).
+            im (torch.Tensor): Preprocessed image tensor.
+            preds (torch.Tensor | list[torch.Tensor]): Raw model predictions.
+        """
+        pipelined = getattr(self.model, "ov_queue", None) is not None and not self.args.embed
+        pending = deque()  # (batch, im, jobs) in submission order
+        for batch in self.dataset:
+            self.batch = batch
+            if not pipelined:
+                self.run_callbacks("on_predict_batch_start")
+            with profilers[0]:
+                im = self.preprocess(batch[1])
+            if not pipelined:
+                with profilers[1]:
+                    preds = self.inference(im, *args, **kwargs)
+                yield batch, im, preds
+                continue
+
+            with profilers[1]:
+                pending.append((batch, im, self.model.submit(im)))
+            while pending and (len(pending) >= self.model.ov_requests or all(j.done() for j in pending[0][2])):
+                yield self._collect(*pending.popleft(), profilers[1])
+        while pending:  # drain batches still in flight
+            yield self._collect(*pending.popleft(), profilers[1])
+
+    def _collect(self, batch: tuple, im: torch.Tensor, jobs: list, profiler: ops.Profile) -> tuple:
+        """Start the callbacks of a pipelined batch and wait for its outputs, returning (batch, im, preds)."""
+        self.batch = batch
+        self.run_callbacks("on_predict_batch_start")
+        with profiler:
+            preds = self.model.collect(jobs)
+        return batch, im, preds
+
     def setup_model(self, model, verbose: bool = True):
         """Initialize YOLO model with given parameters and set it to evaluation mode.
 
@@ -393,6 +436,8 @@ class BasePredictor:
             fp16=self.args.half,
             fuse=True,
             verbose=verbose,
+            ort_options={k[4:]: v for k, v in self.args if k.startswith("ort_")},
+            ov_async=self.args.ov_async,
         )
 
         self.device = self.model.device  # update device
@@ -469,7 +514,7 @@ class BasePredictor:
                 if self.args.save_frames:
                     Path(frames_path).mkdir(parents=True, exist_ok=True)
                 suffix, fourcc = (".mp4", "avc1") if MACOS else (".avi", "WMV2") if WINDOWS else (".avi", "MJPG")
-                self.vid_writer[save_path] = cv2.VideoWriter(
+                self.vid_writer[save_path] = VideoWriter(  # encodes in a background thread
                     filename=str(Path(save_path).with_suffix(suffix)),
                     fourcc=cv2.VideoWriter_fourcc(*fourcc),
                     fps=fps,  # integer required, floats produce error in MP4 codec
@@ -8,7 +8,7 @@ Usage: See https://docs.ultralytics.com/modes/predict/
 from __future__ import annotations
 
 from copy import deepcopy
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -57,6 +57,8 @@ class BaseTensor(SimpleClass):
         assert isinstance(data, (torch.Tensor, np.ndarray)), "data must be torch.Tensor or np.ndarray"
         self.data = data
         self.orig_shape = orig_shape
+        self._batch = None  # BatchTensor this data is a view of, see BatchTensor.bind()
+        self._cpu = self._numpy = None  # memoized transfers
 
     @property
     def shape(self) -> tuple[int, ...]:
@@ -74,10 +76,15 @@ class BaseTensor(SimpleClass):
         return self.data.shape
 
     def cpu(self):
-        """Return a copy of the tensor stored in CPU memory.
+        """Return the tensor stored in CPU memory.
+
+        The transfer happens once and is memoized, so repeated calls return the same object and its cached properties
+        rather than a new copy each time. In-place changes to the returned data are therefore seen by later calls, use
+        `.clone()` on it for an independent copy. Data that is a view into a BatchTensor is cloned out of the
+        transferred batch, so a kept CPU tensor of one image does not hold on to the rest of the batch.
 
         Returns:
-            (BaseTensor): A new BaseTensor object with the data tensor moved to CPU memory.
+            (BaseTensor): A memoized BaseTensor object with the data tensor in CPU memory, self if it already is.
 
         Examples:
             >>> data = torch.tensor([[1, 2, 3], [4, 5, 6]]).cuda()
@@ -88,13 +95,24 @@ class BaseTensor(SimpleClass):
             >>> cpu_tensor.data.device
             device(type='cpu')
         """
-        return self if isinstance(self.data, np.ndarray) else self.__class__(self.data.cpu(), self.orig_shape)
+        if isinstance(self.data, np.ndarray) or self.data.device.type == "cpu":
+            return self
+        if self._cpu is None:  # transfer once, reusing a single copy of the whole batch when shared
+            if self._batch is not None:
+                data, self._batch = self._batch.to(self.data, "cpu").clone(), None  # own memory, batch not needed
+            else:
+                data = self.data.cpu()
+            self._cpu = self.__class__(data, self.orig_shape)
+        return self._cpu
 
     def numpy(self):
-        """Return a copy of the tensor as a numpy array.
+        """Return the tensor as a numpy array, moving it to CPU memory first if required.
+
+        The conversion is memoized and shares memory with the CPU tensor, so repeated calls return the same object
+        rather than a new copy each time. Use `.copy()` on the returned data for an independent array.
 
         Returns:
-            (np.ndarray): A numpy array containing the same data as the original tensor.
+            (BaseTensor): A memoized BaseTensor object with the data as a numpy array, self if it already is.
 
         Examples:
             >>> data = torch.tensor([[1, 2, 3], [4, 5, 6]])
@@ -104,7 +122,11 @@ class BaseTensor(SimpleClass):
             >>> print(type(numpy_array))
             <class 'numpy.ndarray'>
         """
-        return self if isinstance(self.data, np.ndarray) else self.__class__(self.data.numpy(), self.orig_shape)
+        if isinstance(self.data, np.ndarray):
+            return self
+        if self._numpy is None:
+            self._numpy = self.__class__(self.cpu().data.numpy(), self.orig_shape)
+        return self._numpy
 
     def cuda(self):
         """Move the tensor to GPU memory.
@@ -174,6 +196,69 @@ class BaseTensor(SimpleClass):
         return self.__class__(self.data[idx], self.orig_shape)
 
 
+class BatchTensor:
+    """Per-image views into one concatenated tensor that is moved between devices once for the whole batch.
+
+    Predictors build the Results of a batch from the views, then bind() them so that the first BaseTensor.cpu() call
+    on any image transfers the full batch with one copy and every other image reuses it.
+
+    Attributes:
+        data (torch.Tensor): Concatenated predictions for the whole batch.
+        views (list[torch.Tensor]): Per-image views into data.
+
+    Methods:
+        bind: Attach the batch to all tensors of the given Results that are views into it.
+        to: Return the equivalent of a view on another device, transferring the batch at most once per device.
+
+    Examples:
+        >>> batch = BatchTensor([torch.rand(3, 6), torch.rand(5, 6)])
+        >>> results = [Results(np.zeros((640, 640, 3)), path="", names={}, boxes=v) for v in batch.views]
+        >>> batch.bind(results)
+        >>> boxes = [r.boxes.cpu() for r in results]  # one device transfer
+    """
+
+    def __init__(self, tensors: list[torch.Tensor]) -> None:
+        """Concatenate per-image tensors into one batch tensor.
+
+        Args:
+            tensors (list[torch.Tensor]): Per-image tensors with matching trailing dimensions.
+        """
+        self.data = torch.cat(tensors)
+        self.views = list(self.data.split([len(x) for x in tensors]))
+        self._copies = {}  # device -> transferred batch
+
+    def bind(self, results: list[Results]) -> None:
+        """Attach the batch to all tensors of the given Results that are views into it.
+
+        Args:
+            results (list[Results]): Results constructed from the views of this batch.
+        """
+        ptr = self.data.untyped_storage().data_ptr()
+        for r in results:
+            for k in r._keys:
+                v = getattr(r, k)
+                if isinstance(v, BaseTensor) and isinstance(v.data, torch.Tensor):
+                    if v.data.untyped_storage().data_ptr() == ptr:
+                        v._batch = self
+
+    def to(self, view: torch.Tensor, device: str | torch.device) -> torch.Tensor:
+        """Return the equivalent of a view into the batch on another device.
+
+        Args:
+            view (torch.Tensor): View into data, i.e. the boxes of one image.
+            device (str | torch.device): Target device.
+
+        Returns:
+            (torch.Tensor): View with the same shape, strides and offset into the transferred batch.
+        """
+        key = str(device)
+        if key not in self._copies:
+            self._copies[key] = self.data.to(device)
+        data = self._copies[key]
+        offset = data.storage_offset() + view.storage_offset() - self.data.storage_offset()
+        return data.as_strided(view.shape, view.stride(), offset)
+
+
 class Results(SimpleClass, DataExportMixin):
     """A class for storing and manipulating inference results.
 
@@ -265,6 +350,13 @@ class Results(SimpleClass, DataExportMixin):
         self.path = path
         self.save_dir = None
         self._keys = "boxes", "masks", "probs", "keypoints", "obb"
+        self._applied = {}  # memoized cpu() and numpy() copies
+
+    def __setattr__(self, name: str, value):
+        """Set an attribute, dropping the memoized cpu() and numpy() copies when prediction data is replaced."""
+        if name in {"boxes", "masks", "probs", "keypoints", "obb"}:
+            super().__setattr__("_applied", {})
+        super().__setattr__(name, value)
 
     def __getitem__(self, idx):
         """Return a Results object for a specific index of inference results.
@@ -363,26 +455,30 @@ class Results(SimpleClass, DataExportMixin):
         return r
 
     def cpu(self):
-        """Return a copy of the Results object with all its tensors moved to CPU memory.
+        """Return the Results object with all its tensors moved to CPU memory.
 
-        This method creates a new Results object with all tensor attributes (boxes, masks, probs, keypoints, obb)
-        transferred to CPU memory. It's useful for moving data from GPU to CPU for further processing or saving.
+        The first call creates a new Results object with all tensor attributes (boxes, masks, probs, keypoints, obb)
+        transferred to CPU memory. It's useful for moving data from GPU to CPU for further processing or saving. The
+        result is memoized until the next update() or assignment of a result attribute, so repeated calls return the
+        same object instead of transferring again, and in-place changes to it are seen by later calls.
 
         Returns:
-            (Results): A new Results object with all tensor attributes on CPU memory.
+            (Results): A memoized Results object with all tensor attributes on CPU memory.
 
         Examples:
             >>> results = model("path/to/image.jpg")  # Perform inference
             >>> cpu_result = results[0].cpu()  # Move the first result to CPU
             >>> print(cpu_result.boxes.device)  # Output: cpu
         """
-        return self._apply("cpu")
+        if "cpu" not in self._applied:
+            self._applied["cpu"] = self._apply("cpu")
+        return self._applied["cpu"]
 
     def numpy(self):
         """Convert all tensors in the Results object to numpy arrays.
 
         Returns:
-            (Results): A new Results object with all tensors converted to numpy arrays.
+            (Results): A memoized Results object with all tensors converted to numpy arrays.
 
         Examples:
             >>> results = model("path/to/image.jpg")
@@ -391,10 +487,14 @@ class Results(SimpleClass, DataExportMixin):
             <class 'numpy.ndarray'>
 
         Notes:
-            This method creates a new Results object, leaving the original unchanged. It's useful for
-            interoperability with numpy-based libraries or when CPU-based operations are required.
+            The first call creates a new Results object, leaving the original unchanged. It's useful for
+            interoperability with numpy-based libraries or when CPU-based operations are required. The result is
+            memoized until the next update() or assignment of a result attribute, so repeated calls return the same
+            object rather than a new copy, and in-place changes to its arrays are seen by later calls.
         """
-        return self._apply("numpy")
+        if "numpy" not in self._applied:
+            self._applied["numpy"] = self._apply("numpy")
+        return self._applied["numpy"]
 
     def cuda(self):
         """Move all tensors in the Results object to GPU memory.
@@ -463,6 +563,9 @@ class Results(SimpleClass, DataExportMixin):
     ) -> np.ndarray:
         """Plot detection results on an input RGB image.
 
+        Box labels are drawn after all boxes, so where boxes overlap a label stays on top of the box lines of
+        lower-confidence detections instead of being partly covered by them.
+
         Args:
             conf (bool): Whether to plot detection confidence scores.
             line_width (float | None): Line width of bounding boxes. If None, scaled to image size.
@@ -532,15 +635,16 @@ class Results(SimpleClass, DataExportMixin):
 
         # Plot Detect results
         if pred_boxes is not None and show_boxes:
-            for i, d in enumerate(reversed(pred_boxes)):
-                c, d_conf, id = int(d.cls), float(d.conf) if conf else None, int(d.id.item()) if d.is_track else None
+            n = len(pred_boxes)
+            cls, confs = pred_boxes.cls.tolist()[::-1], pred_boxes.conf.tolist()[::-1]
+            ids = pred_boxes.id.tolist()[::-1] if pred_boxes.is_track else [None] * n
+            box_labels, box_colors = [], []
+            for i, (c, d_conf, id) in enumerate(zip(cls, confs, ids)):
+                c, id = int(c), None if id is None else int(id)
                 name = ("" if id is None else f"id:{id} ") + names[c]
-                label = (f"{name} {d_conf:.2f}" if conf else name) if labels else None
-                box = d.xyxyxyxy.squeeze() if is_obb else d.xyxy.squeeze()
-                annotator.box_label(
-                    box,
-                    label,
-                    color=colors(
+                box_labels.append((f"{name} {d_conf:.2f}" if conf else name) if labels else None)
+                box_colors.append(
+                    colors(
                         c
                         if color_mode == "class"
                         else id
@@ -549,8 +653,11 @@ class Results(SimpleClass, DataExportMixin):
                         if color_mode == "instance"
                         else None,
                         True,
-                    ),
+                    )
                 )
+            xy = pred_boxes.xyxyxyxy if is_obb else pred_boxes.xyxy
+            xy = xy.cpu().numpy() if isinstance(xy, torch.Tensor) else xy
+            annotator.box_labels(xy[::-1], box_labels, box_colors)
 
         # Plot Classify results
         if pred_probs is not None and show_probs:
@@ -941,8 +1048,7 @@ class Boxes(BaseTensor):
         """
         return self.data[:, -3] if self.is_track else None
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xywh(self) -> torch.Tensor | np.ndarray:
         """Convert bounding boxes from [x1, y1, x2, y2] format to [x, y, width, height] format.
 
@@ -960,8 +1066,7 @@ class Boxes(BaseTensor):
         """
         return ops.xyxy2xywh(self.xyxy)
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyn(self) -> torch.Tensor | np.ndarray:
         """Return normalized bounding box coordinates relative to the original image size.
 
@@ -983,8 +1088,7 @@ class Boxes(BaseTensor):
         xyxy[..., [1, 3]] /= self.orig_shape[0]
         return xyxy
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xywhn(self) -> torch.Tensor | np.ndarray:
         """Return normalized bounding boxes in [x, y, width, height] format.
 
@@ -1002,7 +1106,7 @@ class Boxes(BaseTensor):
             >>> print(normalized)
             tensor([[0.1953, 0.1562, 0.0781, 0.1042]])
         """
-        xywh = ops.xyxy2xywh(self.xyxy)
+        xywh = self.xywh.clone() if isinstance(self.xywh, torch.Tensor) else np.copy(self.xywh)
         xywh[..., [0, 2]] /= self.orig_shape[1]
         xywh[..., [1, 3]] /= self.orig_shape[0]
         return xywh
@@ -1045,8 +1149,7 @@ class Masks(BaseTensor):
             masks = masks[None, :]
         super().__init__(masks, orig_shape)
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xyn(self) -> list[np.ndarray]:
         """Return normalized xy-coordinates of the segmentation masks.
 
@@ -1069,8 +1172,7 @@ class Masks(BaseTensor):
             for x in ops.masks2segments(self.data)
         ]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xy(self) -> list[np.ndarray]:
         """Return the [x, y] pixel coordinates for each segment in the mask tensor.
 
@@ -1142,8 +1244,7 @@ class Keypoints(BaseTensor):
         super().__init__(keypoints, orig_shape)
         self.has_visible = self.data.shape[-1] == 3
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xy(self) -> torch.Tensor | np.ndarray:
         """Return x, y coordinates of keypoints.
 
@@ -1165,8 +1266,7 @@ class Keypoints(BaseTensor):
         """
         return self.data[..., :2]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xyn(self) -> torch.Tensor | np.ndarray:
         """Return normalized coordinates (x, y) of keypoints relative to the original image size.
 
@@ -1186,8 +1286,7 @@ class Keypoints(BaseTensor):
         xy[..., 1] /= self.orig_shape[0]
         return xy
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def conf(self) -> torch.Tensor | np.ndarray | None:
         """Return confidence values for each keypoint.
 
@@ -1249,8 +1348,7 @@ class Probs(BaseTensor):
         """
         super().__init__(probs, orig_shape)
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top1(self) -> int:
         """Return the index of the class with the highest probability.
 
@@ -1264,8 +1362,7 @@ class Probs(BaseTensor):
         """
         return int(self.data.argmax())
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top5(self) -> list[int]:
         """Return the indices of the top 5 class probabilities.
 
@@ -1279,8 +1376,7 @@ class Probs(BaseTensor):
         """
         return (-self.data).argsort(0)[:5].tolist()  # this way works with both torch and numpy.
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top1conf(self) -> torch.Tensor | np.ndarray:
         """Return the confidence score of the highest probability class.
 
@@ -1298,8 +1394,7 @@ class Probs(BaseTensor):
         """
         return self.data[self.top1]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top5conf(self) -> torch.Tensor | np.ndarray:
         """Return confidence scores for the top 5 classification predictions.
 
@@ -1446,8 +1541,7 @@ class OBB(BaseTensor):
         """
         return self.data[:, -3] if self.is_track else None
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyxyxy(self) -> torch.Tensor | np.ndarray:
         """Convert OBB format to 8-point (xyxyxyxy) coordinate format for rotated bounding boxes.
 
@@ -1464,8 +1558,7 @@ class OBB(BaseTensor):
         """
         return ops.xywhr2xyxyxyxy(self.xywhr)
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyxyxyn(self) -> torch.Tensor | np.ndarray:
         """Convert rotated bounding boxes to normalized xyxyxyxy format.
 
@@ -1485,8 +1578,7 @@ class OBB(BaseTensor):
         xyxyxyxyn[..., 1] /= self.orig_shape[0]
         return xyxyxyxyn
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxy(self) -> torch.Tensor | np.ndarray:
         """Convert oriented bounding boxes (OBB) to axis-aligned bounding boxes in xyxy format.
 
@@ -22,10 +22,12 @@ import numpy as np
 import torch
 from torch import distributed as dist
 from torch import nn, optim
+from torch.utils.data import RandomSampler
 
 from ultralytics import __version__
 from ultralytics.cfg import get_cfg, get_save_dir
-from ultralytics.data.utils import check_cls_dataset, check_det_dataset
+from ultralytics.data import BaseDataset, StratifiedSubset, build_dataloader
+from ultralytics.data.utils import DataProfiler, check_cls_dataset, check_det_dataset
 from ultralytics.nn.tasks import load_checkpoint
 from ultralytics.utils import (
     DEFAULT_CFG,
@@ -47,13 +49,14 @@ from ultralytics.utils.files import get_latest_run
 from ultralytics.utils.plotting import plot_results
 from ultralytics.utils.torch_utils import (
     TORCH_2_4,
+    CheckpointWriter,
     EarlyStopping,
     ModelEMA,
     attempt_compile,
     autocast,
-    convert_optimizer_state_dict_to_fp16,
     init_seeds,
     one_cycle,
+    optimizer_state_dict_to_cpu,
     select_device,
     strip_optimizer,
     torch_distributed_zero_first,
@@ -78,6 +81,7 @@ class BaseTrainer:
         last (Path): Path to the last checkpoint.
         best (Path): Path to the best checkpoint.
         save_period (int): Save checkpoint every x epochs (disabled if < 1).
+        checkpoint_writer (CheckpointWriter): Background writer of checkpoint files.
         batch_size (int): Batch size for training.
         epochs (int): Number of epochs to train for.
         start_epoch (int): Starting epoch for training.
@@ -91,6 +95,12 @@ class BaseTrainer:
         scheduler (torch.optim.lr_scheduler._LRScheduler): Learning rate scheduler.
         best_fitness (float): The best fitness value achieved.
         fitness (float): Current fitness value.
+        val_subset_loader (DataLoader | None): Loader of the stratified val subset validated each epoch if
+            `val_fraction` < 1.
+        subset_gaps (list[float]): Subset minus full fitness at epochs validated on both, i.e. the subset noise.
+        data_profiler (DataProfiler | None): Profiler of the first `data_profile` train batches, None once reported.
+        data_profile_logged (bool): Whether the current data profile has been logged.
+        data_tuned (bool): Whether the train loader has been retuned from a data profile.
         loss (float): Current loss value.
         tloss (float): Total loss value.
         loss_names (list): List of loss names.
@@ -101,7 +111,7 @@ class BaseTrainer:
     Methods:
         train: Execute the training process.
         validate: Run validation on the test set.
-        save_model: Save model training checkpoints.
+        save_model: Snapshot training state and queue it to be written as checkpoints.
         get_dataset: Get train and validation datasets.
         setup_model: Load, create, or download model.
         build_optimizer: Construct an optimizer for the model.
@@ -146,6 +156,7 @@ class BaseTrainer:
             YAML.save(self.save_dir / "args.yaml", args_dict)  # save run args
         self.last, self.best = self.wdir / "last.pt", self.wdir / "best.pt"  # checkpoint paths
         self.save_period = self.args.save_period
+        self.checkpoint_writer = CheckpointWriter()
 
         self.batch_size = self.args.batch
         self.epochs = self.args.epochs or 100  # in case users accidentally pass epochs=None with timed training
@@ -171,6 +182,11 @@ class BaseTrainer:
         # Epoch level metrics
         self.best_fitness = None
         self.fitness = None
+        self.val_subset_loader = None
+        self.subset_best_fitness = None  # best subset fitness at fully validated epochs
+        self.subset_gaps = []
+        self.data_profiler = None
+        self.data_profile_logged = self.data_tuned = False
         self.loss = None
         self.tloss = None
         self.loss_names = ["Loss"]
@@ -330,6 +346,22 @@ class BaseTrainer:
             rank=LOCAL_RANK,
             mode="val",
         )
+        if self.args.val_fraction < 1.0:
+            if isinstance(self.test_loader.dataset, BaseDataset):
+                subset = StratifiedSubset(self.test_loader.dataset, self.args.val_fraction, seed=self.args.seed)
+                self.val_subset_loader = build_dataloader(
+                    subset, self.test_loader.batch_size, self.test_loader.num_workers, shuffle=False, rank=LOCAL_RANK
+                )
+                LOGGER.info(
+                    f"{colorstr('val: ')}Validating a stratified subset of {len(subset)}/{len(subset.dataset)} images "
+                    f"each epoch and the full set every {self.args.val_period} epochs or on subset improvement"
+                )
+            else:
+                LOGGER.warning(f"val_fraction={self.args.val_fraction} is not supported for {self.args.task}, ignoring")
+        if self.args.data_profile > 0:
+            self.data_profiler = DataProfiler(self.args.data_profile)
+            self.train_loader.dataset.profile = True  # read by workers on start, see seed_worker()
+            self.train_loader.reset()
         self.validator = self.get_validator()
         self.ema = ModelEMA(self.model)
         if RANK in {-1, 0}:
@@ -391,15 +423,16 @@ class BaseTrainer:
             self._model_train()
             if RANK != -1:
                 self.train_loader.sampler.set_epoch(epoch)
-            pbar = enumerate(self.train_loader)
             # Update dataloader attributes (optional)
             if epoch == (self.epochs - self.args.close_mosaic):
                 self._close_dataloader_mosaic()
                 self.train_loader.reset()
 
+            loader = self.data_profiler(self.train_loader) if self.data_profiler else self.train_loader
+            pbar = enumerate(loader)
             if RANK in {-1, 0}:
                 LOGGER.info(self.progress_string())
-                pbar = TQDM(enumerate(self.train_loader), total=nb)
+                pbar = TQDM(enumerate(loader), total=nb)
             self.tloss = None
             for i, batch in pbar:
                 self.run_callbacks("on_train_batch_start")
@@ -465,6 +498,9 @@ class BaseTrainer:
 
                 self.run_callbacks("on_train_batch_end")
 
+            if self.data_profiler and not self.data_profile_logged:
+                if self.data_profiler.done or epoch + 1 >= self.epochs or self.stop:
+                    self._report_data_profile()
             self.lr = {f"lr/pg{ir}": x["lr"] for ir, x in enumerate(self.optimizer.param_groups)}  # for loggers
 
             self.run_callbacks("on_train_epoch_end")
@@ -475,7 +511,9 @@ class BaseTrainer:
             final_epoch = epoch + 1 >= self.epochs
             if self.args.val or final_epoch or self.stopper.possible_stop or self.stop:
                 self._clear_memory(threshold=0.5)  # prevent VRAM spike
-                self.metrics, self.fitness = self.validate()
+                self.metrics, self.fitness = self.validate(
+                    subset=not (final_epoch or self.stopper.possible_stop or self.stop)
+                )
 
             # NaN recovery
             if self._handle_nan_recovery(epoch):
@@ -582,21 +620,26 @@ class BaseTrainer:
                 m.eval()
 
     def save_model(self):
-        """Save model training checkpoints with additional metadata."""
-        import io
+        """Save model training checkpoints with additional metadata.
 
-        # Serialize ckpt to a byte buffer once (faster than repeated torch.save() calls)
-        buffer = io.BytesIO()
-        torch.save(
+        The training state is copied to CPU here and serialized and written by `self.checkpoint_writer` in the
+        background, call `self.checkpoint_writer.wait()` before reading the checkpoint files.
+        """
+        files = [self.last]  # save last.pt
+        if self.best_fitness == self.fitness:
+            files.append(self.best)  # save best.pt, a hard link to last.pt
+        if (self.save_period > 0) and (self.epoch % self.save_period == 0):
+            files.append(self.wdir / f"epoch{self.epoch}.pt")  # save epoch, i.e. 'epoch3.pt'
+        self.checkpoint_writer.save(
             {
                 "epoch": self.epoch,
                 "best_fitness": self.best_fitness,
                 "model": None,  # resume and final checkpoints derive from EMA
-                "ema": deepcopy(unwrap_model(self.ema.ema)).half(),
+                "ema": deepcopy(unwrap_model(self.ema.ema)).half().cpu(),
                 "updates": self.ema.updates,
-                "optimizer": convert_optimizer_state_dict_to_fp16(deepcopy(self.optimizer.state_dict())),
+                "optimizer": optimizer_state_dict_to_cpu(self.optimizer),
                 "scaler": self.scaler.state_dict(),
-                "train_args": vars(self.args),  # save as dict
+                "train_args": dict(vars(self.args)),  # save as dict
                 "train_metrics": {**self.metrics, **{"fitness": self.fitness}},
                 "train_results": self.read_results_csv(),
                 "date": datetime.now().isoformat(),
@@ -610,17 +653,8 @@ class BaseTrainer:
                 "license": "AGPL-3.0 (https://ultralytics.com/license)",
                 "docs": "https://docs.ultralytics.com",
             },
-            buffer,
+            files,
         )
-        serialized_ckpt = buffer.getvalue()  # get the serialized content to save
-
-        # Save checkpoints
-        self.wdir.mkdir(parents=True, exist_ok=True)  # ensure weights directory exists
-        self.last.write_bytes(serialized_ckpt)  # save last.pt
-        if self.best_fitness == self.fitness:
-            self.best.write_bytes(serialized_ckpt)  # save best.pt
-        if (self.save_period > 0) and (self.epoch % self.save_period == 0):
-            (self.wdir / f"epoch{self.epoch}.pt").write_bytes(serialized_ckpt)  # save epoch, i.e. 'epoch3.pt'
 
     def get_dataset(self):
         """Get train and validation datasets from data dictionary.
@@ -690,9 +724,18 @@ class BaseTrainer:
         """Allow custom preprocessing model inputs and ground truths depending on task type."""
         return batch
 
-    def validate(self):
+    def validate(self, subset: bool = False):
         """Run validation on val set using self.validator.
 
+        With `val_fraction` < 1, the fixed stratified subset is validated first. Unless `subset` is False, the full set
+        is then only validated every `val_period` epochs, when the subset fitness is not finite, or when it exceeds the
+        subset fitness of the best fully validated epochs by more than `val_margin` or the measured subset noise,
+        whichever is larger. Subset-only epochs return None fitness, so best.pt and early stopping use full results,
+        and their metrics are tagged with `metrics/val_subset` = 1 (0 for full validations) in results.csv and loggers.
+
+        Args:
+            subset (bool): Whether this epoch may be validated on the subset only.
+
         Returns:
             metrics (dict): Dictionary of validation metrics.
             fitness (float): Fitness score for the validation.
@@ -701,14 +744,132 @@ class BaseTrainer:
             # Sync EMA buffers from rank 0 to all ranks
             for buffer in self.ema.ema.buffers():
                 dist.broadcast(buffer, src=0)
-        metrics = self.validator(self)
+        subset_fitness = None
+        if self.val_subset_loader is not None:
+            self.validator.dataloader = self.val_subset_loader
+            try:
+                metrics, subset_fitness = self._run_validator()
+            finally:
+                self.validator.dataloader = self.test_loader
+            full = not subset or self._full_val_due(subset_fitness)
+            if self.world_size > 1:  # all ranks must take the same branch
+                broadcast_list = [full if RANK == 0 else None]
+                dist.broadcast_object_list(broadcast_list, 0)
+                full = broadcast_list[0]
+            if not full:
+                return (None if metrics is None else {**metrics, "metrics/val_subset": 1.0}), None
+        metrics, fitness = self._run_validator()
         if metrics is None:
             return None, None
-        fitness = metrics.pop("fitness", -self.loss.detach().cpu().numpy())  # use loss as fitness measure if not found
+        if self.val_subset_loader is not None:
+            metrics["metrics/val_subset"] = 0.0  # same columns every epoch, full-set results
+        if subset_fitness is not None:
+            self._update_subset_noise(subset_fitness, fitness)
         if not self.best_fitness or self.best_fitness < fitness:
             self.best_fitness = fitness
         return metrics, fitness
 
+    def _run_validator(self):
+        """Run self.validator on its current dataloader and return metrics and fitness."""
+        metrics = self.validator(self)
+        if metrics is None:
+            return None, None
+        fitness = metrics.pop("fitness", -self.loss.detach().cpu().numpy())  # use loss as fitness measure if not found
+        return metrics, fitness
+
+    def _full_val_due(self, subset_fitness):
+        """Return whether the full val set should be validated after a subset validation with `subset_fitness`."""
+        if subset_fitness is None or not np.isfinite(subset_fitness) or self.subset_best_fitness is None:
+            return True
+        if self.args.val_period > 0 and (self.epoch + 1) % self.args.val_period == 0:
+            return True
+        noise = float(np.std(self.subset_gaps)) if len(self.subset_gaps) > 1 else 0.0
+        margin = max(self.args.val_margin, noise)
+        if subset_fitness > self.subset_best_fitness + margin:
+            return True
+        LOGGER.info(
+            f"{colorstr('val: ')}subset fitness {subset_fitness:.4f} within {margin:.4f} of best "
+            f"{self.subset_best_fitness:.4f}, skipping full validation"
+        )
+        return False
+
+    def _update_subset_noise(self, subset_fitness, fitness):
+        """Record the gap between subset and full fitness of one epoch and log the subset noise."""
+        self.subset_gaps.append(float(subset_fitness - fitness))
+        if self.subset_best_fitness is None or subset_fitness > self.subset_best_fitness:
+            self.subset_best_fitness = float(subset_fitness)
+        gaps = np.array(self.subset_gaps)
+        LOGGER.info(
+            f"{colorstr('val: ')}subset fitness {subset_fitness:.4f}, full {fitness:.4f}, subset noise "
+            f"{gaps.mean():+.4f} ± {gaps.std():.4f} over {len(gaps)} full validations"
+        )
+
+    def _report_data_profile(self):
+        """Log the dataloader profile and, with `data_autotune`, rebuild the train loader from its suggestions.
+
+        Unless a rebuilt loader is being profiled next, profiling is switched off and the train loader workers are
+        restarted so that they stop timing their stages.
+        """
+        LOGGER.info(self.data_profiler.summary())
+        self.data_profile_logged = True
+        if self.args.data_autotune and not self.data_tuned and self._autotune_data():
+            return
+        self.data_profiler = None
+        self.train_loader.dataset.profile = False
+        if self.epoch + 1 < self.epochs and not self.stop:
+            self.train_loader.reset()  # restart workers without stage timing
+
+    def _autotune_data(self):
+        """Rebuild the train loader from the profiler suggestions and return whether a new loader is being profiled."""
+        self.data_tuned = True
+        prefix = colorstr("data_autotune: ")
+        if self.device.type == "cpu":  # workers=0 on CPU leaves all cores to the model
+            LOGGER.info(f"{prefix}skipped on CPU")
+            return False
+        suggestion = self.data_profiler.suggest(max_workers=os.cpu_count() // max(torch.cuda.device_count(), 1))
+        if suggestion is None:
+            LOGGER.info(f"{prefix}too few batches profiled, increase data_profile")
+            return False
+        loader, (workers, prefetch) = self.train_loader, suggestion
+        pin_memory = self.device.type == "cuda" and self._pinned_copy_faster(loader.batch_size)
+        old = (loader.num_workers, loader.prefetch_factor or 0, loader.pin_memory)
+        if (workers, prefetch, pin_memory) == old:
+            LOGGER.info(f"{prefix}keeping workers={workers}, prefetch_factor={prefetch}, pin_memory={pin_memory}")
+            return False
+        shuffle = isinstance(loader.sampler, RandomSampler) or getattr(loader.sampler, "shuffle", False)
+        self.train_loader = build_dataloader(
+            loader.dataset,
+            loader.batch_size,
+            workers,
+            shuffle=shuffle,
+            rank=LOCAL_RANK,
+            drop_last=loader.drop_last,
+            pin_memory=pin_memory,
+            prefetch_factor=prefetch,
+        )
+        del loader  # terminate previous workers
+        LOGGER.info(
+            f"{prefix}workers {old[0]}->{workers}, prefetch_factor {old[1]}->{prefetch}, pin_memory "
+            f"{old[2]}->{pin_memory}, profiling the new loader"
+        )
+        self.data_profiler = DataProfiler(self.args.data_profile)
+        self.data_profile_logged = False
+        return True
+
+    def _pinned_copy_faster(self, batch_size):
+        """Return whether pinning a uint8 train batch and copying it asynchronously costs the host less than a copy."""
+        x = torch.zeros((batch_size, 3, self.args.imgsz, self.args.imgsz), dtype=torch.uint8)
+        times = []
+        for pin in (False, True):
+            x.to(self.device, non_blocking=pin)  # warmup
+            torch.cuda.synchronize(self.device)
+            t = time.perf_counter()
+            for _ in range(3):
+                (x.pin_memory() if pin else x).to(self.device, non_blocking=pin)
+            times.append(time.perf_counter() - t)
+            torch.cuda.synchronize(self.device)
+        return times[1] < times[0]
+
     def get_model(self, cfg=None, weights=None, verbose=True):
         """Get model and raise NotImplementedError for loading cfg files."""
         raise NotImplementedError("This task trainer doesn't support loading cfg files")
@@ -775,6 +936,7 @@ class BaseTrainer:
 
     def final_eval(self):
         """Perform final evaluation and validation for object detection YOLO model."""
+        self.checkpoint_writer.wait()
         model = self.best if self.best.exists() else None
         with torch_distributed_zero_first(LOCAL_RANK):  # strip only on GPU 0; other GPUs should wait
             if RANK in {-1, 0}:
@@ -858,6 +1020,7 @@ class BaseTrainer:
             corrupted = broadcast_list[0]
         if not corrupted:
             return False
+        self.checkpoint_writer.wait()
         if epoch == self.start_epoch or not self.last.exists():
             LOGGER.warning(f"{reason} detected but can not recover from last.pt...")
             return False  # Cannot recover on first epoch, let training continue
@@ -162,6 +162,8 @@ class BaseValidator:
                 dnn=self.args.dnn,
                 data=self.args.data,
                 fp16=self.args.half,
+                ort_options={k[4:]: v for k, v in self.args if k.startswith("ort_")},
+                ov_async=self.args.ov_async,
             )
             self.device = model.device  # update device
             self.args.half = model.fp16  # update half
@@ -268,42 +270,47 @@ class BaseValidator:
     ) -> torch.Tensor:
         """Match predictions to ground truth objects using IoU.
 
+        The greedy matching runs on the device of `iou` for all IoU thresholds at once: every prediction is assigned its
+        highest-IoU target of the same class, and each target keeps the first (highest confidence) prediction assigned
+        to it. Leading batch dimensions are supported for padded batches, where padded predictions and targets must use
+        class values that never match each other (e.g. -1 and -2).
+
         Args:
-            pred_classes (torch.Tensor): Predicted class indices of shape (N,).
-            true_classes (torch.Tensor): Target class indices of shape (M,).
-            iou (torch.Tensor): An NxM tensor containing the pairwise IoU values for predictions and ground truth.
-            use_scipy (bool, optional): Whether to use scipy for matching (more precise).
+            pred_classes (torch.Tensor): Predicted class indices of shape (..., N).
+            true_classes (torch.Tensor): Target class indices of shape (..., M).
+            iou (torch.Tensor): An (..., M, N) tensor containing the pairwise IoU values for ground truth and
+                predictions.
+            use_scipy (bool, optional): Whether to use scipy for matching (more precise), unbatched inputs only.
 
         Returns:
-            (torch.Tensor): Correct tensor of shape (N, 10) for 10 IoU thresholds.
+            (torch.Tensor): Correct tensor of shape (..., N, 10) for 10 IoU thresholds.
         """
-        # Dx10 matrix, where D - detections, 10 - IoU thresholds
-        correct = np.zeros((pred_classes.shape[0], self.iouv.shape[0])).astype(bool)
         # LxD matrix where L - labels (rows), D - detections (columns)
-        correct_class = true_classes[:, None] == pred_classes
+        correct_class = true_classes[..., :, None] == pred_classes[..., None, :]
         iou = iou * correct_class  # zero out the wrong classes
-        iou = iou.cpu().numpy()
-        for i, threshold in enumerate(self.iouv.cpu().tolist()):
-            if use_scipy:
-                # WARNING: known issue that reduces mAP in https://github.com/ultralytics/ultralytics/pull/4708
-                import scipy  # scope import to avoid importing for all commands
-
+        iouv = self.iouv.to(iou.device)
+        if use_scipy:
+            # WARNING: known issue that reduces mAP in https://github.com/ultralytics/ultralytics/pull/4708
+            import scipy  # scope import to avoid importing for all commands
+
+            # Dx10 matrix, where D - detections, 10 - IoU thresholds
+            correct = np.zeros((pred_classes.shape[0], iouv.shape[0])).astype(bool)
+            iou = iou.cpu().numpy()
+            for i, threshold in enumerate(iouv.tolist()):
                 cost_matrix = iou * (iou >= threshold)
                 if cost_matrix.any():
                     labels_idx, detections_idx = scipy.optimize.linear_sum_assignment(cost_matrix)
                     valid = cost_matrix[labels_idx, detections_idx] > 0
                     if valid.any():
                         correct[detections_idx[valid], i] = True
-            else:
-                matches = np.nonzero(iou >= threshold)  # IoU > threshold and classes match
-                matches = np.array(matches).T
-                if matches.shape[0]:
-                    if matches.shape[0] > 1:
-                        matches = matches[iou[matches[:, 0], matches[:, 1]].argsort()[::-1]]
-                        matches = matches[np.unique(matches[:, 1], return_index=True)[1]]
-                        matches = matches[np.unique(matches[:, 0], return_index=True)[1]]
-                    correct[matches[:, 1].astype(int), i] = True
-        return torch.tensor(correct, dtype=torch.bool, device=pred_classes.device)
+            return torch.tensor(correct, dtype=torch.bool, device=pred_classes.device)
+        if iou.shape[-2] == 0:
+            return torch.zeros((*iou.shape[:-2], iou.shape[-1], iouv.shape[0]), dtype=torch.bool, device=iou.device)
+        best, label = iou.max(-2)  # best target for each detection, (..., D)
+        candidate = best[..., None] >= iouv  # (..., D, 10)
+        # A detection loses its target to any earlier (higher confidence) candidate assigned the same target
+        earlier = (label[..., :, None] == label[..., None, :]).tril(-1).float()  # (..., D, D)
+        return candidate & ~(earlier @ candidate.float()).bool()
 
     def add_callback(self, event: str, callback):
         """Append the given callback to the specified event."""
@@ -1,9 +1,36 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-from .fastsam import FastSAM
-from .nas import NAS
-from .rtdetr import RTDETR
-from .sam import SAM
-from .yolo import YOLO, YOLOE, YOLOWorld
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = "NAS", "RTDETR", "SAM", "YOLO", "YOLOE", "FastSAM", "YOLOWorld"  # allow simpler import
+__all__ = "NAS", "RTDETR", "SAM", "YOLO", "YOLOE", "FastSAM", "YOLOWorld"
+
+_LAZY = {  # attribute: submodule, imported on first access
+    "FastSAM": ".fastsam",
+    "NAS": ".nas",
+    "RTDETR": ".rtdetr",
+    "SAM": ".sam",
+    "YOLO": ".yolo",
+    "YOLOE": ".yolo",
+    "YOLOWorld": ".yolo",
+}
+
+if TYPE_CHECKING:
+    # Enable hints for type checkers
+    from .fastsam import FastSAM  # noqa
+    from .nas import NAS  # noqa
+    from .rtdetr import RTDETR  # noqa
+    from .sam import SAM  # noqa
+    from .yolo import YOLO, YOLOE, YOLOWorld  # noqa
+
+
+def __getattr__(name: str):
+    """Lazy-import model families on first access."""
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+def __dir__():
+    """Extend dir() to include lazily available names for IDE autocompletion."""
+    return sorted(set(globals()) | set(_LAZY))
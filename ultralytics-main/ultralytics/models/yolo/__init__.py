@@ -1,7 +1,37 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-from ultralytics.models.yolo import classify, detect, obb, pose, segment, world, yoloe
-
-from .model import YOLO, YOLOE, YOLOWorld
+import importlib
+from typing import TYPE_CHECKING
 
 __all__ = "YOLO", "YOLOE", "YOLOWorld", "classify", "detect", "obb", "pose", "segment", "world", "yoloe"
+
+_LAZY = {  # attribute: submodule, imported on first access
+    "YOLO": ".model",
+    "YOLOE": ".model",
+    "YOLOWorld": ".model",
+    "classify": ".classify",
+    "detect": ".detect",
+    "obb": ".obb",
+    "pose": ".pose",
+    "segment": ".segment",
+    "world": ".world",
+    "yoloe": ".yoloe",
+}
+
+if TYPE_CHECKING:
+    # Enable hints for type checkers
+    from .model import YOLO, YOLOE, YOLOWorld  # noqa
+    from . import classify, detect, obb, pose, segment, world, yoloe  # noqa
+
+
+def __getattr__(name: str):
+    """Lazy-import models and task subpackages on first access."""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        return module if module.__name__.endswith(f".{name}") else getattr(module, name)  # subpackage or class
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+def __dir__():
+    """Extend dir() to include lazily available names for IDE autocompletion."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,7 +1,30 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import importlib
+from typing import TYPE_CHECKING
+
 from ultralytics.models.yolo.classify.predict import ClassificationPredictor
-from ultralytics.models.yolo.classify.train import ClassificationTrainer
-from ultralytics.models.yolo.classify.val import ClassificationValidator
 
 __all__ = "ClassificationPredictor", "ClassificationTrainer", "ClassificationValidator"
+
+_LAZY = {  # attribute: submodule, imported on first access
+    "ClassificationTrainer": "ultralytics.models.yolo.classify.train",
+    "ClassificationValidator": "ultralytics.models.yolo.classify.val",
+}
+
+if TYPE_CHECKING:
+    # Enable hints for type checkers
+    from ultralytics.models.yolo.classify.train import ClassificationTrainer  # noqa
+    from ultralytics.models.yolo.classify.val import ClassificationValidator  # noqa
+
+
+def __getattr__(name: str):
+    """Lazy-import training and validation classes on first access."""
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+def __dir__():
+    """Extend dir() to include lazily available names for IDE autocompletion."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,7 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 from ultralytics.engine.predictor import BasePredictor
-from ultralytics.engine.results import Results
+from ultralytics.engine.results import BatchTensor, Results
 from ultralytics.utils import nms, ops
 
 
@@ -58,6 +58,7 @@ class DetectionPredictor(BasePredictor):
             self.args.classes,
             self.args.agnostic_nms,
             max_det=self.args.max_det,
+            topk_per_det=self.args.topk_per_det,
             nc=0 if self.args.task == "detect" else len(self.model.names),
             end2end=getattr(self.model, "end2end", False),
             rotated=self.args.task == "obb",
@@ -71,7 +72,12 @@ class DetectionPredictor(BasePredictor):
             obj_feats = self.get_obj_feats(self._feats, preds[1])
             preds = preds[0]
 
+        batch = BatchTensor(preds) if len(preds) > 1 and preds[0].device.type != "cpu" else None
+        if batch is not None:
+            preds = batch.views  # share one tensor so Results.cpu() transfers the whole batch once
         results = self.construct_results(preds, img, orig_imgs, **kwargs)
+        if batch is not None:
+            batch.bind(results)
 
         if save_feats:
             for r, f in zip(results, obj_feats):
@@ -12,6 +12,7 @@ import torch
 import torch.nn as nn
 
 from ultralytics.data import build_dataloader, build_yolo_dataset
+from ultralytics.data.augment import BatchAugment
 from ultralytics.engine.trainer import BaseTrainer
 from ultralytics.models import yolo
 from ultralytics.nn.tasks import DetectionModel
@@ -31,6 +32,7 @@ class DetectionTrainer(BaseTrainer):
         model (DetectionModel): The YOLO detection model being trained.
         data (dict): Dictionary containing dataset information including class names and number of classes.
         loss_names (tuple): Names of the loss components used in training (box_loss, cls_loss, dfl_loss).
+        batch_augment (BatchAugment | None): Augmentations applied to training batches on the device, if selected.
 
     Methods:
         build_dataset: Build YOLO dataset for training or validation.
@@ -61,6 +63,7 @@ class DetectionTrainer(BaseTrainer):
             _callbacks (list, optional): List of callback functions to be executed during training.
         """
         super().__init__(cfg, overrides, _callbacks)
+        self.batch_augment = None
 
     def build_dataset(self, img_path: str, mode: str = "train", batch: int | None = None):
         """Build YOLO Dataset for training or validation.
@@ -95,6 +98,17 @@ class DetectionTrainer(BaseTrainer):
         if getattr(dataset, "rect", False) and shuffle:
             LOGGER.warning("'rect=True' is incompatible with DataLoader shuffle, setting shuffle=False")
             shuffle = False
+        if mode == "train" and BatchAugment.parse(self.args.batch_augment):  # after the dataset may disable flips
+            self.batch_augment = BatchAugment(
+                self.args.batch_augment,
+                hgain=self.args.hsv_h,
+                sgain=self.args.hsv_s,
+                vgain=self.args.hsv_v,
+                flipud=self.args.flipud,
+                fliplr=self.args.fliplr,
+                flip_idx=self.data.get("flip_idx") or None,
+                mask_overlap=self.args.overlap_mask,
+            )
         return build_dataloader(
             dataset,
             batch=batch_size,
@@ -105,7 +119,7 @@ class DetectionTrainer(BaseTrainer):
         )
 
     def preprocess_batch(self, batch: dict) -> dict:
-        """Preprocess a batch of images by scaling and converting to float.
+        """Preprocess a batch of images by scaling and converting to float, then apply any batch augmentations.
 
         Args:
             batch (dict): Dictionary containing batch data with 'img' tensor.
@@ -117,6 +131,8 @@ class DetectionTrainer(BaseTrainer):
             if isinstance(v, torch.Tensor):
                 batch[k] = v.to(self.device, non_blocking=self.device.type == "cuda")
         batch["img"] = batch["img"].float() / 255
+        if self.batch_augment is not None:
+            batch = self.batch_augment(batch)
         if self.args.multi_scale:
             imgs = batch["img"]
             sz = (
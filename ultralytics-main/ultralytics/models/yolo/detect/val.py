@@ -96,6 +96,7 @@ class DetectionValidator(BaseValidator):
         self.seen = 0
         self.jdict = []
         self.metrics.names = model.names
+        self.metrics.bins = self.args.val_bins
         self.confusion_matrix = ConfusionMatrix(names=model.names, save_matches=self.args.plots and self.args.visualize)
 
     def get_desc(self) -> str:
@@ -172,22 +173,14 @@ class DetectionValidator(BaseValidator):
             preds (list[dict[str, torch.Tensor]]): List of predictions from the model.
             batch (dict[str, Any]): Batch data containing ground truth.
         """
-        for si, pred in enumerate(preds):
+        preds = [self._prepare_pred(pred) for pred in preds]
+        stats = self._match_batch(preds, batch)
+        for si, predn in enumerate(preds):
             self.seen += 1
             pbatch = self._prepare_batch(si, batch)
-            predn = self._prepare_pred(pred)
-
-            cls = pbatch["cls"].cpu().numpy()
+            pbatch["tp"] = stats[si]["tp"]
             no_pred = predn["cls"].shape[0] == 0
-            self.metrics.update_stats(
-                {
-                    **self._process_batch(predn, pbatch),
-                    "target_cls": cls,
-                    "target_img": np.unique(cls),
-                    "conf": np.zeros(0) if no_pred else predn["conf"].cpu().numpy(),
-                    "pred_cls": np.zeros(0) if no_pred else predn["cls"].cpu().numpy(),
-                }
-            )
+            self.metrics.update_stats({**stats[si], **self._process_batch(predn, pbatch)})
             # Evaluate
             if self.args.plots:
                 self.confusion_matrix.process_batch(predn, pbatch, conf=self.args.conf)
@@ -234,10 +227,20 @@ class DetectionValidator(BaseValidator):
             for jdict in gathered_jdict:
                 self.jdict.extend(jdict)
             self.metrics.stats = merged_stats
+            if self.metrics.bins:
+                gathered_hist = [None] * dist.get_world_size()
+                dist.gather_object(self.metrics.hist, gathered_hist, dst=0)
+                hist = next((h for h in gathered_hist if h is not None), None)
+                for h in gathered_hist:
+                    if h is not hist:
+                        hist.merge(h)
+                self.metrics.hist = hist
             self.seen = len(self.dataloader.dataset)  # total image count from dataset
         elif RANK > 0:
             dist.gather_object(self.metrics.stats, None, dst=0)
             dist.gather_object(self.jdict, None, dst=0)
+            if self.metrics.bins:
+                dist.gather_object(self.metrics.hist, None, dst=0)
             self.jdict = []
             self.metrics.clear_stats()
 
@@ -271,17 +274,81 @@ class DetectionValidator(BaseValidator):
                     )
                 )
 
+    def _match_batch(self, preds: list[dict[str, torch.Tensor]], batch: dict[str, Any]) -> list[dict[str, np.ndarray]]:
+        """Match the predictions of a whole batch to its targets in one pass on the device.
+
+        Predictions and targets are padded to (B, D, 4) and (B, L, 4), IoU and greedy matching for all thresholds are
+        computed in batched tensor ops, and the results are copied to the host once per batch instead of per image.
+
+        Args:
+            preds (list[dict[str, torch.Tensor]]): Prepared predictions for each image.
+            batch (dict[str, Any]): Batch data containing ground truth.
+
+        Returns:
+            (list[dict[str, np.ndarray]]): Per-image 'tp', 'conf', 'pred_cls', 'target_cls' and 'target_img' arrays.
+        """
+        bs, device = len(preds), self.device
+        targets = torch.cat((batch["batch_idx"][:, None], batch["cls"].view(-1, 1)), 1).cpu().numpy()
+        counts = np.bincount(targets[:, 0].astype(int), minlength=bs)
+        order = np.argsort(targets[:, 0], kind="stable")
+        cls_t = np.split(targets[order, 1], np.cumsum(counts)[:-1])
+        pos = np.arange(len(order)) - np.repeat(np.cumsum(counts) - counts, counts)  # index of target in its image
+        idx = (torch.from_numpy(targets[order, 0]).long().to(device), torch.from_numpy(pos).to(device))
+        order = torch.from_numpy(order).to(device)
+
+        n = [len(p["cls"]) for p in preds]
+        pad = torch.nn.utils.rnn.pad_sequence
+        gt = batch["bboxes"].new_zeros((bs, counts.max(initial=0), batch["bboxes"].shape[-1]))
+        gt[idx] = batch["bboxes"][order]
+        gt_cls = batch["cls"].new_full(gt.shape[:2], -2)
+        gt_cls[idx] = batch["cls"].view(-1)[order]
+        pred_cls = pad([p["cls"] for p in preds], batch_first=True, padding_value=-1)
+        bboxes = pad([p["bboxes"] for p in preds], batch_first=True)
+        iou = self._batch_iou(gt, bboxes, batch["img"].shape[2:])
+        tp = self.match_predictions(pred_cls, gt_cls, iou)  # (B, D, 10)
+
+        # One transfer for all predictions: [tp, conf, cls]
+        rows = [torch.cat((t[:k], p["conf"][:, None], p["cls"][:, None]), 1).float() for t, k, p in zip(tp, n, preds)]
+        rows = np.split(torch.cat(rows).cpu().numpy(), np.cumsum(n)[:-1])
+        return [
+            {
+                "tp": r[:, : self.niou].astype(bool),
+                "conf": r[:, self.niou],
+                "pred_cls": r[:, self.niou + 1],
+                "target_cls": c,
+                "target_img": np.unique(c),
+            }
+            for r, c in zip(rows, cls_t)
+        ]
+
+    def _batch_iou(self, gt_bboxes: torch.Tensor, pred_bboxes: torch.Tensor, imgsz: tuple[int, int]) -> torch.Tensor:
+        """Compute IoU between padded targets and predictions for a batch.
+
+        Args:
+            gt_bboxes (torch.Tensor): Padded normalized xywh targets of shape (B, L, 4).
+            pred_bboxes (torch.Tensor): Padded xyxy predictions in pixels of shape (B, D, 4).
+            imgsz (tuple[int, int]): Height and width of the batch images.
+
+        Returns:
+            (torch.Tensor): IoU of shape (B, L, D).
+        """
+        gt_bboxes = ops.xywh2xyxy(gt_bboxes) * torch.tensor(imgsz, device=self.device)[[1, 0, 1, 0]]
+        return box_iou(gt_bboxes, pred_bboxes)
+
     def _process_batch(self, preds: dict[str, torch.Tensor], batch: dict[str, Any]) -> dict[str, np.ndarray]:
         """Return correct prediction matrix.
 
         Args:
             preds (dict[str, torch.Tensor]): Dictionary containing prediction data with 'bboxes' and 'cls' keys.
-            batch (dict[str, Any]): Batch dictionary containing ground truth data with 'bboxes' and 'cls' keys.
+            batch (dict[str, Any]): Batch dictionary containing ground truth data with 'bboxes' and 'cls' keys, and
+                optionally 'tp' already matched for the whole batch by `_match_batch`.
 
         Returns:
             (dict[str, np.ndarray]): Dictionary containing 'tp' key with correct prediction matrix of shape (N, 10) for
                 10 IoU levels.
         """
+        if "tp" in batch:  # already matched for the whole batch
+            return {"tp": batch["tp"]}
         if batch["cls"].shape[0] == 0 or preds["cls"].shape[0] == 0:
             return {"tp": np.zeros((preds["cls"].shape[0], self.niou), dtype=bool)}
         iou = box_iou(batch["bboxes"], preds["bboxes"])
@@ -354,7 +354,7 @@ class YOLOE(Model):
         stream: bool = False,
         visual_prompts: dict[str, list] = {},
         refer_image=None,
-        predictor=yolo.yoloe.YOLOEVPDetectPredictor,
+        predictor=None,
         **kwargs,
     ):
         """Run prediction on images, videos, directories, streams, etc.
@@ -381,6 +381,7 @@ class YOLOE(Model):
             >>> prompts = {"bboxes": [[10, 20, 100, 200]], "cls": ["person"]}
             >>> results = model.predict("path/to/image.jpg", visual_prompts=prompts)
         """
+        predictor = predictor or yolo.yoloe.YOLOEVPDetectPredictor
         if len(visual_prompts):
             assert "bboxes" in visual_prompts and "cls" in visual_prompts, (
                 f"Expected 'bboxes' and 'cls' in visual prompts, but got {visual_prompts.keys()}"
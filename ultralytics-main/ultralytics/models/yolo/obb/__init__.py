@@ -1,7 +1,30 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .predict import OBBPredictor
-from .train import OBBTrainer
-from .val import OBBValidator
 
 __all__ = "OBBPredictor", "OBBTrainer", "OBBValidator"
+
+_LAZY = {  # attribute: submodule, imported on first access
+    "OBBTrainer": ".train",
+    "OBBValidator": ".val",
+}
+
+if TYPE_CHECKING:
+    # Enable hints for type checkers
+    from .train import OBBTrainer  # noqa
+    from .val import OBBValidator  # noqa
+
+
+def __getattr__(name: str):
+    """Lazy-import training and validation classes on first access."""
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+def __dir__():
+    """Extend dir() to include lazily available names for IDE autocompletion."""
+    return sorted(set(globals()) | set(_LAZY))
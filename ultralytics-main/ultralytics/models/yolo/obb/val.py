@@ -28,6 +28,7 @@ class OBBValidator(DetectionValidator):
     Methods:
         init_metrics: Initialize evaluation metrics for YOLO.
         _process_batch: Process batch of detections and ground truth boxes to compute IoU matrix.
+        _batch_iou: Compute probabilistic IoU between padded targets and predictions of a whole batch.
         _prepare_batch: Prepare batch data for OBB validation.
         _prepare_pred: Prepare predictions with scaled and padded bounding boxes.
         plot_predictions: Plot predicted bounding boxes on input images.
@@ -89,11 +90,19 @@ class OBBValidator(DetectionValidator):
             >>> gt_cls = torch.randint(0, 5, (50,))  # 50 ground truth class labels
             >>> correct_matrix = validator._process_batch(detections, gt_bboxes, gt_cls)
         """
+        if "tp" in batch:  # already matched for the whole batch
+            return {"tp": batch["tp"]}
         if batch["cls"].shape[0] == 0 or preds["cls"].shape[0] == 0:
             return {"tp": np.zeros((preds["cls"].shape[0], self.niou), dtype=bool)}
         iou = batch_probiou(batch["bboxes"], preds["bboxes"])
         return {"tp": self.match_predictions(preds["cls"], batch["cls"], iou).cpu().numpy()}
 
+    def _batch_iou(self, gt_bboxes: torch.Tensor, pred_bboxes: torch.Tensor, imgsz: tuple[int, int]) -> torch.Tensor:
+        """Return the probabilistic IoU of padded normalized xywhr targets (B, L, 5) and xywhr predictions (B, D, 5)."""
+        gt_bboxes = gt_bboxes.clone()
+        gt_bboxes[..., :4] *= torch.tensor(imgsz, device=self.device)[[1, 0, 1, 0]]
+        return batch_probiou(gt_bboxes, pred_bboxes)
+
     def postprocess(self, preds: torch.Tensor) -> list[dict[str, torch.Tensor]]:
         """Postprocess OBB predictions.
 
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import ast
 import json
+import os
 import platform
 import zipfile
 from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +23,8 @@ from ultralytics.utils.checks import check_requirements, check_suffix, check_ver
 from ultralytics.utils.downloads import attempt_download_asset, is_url
 from ultralytics.utils.nms import non_max_suppression
 
+ORT_BUFFERS = 2  # ONNX Runtime output buffer sets rotated between IO binding runs, see AutoBackend._ort_io_binding()
+
 
 def check_class_names(names: list | dict) -> dict[int, str]:
     """Check class names and convert to dict format if needed.
@@ -68,6 +72,76 @@ def default_class_names(data: str | Path | None = None) -> dict[int, str]:
     return {i: f"class{i}" for i in range(999)}  # return default if above errors
 
 
+def ort_session_options(
+    w: str | Path,
+    intra_threads: int = 0,
+    inter_threads: int = 0,
+    parallel: bool = False,
+    opt_level: str = "all",
+    cache: bool = False,
+    mem_arena: bool = True,
+    mem_pattern: bool = True,
+    spin: bool = True,
+    device: str = "cpu",
+):
+    """Build ONNX Runtime session options, optionally reusing a cached optimized graph for faster startup.
+
+    Args:
+        w (str | Path): Path to the ONNX model file.
+        intra_threads (int): Threads used to parallelize a single operator, 0 for the ONNX Runtime default.
+        inter_threads (int): Threads used to run independent operators in parallel mode, 0 for the default.
+        parallel (bool): Use the parallel instead of the sequential execution mode.
+        opt_level (str): Graph optimization level, one of 'disable', 'basic', 'extended' or 'all'.
+        cache (bool): Save the optimized graph next to the model on first load and reuse it afterwards.
+        mem_arena (bool): Enable the CPU memory arena allocator.
+        mem_pattern (bool): Enable memory pattern planning for fixed input shapes.
+        spin (bool): Let idle intra-op threads spin-wait, disable when several processes share the same cores.
+        device (str): Device type the session runs on, used to name the cached graph.
+
+    Returns:
+        options (onnxruntime.SessionOptions): Configured session options.
+        w (str): Path of the model to load, pointing at the cached optimized graph when available.
+
+    Examples:
+        >>> options, w = ort_session_options("yolo11n.onnx", intra_threads=2, spin=False, cache=True)
+        >>> session = onnxruntime.InferenceSession(w, options, providers=["CPUExecutionProvider"])
+    """
+    import onnxruntime
+
+    levels = {
+        "disable": onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        "basic": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        "extended": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        "all": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL,
+    }
+    if opt_level not in levels:
+        raise ValueError(f"Invalid ort_opt_level '{opt_level}', valid values are {', '.join(levels)}.")
+
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = intra_threads
+    options.inter_op_num_threads = inter_threads
+    options.execution_mode = (
+        onnxruntime.ExecutionMode.ORT_PARALLEL if parallel else onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+    )
+    options.graph_optimization_level = levels[opt_level]
+    options.enable_cpu_mem_arena = mem_arena
+    options.enable_mem_pattern = mem_pattern
+    if not spin:
+        options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+        options.add_session_config_entry("session.inter_op.allow_spinning", "0")
+
+    w = Path(w)
+    if cache and opt_level != "disable":
+        f = w.with_name(f"{w.stem}_ort_{opt_level}_{device}.onnx")  # optimized graph is hardware specific
+        if f.exists() and f.stat().st_mtime >= w.stat().st_mtime:
+            LOGGER.info(f"Loading cached optimized graph {f}...")
+            options.graph_optimization_level = levels["disable"]  # graph is already optimized
+            w = f
+        elif os.access(w.parent, os.W_OK):
+            options.optimized_model_filepath = str(f)
+    return options, str(w)
+
+
 class AutoBackend(nn.Module):
     """Handle dynamic backend selection for running inference using Ultralytics YOLO models.
 
@@ -144,6 +218,8 @@ class AutoBackend(nn.Module):
         fp16: bool = False,
         fuse: bool = True,
         verbose: bool = True,
+        ort_options: dict | None = None,
+        ov_async: bool = False,
     ):
         """Initialize the AutoBackend for inference.
 
@@ -155,6 +231,9 @@ class AutoBackend(nn.Module):
             fp16 (bool): Enable half-precision inference. Supported only on specific backends.
             fuse (bool): Fuse Conv2D + BatchNorm layers for optimization.
             verbose (bool): Enable verbose logging.
+            ort_options (dict, optional): ONNX Runtime settings passed to `ort_session_options`, i.e.
+                {"intra_threads": 2, "spin": False}.
+            ov_async (bool): Compile OpenVINO models in throughput mode with a pool of asynchronous infer requests.
         """
         super().__init__()
         nn_module = isinstance(model, torch.nn.Module)
@@ -252,7 +331,8 @@ class AutoBackend(nn.Module):
                     cuda = False
             LOGGER.info(f"Using ONNX Runtime {onnxruntime.__version__} {providers[0]}")
             if onnx:
-                session = onnxruntime.InferenceSession(w, providers=providers)
+                session_options, w = ort_session_options(w, device=device.type, **(ort_options or {}))
+                session = onnxruntime.InferenceSession(w, session_options, providers=providers)
             else:
                 check_requirements(
                     ("model-compression-toolkit>=2.4.1", "sony-custom-layers[torch]>=0.3.0", "onnxruntime-extensions")
@@ -270,21 +350,10 @@ class AutoBackend(nn.Module):
             metadata = session.get_modelmeta().custom_metadata_map
             dynamic = isinstance(session.get_outputs()[0].shape[0], str)
             fp16 = "float16" in session.get_inputs()[0].type
+            ort_shape = None  # input shape the dynamic output buffers are bound for
+            ort_step = 0  # number of IO binding runs, selects the output buffers of the next run
             if not dynamic:
-                io = session.io_binding()
-                bindings = []
-                for output in session.get_outputs():
-                    out_fp16 = "float16" in output.type
-                    y_tensor = torch.empty(output.shape, dtype=torch.float16 if out_fp16 else torch.float32).to(device)
-                    io.bind_output(
-                        name=output.name,
-                        device_type=device.type,
-                        device_id=device.index if cuda else 0,
-                        element_type=np.float16 if out_fp16 else np.float32,
-                        shape=tuple(y_tensor.shape),
-                        buffer_ptr=y_tensor.data_ptr(),
-                    )
-                    bindings.append(y_tensor)
+                ort_buffers = [self._ort_io_binding(session, device) for _ in range(ORT_BUFFERS)]
 
         # OpenVINO
         elif xml:
@@ -312,15 +381,24 @@ class AutoBackend(nn.Module):
                 metadata = YAML.load(metadata)
                 batch = metadata["batch"]
                 dynamic = metadata.get("args", {}).get("dynamic", dynamic)
-            # OpenVINO inference modes are 'LATENCY', 'THROUGHPUT' (not recommended), or 'CUMULATIVE_THROUGHPUT'
-            inference_mode = "CUMULATIVE_THROUGHPUT" if batch > 1 and dynamic else "LATENCY"
+            # OpenVINO inference modes are 'LATENCY', 'THROUGHPUT' (ov_async), or 'CUMULATIVE_THROUGHPUT'
+            if ov_async:
+                inference_mode = "THROUGHPUT"
+            else:
+                inference_mode = "CUMULATIVE_THROUGHPUT" if batch > 1 and dynamic else "LATENCY"
             ov_compiled_model = core.compile_model(
                 ov_model,
                 device_name=device_name,
                 config={"PERFORMANCE_HINT": inference_mode},
             )
+            ov_queue, ov_requests = None, 1
+            if inference_mode != "LATENCY":  # pool of infer requests, results are delivered to Futures by callback
+                ov_requests = ov_compiled_model.get_property("OPTIMAL_NUMBER_OF_INFER_REQUESTS")
+                ov_queue = ov.AsyncInferQueue(ov_compiled_model, ov_requests)
+                ov_queue.set_callback(self._ov_done)
             LOGGER.info(
-                f"Using OpenVINO {inference_mode} mode for batch={batch} inference on {', '.join(ov_compiled_model.get_property('EXECUTION_DEVICES'))}..."
+                f"Using OpenVINO {inference_mode} mode for batch={batch} inference with {ov_requests} infer request(s) "
+                f"on {', '.join(ov_compiled_model.get_property('EXECUTION_DEVICES'))}..."
             )
             input_name = ov_compiled_model.input().get_any_name()
 
@@ -669,13 +747,18 @@ class AutoBackend(nn.Module):
 
         # ONNX Runtime
         elif self.onnx or self.imx:
-            if self.dynamic:
-                im = im.cpu().numpy()  # torch to numpy
-                y = self.session.run(self.output_names, {self.session.get_inputs()[0].name: im})
+            if self.dynamic and im.shape != self.ort_shape:  # bind new output buffers for a new input shape
+                y = self.session.run(self.output_names, {self.session.get_inputs()[0].name: im.cpu().numpy()})
+                shapes = [x.shape for x in y]
+                self.ort_buffers = [self._ort_io_binding(self.session, self.device, shapes) for _ in range(ORT_BUFFERS)]
+                self.ort_shape = im.shape
+                y = [torch.from_numpy(x).to(self.device) for x in y]
             else:
                 if not self.cuda:
                     im = im.cpu()
-                self.io.bind_input(
+                io, bindings = self.ort_buffers[self.ort_step % ORT_BUFFERS]
+                self.ort_step += 1
+                io.bind_input(
                     name="images",
                     device_type=im.device.type,
                     device_id=im.device.index if im.device.type == "cuda" else 0,
@@ -683,8 +766,8 @@ class AutoBackend(nn.Module):
                     shape=tuple(im.shape),
                     buffer_ptr=im.data_ptr(),
                 )
-                self.session.run_with_iobinding(self.io)
-                y = self.bindings
+                self.session.run_with_iobinding(io)
+                y = list(bindings)  # views of the bound buffers, overwritten ORT_BUFFERS runs later
             if self.imx:
                 if self.task == "detect":
                     # boxes, conf, cls
@@ -697,23 +780,8 @@ class AutoBackend(nn.Module):
         elif self.xml:
             im = im.cpu().numpy()  # FP32
 
-            if self.inference_mode in {"THROUGHPUT", "CUMULATIVE_THROUGHPUT"}:  # optimized for larger batch-sizes
-                n = im.shape[0]  # number of images in batch
-                results = [None] * n  # preallocate list with None to match the number of images
-
-                def callback(request, userdata):
-                    """Place result in preallocated list using userdata index."""
-                    results[userdata] = request.results
-
-                # Create AsyncInferQueue, set the callback and start asynchronous inference for each input image
-                async_queue = self.ov.AsyncInferQueue(self.ov_compiled_model)
-                async_queue.set_callback(callback)
-                for i in range(n):
-                    # Start async inference with userdata=i to specify the position in results list
-                    async_queue.start_async(inputs={self.input_name: im[i : i + 1]}, userdata=i)  # keep image as BCHW
-                async_queue.wait_all()  # wait for all inference requests to complete
-                y = [list(r.values()) for r in results]
-                y = [np.concatenate(x) for x in zip(*y)]
+            if self.ov_queue is not None:  # optimized for larger batch-sizes, run images in parallel requests
+                y = self._ov_gather(self._ov_submit(im))
             else:  # inference_mode = "LATENCY", optimized for fastest first result at batch-size 1
                 y = list(self.ov_compiled_model(im).values())
 
@@ -846,6 +914,64 @@ class AutoBackend(nn.Module):
 
         # for x in y:
         #     print(type(x), len(x)) if isinstance(x, (list, tuple)) else print(type(x), x.shape)  # debug shapes
+        return self._to_tensors(y)
+
+    def submit(self, im: torch.Tensor) -> list[Future]:
+        """Start asynchronous inference on a batch without waiting for the results (OpenVINO throughput mode only).
+
+        Several batches can be in flight at once, up to `ov_requests` images in total before `submit` blocks.
+
+        Args:
+            im (torch.Tensor): The image tensor to perform inference on.
+
+        Returns:
+            (list[Future]): One pending job per image, pass to `collect` to retrieve the outputs.
+
+        Examples:
+            >>> jobs = [model.submit(im) for im in batches]  # several batches in flight
+            >>> preds = [model.collect(j) for j in jobs]  # outputs in submission order
+        """
+        if getattr(self, "ov_queue", None) is None:
+            raise RuntimeError("submit() requires an OpenVINO model loaded with ov_async=True")
+        if self.fp16 and im.dtype != torch.float16:
+            im = im.half()  # to FP16
+        return self._ov_submit(im.cpu().numpy())
+
+    def collect(self, jobs: list[Future]) -> torch.Tensor | list[torch.Tensor]:
+        """Wait for the jobs returned by `submit` and return the outputs in the same format as `forward`.
+
+        Args:
+            jobs (list[Future]): Pending jobs of one batch.
+
+        Returns:
+            (torch.Tensor | list[torch.Tensor]): The raw output tensor(s) from the model.
+        """
+        return self._to_tensors(self._ov_gather(jobs))
+
+    def _ov_submit(self, im: np.ndarray) -> list[Future]:
+        """Queue each image of a BCHW batch on the OpenVINO infer request pool."""
+        jobs = []
+        for i in range(im.shape[0]):
+            job = Future()
+            self.ov_queue.start_async(inputs={self.input_name: im[i : i + 1]}, userdata=job)  # keep image as BCHW
+            jobs.append(job)
+        return jobs
+
+    @staticmethod
+    def _ov_done(request, job: Future) -> None:
+        """Deliver the outputs of a finished OpenVINO infer request to its job, or the error if the request failed."""
+        try:
+            job.set_result([x.copy() for x in request.results.values()])
+        except Exception as e:
+            job.set_exception(e)
+
+    @staticmethod
+    def _ov_gather(jobs: list[Future]) -> list[np.ndarray]:
+        """Wait for per-image OpenVINO jobs and concatenate their outputs along the batch dimension."""
+        return [np.concatenate(x) for x in zip(*(job.result() for job in jobs))]
+
+    def _to_tensors(self, y: Any) -> torch.Tensor | list[torch.Tensor]:
+        """Convert raw backend outputs to tensors, inferring class names for segment models if missing."""
         if isinstance(y, (list, tuple)):
             if len(self.names) == 999 and (self.task == "segment" or len(y) == 2):  # segments and names not defined
                 nc = y[0].shape[1] - y[1].shape[1] - 4  # y = (1, 32, 160, 160), (1, 116, 8400)
@@ -880,6 +1006,39 @@ class AutoBackend(nn.Module):
                 warmup_boxes[:, :4] *= imgsz[-1]
                 non_max_suppression(warmup_boxes)  # warmup NMS
 
+    @staticmethod
+    def _ort_io_binding(session, device: torch.device, shapes: list[tuple] | None = None) -> tuple:
+        """Bind ONNX Runtime session outputs to preallocated tensors so results are written in place.
+
+        AutoBackend rotates between ORT_BUFFERS such bindings and returns the bound tensors without copying, so outputs
+        stay valid until ORT_BUFFERS more inferences have run. Callers that keep outputs longer must clone them.
+
+        Args:
+            session (onnxruntime.InferenceSession): Session whose outputs are bound.
+            device (torch.device): Device the output buffers are allocated on.
+            shapes (list[tuple], optional): Output shapes, defaults to the static shapes stored in the model.
+
+        Returns:
+            io (onnxruntime.IOBinding): IO binding with all outputs bound.
+            bindings (list[torch.Tensor]): Preallocated output tensors in session output order.
+        """
+        io = session.io_binding()
+        bindings = []
+        outputs = session.get_outputs()
+        for output, shape in zip(outputs, shapes or [x.shape for x in outputs]):
+            out_fp16 = "float16" in output.type
+            y_tensor = torch.empty(shape, dtype=torch.float16 if out_fp16 else torch.float32).to(device)
+            io.bind_output(
+                name=output.name,
+                device_type=device.type,
+                device_id=device.index if device.type == "cuda" else 0,
+                element_type=np.float16 if out_fp16 else np.float32,
+                shape=tuple(y_tensor.shape),
+                buffer_ptr=y_tensor.data_ptr(),
+            )
+            bindings.append(y_tensor)
+        return io, bindings
+
     @staticmethod
     def _model_type(p: str = "path/to/model.pt") -> list[bool]:
         """Take a path to a model file and return the model type.
@@ -1,6 +1,5 @@
 import torch
 import torch.nn as nn
-from torchvision.ops import DeformConv2d
 
 #以此绝对路径导入官方模块，确保解耦
 from ultralytics.nn.modules.block import C2f, Bottleneck
@@ -12,6 +11,7 @@ class DeformConv(nn.Module):
     """
     def __init__(self, in_channels, out_channels, kernel_size=3, stride=1, padding=1, dilation=1, groups=1, bias=False):
         super(DeformConv, self).__init__()
+        from torchvision.ops import DeformConv2d  # scope as slow import
         
         self.stride = stride
         self.padding = padding
@@ -1462,7 +1462,7 @@ def load_checkpoint(weight, device=None, inplace=True, fuse=False):
         model (torch.nn.Module): Loaded model.
         ckpt (dict): Model checkpoint dictionary.
     """
-    ckpt, weight = torch_safe_load(weight)  # load ckpt
+    ckpt, weight = torch_safe_load(weight)  # load ckpt, fuse() below is a no-op for save_fused_checkpoint() artifacts
     args = {**DEFAULT_CFG_DICT, **(ckpt.get("train_args", {}))}  # combine model and default args, preferring model args
     model = (ckpt.get("ema") or ckpt["model"]).float()  # FP32 model
 
@@ -1486,6 +1486,32 @@ def load_checkpoint(weight, device=None, inplace=True, fuse=False):
     return model, ckpt
 
 
+def save_fused_checkpoint(weight, file=None):
+    """Save a fused, inference-only deploy artifact next to a checkpoint for faster cold starts.
+
+    The artifact holds the model with Conv2d and BatchNorm2d already folded and no optimizer or EMA state, so loading it
+    skips fusing. Weights are stored in FP16 like strip_optimizer() checkpoints and cast to FP32 by load_checkpoint().
+    It is only used when passed explicitly, i.e. YOLO("yolo11n.fused.pt"), and never replaces its source checkpoint
+    implicitly.
+
+    Args:
+        weight (str | Path): Source *.pt checkpoint path.
+        file (str | Path, optional): Output path, defaults to '{stem}.fused.pt' next to the source checkpoint.
+
+    Returns:
+        (Path): Path to the saved deploy artifact.
+
+    Examples:
+        >>> from ultralytics.nn.tasks import save_fused_checkpoint
+        >>> f = save_fused_checkpoint("yolo11n.pt")  # yolo11n.fused.pt
+    """
+    model, ckpt = load_checkpoint(weight, fuse=True)
+    file = Path(file or Path(model.pt_path).with_suffix(".fused.pt"))
+    model = model.requires_grad_(False).half()  # FP16 like strip_optimizer(), load_checkpoint() casts back to FP32
+    torch.save({"model": model, "train_args": ckpt.get("train_args", {}), "fused": True}, file)
+    return file
+
+
 def parse_model(d, ch, verbose=True):
     """Parse a YOLO model.yaml dictionary into a PyTorch model.
 
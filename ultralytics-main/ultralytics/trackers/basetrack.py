@@ -2,6 +2,7 @@
 """Module defines the base classes and structures for object tracking in YOLO."""
 
 from collections import OrderedDict
+from threading import Lock
 from typing import Any
 
 import numpy as np
@@ -33,6 +34,7 @@ class BaseTrack:
 
     Attributes:
         _count (int): Class-level counter for unique track IDs.
+        _lock (Lock): Guards `_count` for trackers of several streams updated in concurrent threads.
         track_id (int): Unique identifier for the track.
         is_activated (bool): Flag indicating whether the track is currently active.
         state (TrackState): Current state of the track.
@@ -63,6 +65,7 @@ class BaseTrack:
     """
 
     _count = 0
+    _lock = Lock()
 
     def __init__(self):
         """Initialize a new track with a unique ID and foundational tracking attributes."""
@@ -86,8 +89,9 @@ class BaseTrack:
     @staticmethod
     def next_id() -> int:
         """Increment and return the next unique global track ID for object tracking."""
-        BaseTrack._count += 1
-        return BaseTrack._count
+        with BaseTrack._lock:
+            BaseTrack._count += 1
+            return BaseTrack._count
 
     def activate(self, *args: Any) -> None:
         """Activate the track with provided arguments, initializing necessary attributes for tracking."""
@@ -112,4 +116,5 @@ class BaseTrack:
     @staticmethod
     def reset_id() -> None:
         """Reset the global track ID counter to its initial value."""
-        BaseTrack._count = 0
+        with BaseTrack._lock:
+            BaseTrack._count = 0
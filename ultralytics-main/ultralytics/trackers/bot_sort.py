@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition
+from typing import Any, Callable
 
 import numpy as np
 import torch
@@ -15,7 +17,62 @@ from .basetrack import TrackState
 from .byte_tracker import BYTETracker, STrack
 from .utils import matching
 from .utils.gmc import GMC
-from .utils.kalman_filter import KalmanFilterXYWH
+from .utils.kalman_filter import KalmanFilterXYWH, StateBank
+
+
+class FeatureBank(StateBank):
+    """State bank that also keeps the normalized appearance features of its tracks in one contiguous matrix.
+
+    `matching.embedding_distance()` gathers the features of all tracks with one fancy index instead of stacking one
+    array per track.
+
+    Attributes:
+        feat (np.ndarray | None): Smoothed features with shape (capacity, D), allocated with the first feature. Rows of
+            slots without a feature are zero.
+        has_feat (np.ndarray): Whether each slot holds a feature.
+
+    Methods:
+        set_feat: Store or clear the feature of a slot.
+
+    Examples:
+        >>> bank = FeatureBank()
+        >>> slot = bank.alloc(track)
+        >>> bank.set_feat(slot, np.ones(128) / np.sqrt(128))
+    """
+
+    def __init__(self, capacity: int = 64, ndim: int = 8):
+        """Initialize the bank with room for a number of tracks.
+
+        Args:
+            capacity (int): Initial number of slots.
+            ndim (int): State dimension.
+        """
+        super().__init__(capacity, ndim)
+        self.feat = None
+        self.has_feat = np.zeros(capacity, dtype=bool)
+
+    def alloc(self, owner=None) -> int:
+        """Reserve a slot without a feature, growing the feature matrix along with the states, and return its index."""
+        slot = super().alloc(owner)
+        n = len(self.mean) - len(self.has_feat)
+        if n:  # states grew
+            self.has_feat = np.concatenate([self.has_feat, np.zeros(n, dtype=bool)])
+            if self.feat is not None:
+                self.feat = np.concatenate([self.feat, np.zeros((n, self.feat.shape[1]), dtype=self.feat.dtype)])
+        self.set_feat(slot, None)
+        return slot
+
+    def set_feat(self, slot: int, feat: np.ndarray | None) -> None:
+        """Store the feature of a slot, or clear it if feat is None."""
+        if feat is None:
+            self.has_feat[slot] = False
+            if self.feat is not None:
+                self.feat[slot] = 0
+            return
+        if self.feat is None:
+            self.feat = np.zeros((len(self.mean), len(feat)), dtype=np.float32)
+        self.feat[slot] = feat
+        self.has_feat[slot] = True
 
 
 class BOTrack(STrack):
@@ -26,8 +83,9 @@ class BOTrack(STrack):
 
     Attributes:
         shared_kalman (KalmanFilterXYWH): A shared Kalman filter for all instances of BOTrack.
-        smooth_feat (np.ndarray): Smoothed feature vector.
+        smooth_feat (np.ndarray): Smoothed feature vector, a view into the feature bank while the track holds a slot.
         curr_feat (np.ndarray): Current feature vector.
+        feat_frame (int): Frame ID of the last feature update.
         features (deque): A deque to store feature vectors with a maximum length defined by `feat_history`.
         alpha (float): Smoothing factor for the exponential moving average of features.
         mean (np.ndarray): The mean state of the Kalman filter.
@@ -36,6 +94,10 @@ class BOTrack(STrack):
     Methods:
         update_features: Update features vector and smooth it using exponential moving average.
         predict: Predict the mean and covariance using Kalman filter.
+        activate: Activate a new track, moving its feature into the bank.
+        to_arrays: Return the state and features of multiple tracks as arrays with one row per track.
+        from_arrays: Recreate tracks with their features from the arrays of `to_arrays()`.
+        detach: Copy the state and feature out of the bank and release its slot.
         re_activate: Reactivate a track with updated features and optionally new ID.
         update: Update the track with new detection and frame ID.
         tlwh: Property that gets the current position in tlwh format `(top left x, top left y, width, height)`.
@@ -52,6 +114,7 @@ class BOTrack(STrack):
     """
 
     shared_kalman = KalmanFilterXYWH()
+    lost_velocity_dims = (6, 7)
 
     def __init__(
         self, xywh: np.ndarray, score: float, cls: int, feat: np.ndarray | None = None, feat_history: int = 50
@@ -69,6 +132,7 @@ class BOTrack(STrack):
 
         self.smooth_feat = None
         self.curr_feat = None
+        self.feat_frame = 0
         if feat is not None:
             self.update_features(feat)
         self.features = deque([], maxlen=feat_history)
@@ -85,6 +149,36 @@ class BOTrack(STrack):
         self.features.append(feat)
         self.smooth_feat /= np.linalg.norm(self.smooth_feat)
 
+    @property
+    def smooth_feat(self) -> np.ndarray | None:
+        """Return the smoothed feature, a view into the feature bank while the track holds a slot in one."""
+        if self.slot is None or not isinstance(self.bank, FeatureBank):
+            return self._smooth_feat
+        return self.bank.feat[self.slot] if self.bank.has_feat[self.slot] else None
+
+    @smooth_feat.setter
+    def smooth_feat(self, feat: np.ndarray | None):
+        """Set the smoothed feature."""
+        if self.slot is None or not isinstance(self.bank, FeatureBank):
+            self._smooth_feat = feat
+        else:
+            self.bank.set_feat(self.slot, feat)
+
+    def activate(self, kalman_filter: KalmanFilterXYWH, frame_id: int, bank: StateBank | None = None) -> None:
+        """Activate a new track and move its feature into the bank."""
+        feat = self.smooth_feat
+        super().activate(kalman_filter, frame_id, bank)
+        self._smooth_feat = None
+        self.smooth_feat = feat
+        self.feat_frame = frame_id
+
+    def detach(self) -> None:
+        """Copy the state and feature out of the bank and release its slot, i.e. once the track is removed."""
+        if self.slot is not None:
+            feat = self.smooth_feat
+            self._smooth_feat = None if feat is None else feat.copy()
+        super().detach()
+
     def predict(self) -> None:
         """Predict the object's future state using the Kalman filter to update its mean and covariance."""
         mean_state = self.mean.copy()
@@ -94,17 +188,19 @@ class BOTrack(STrack):
 
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
 
-    def re_activate(self, new_track: BOTrack, frame_id: int, new_id: bool = False) -> None:
+    def re_activate(self, new_track: BOTrack, frame_id: int, new_id: bool = False, correct: bool = True) -> None:
         """Reactivate a track with updated features and optionally assign a new ID."""
         if new_track.curr_feat is not None:
             self.update_features(new_track.curr_feat)
-        super().re_activate(new_track, frame_id, new_id)
+            self.feat_frame = frame_id
+        super().re_activate(new_track, frame_id, new_id, correct)
 
-    def update(self, new_track: BOTrack, frame_id: int) -> None:
+    def update(self, new_track: BOTrack, frame_id: int, correct: bool = True) -> None:
         """Update the track with new detection information and the current frame ID."""
         if new_track.curr_feat is not None:
             self.update_features(new_track.curr_feat)
-        super().update(new_track, frame_id)
+            self.feat_frame = frame_id
+        super().update(new_track, frame_id, correct)
 
     @property
     def tlwh(self) -> np.ndarray:
@@ -116,25 +212,42 @@ class BOTrack(STrack):
         return ret
 
     @staticmethod
-    def multi_predict(stracks: list[BOTrack]) -> None:
-        """Predict the mean and covariance for multiple object tracks using a shared Kalman filter."""
-        if len(stracks) <= 0:
-            return
-        multi_mean = np.asarray([st.mean.copy() for st in stracks])
-        multi_covariance = np.asarray([st.covariance for st in stracks])
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_mean[i][6] = 0
-                multi_mean[i][7] = 0
-        multi_mean, multi_covariance = BOTrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-        for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-            stracks[i].mean = mean
-            stracks[i].covariance = cov
+    def state_to_tlwh(mean: np.ndarray) -> np.ndarray:
+        """Convert (N, 8) xywh state means to (N, 4) tlwh boxes."""
+        ret = mean[:, :4].copy()
+        ret[:, :2] -= ret[:, 2:] / 2
+        return ret
 
     def convert_coords(self, tlwh: np.ndarray) -> np.ndarray:
         """Convert tlwh bounding box coordinates to xywh format."""
         return self.tlwh_to_xywh(tlwh)
 
+    @staticmethod
+    def to_arrays(stracks: list[BOTrack]) -> dict[str, np.ndarray]:
+        """Return the state of activated tracks as arrays, adding the smoothed `feat` and `feat_frame` of each track."""
+        arrays = STrack.to_arrays(stracks)
+        feats = [t.smooth_feat for t in stracks]
+        dim = next((len(f) for f in feats if f is not None), 0)
+        arrays["feat"] = np.zeros((len(stracks), dim), dtype=np.float32)
+        for i, f in enumerate(feats):
+            if f is not None:
+                arrays["feat"][i] = f
+        arrays["has_feat"] = np.array([f is not None for f in feats], dtype=bool)
+        arrays["feat_frame"] = np.array([t.feat_frame for t in stracks], dtype=np.int64)
+        return arrays
+
+    @classmethod
+    def from_arrays(
+        cls, arrays: dict[str, np.ndarray], kalman_filter: KalmanFilterXYWH, bank: StateBank
+    ) -> list[BOTrack]:
+        """Recreate activated tracks with their smoothed features from the arrays of `to_arrays()`."""
+        tracks = super().from_arrays(arrays, kalman_filter, bank)
+        if "feat" in arrays:  # snapshots of BYTETracker hold no features
+            for t, f, has_feat, frame in zip(tracks, arrays["feat"], arrays["has_feat"], arrays["feat_frame"]):
+                t.smooth_feat = f.copy() if has_feat else None
+                t.feat_frame = int(frame)
+        return tracks
+
     @staticmethod
     def tlwh_to_xywh(tlwh: np.ndarray) -> np.ndarray:
         """Convert bounding box from tlwh (top-left-width-height) to xywh (center-x-center-y-width-height) format."""
@@ -150,6 +263,8 @@ class BOTSORT(BYTETracker):
         proximity_thresh (float): Threshold for spatial proximity (IoU) between tracks and detections.
         appearance_thresh (float): Threshold for appearance similarity (ReID embeddings) between tracks and detections.
         encoder (Any): Object to handle ReID embeddings, set to None if ReID is not enabled.
+        reid_refresh (int): Frames after which an unambiguously matched track is embedded again.
+        img (np.ndarray | None): Frame of the detections whose crops are embedded on demand.
         gmc (GMC): An instance of the GMC algorithm for data association.
         args (Any): Parsed command-line arguments containing tracking parameters.
 
@@ -157,7 +272,11 @@ class BOTSORT(BYTETracker):
         get_kalmanfilter: Return an instance of KalmanFilterXYWH for object tracking.
         init_track: Initialize track with detections, scores, and classes.
         get_dists: Get distances between tracks and detections using IoU and (optionally) ReID.
+        embed: Embed the crops of the detections whose appearance can change the association.
+        embed_matched: Embed second-stage detections matched by IoU so their tracks keep updating their appearance.
         multi_predict: Predict and track multiple objects with a YOLO model.
+        load_state_dict: Restore the tracker state, restarting camera motion estimation.
+        prefetch: Start estimating the camera motion of a frame in a worker thread while the detector runs.
         reset: Reset the BOTSORT tracker to its initial state.
 
     Examples:
@@ -170,23 +289,31 @@ class BOTSORT(BYTETracker):
         The class is designed to work with a YOLO object detection model and supports ReID only if enabled via args.
     """
 
-    def __init__(self, args: Any, frame_rate: int = 30):
+    track_cls = BOTrack
+
+    def __init__(self, args: Any, frame_rate: int = 30, encoder: ReID | None = None):
         """Initialize BOTSORT object with ReID module and GMC algorithm.
 
         Args:
             args (Any): Parsed command-line arguments containing tracking parameters.
             frame_rate (int): Frame rate of the video being processed.
+            encoder (ReID, optional): ReID encoder shared with the trackers of other streams, created from `args.model`
+                if None.
         """
         super().__init__(args, frame_rate)
+        self.bank = FeatureBank()
         self.gmc = GMC(method=args.gmc_method)
+        self.gmc_prefetch = getattr(args, "gmc_prefetch", False)
 
         # ReID module
         self.proximity_thresh = args.proximity_thresh
         self.appearance_thresh = args.appearance_thresh
+        self.reid_refresh = getattr(args, "reid_refresh", 1)
+        self.img = None
         self.encoder = (
             (lambda feats, s: [f.cpu().numpy() for f in feats])  # native features do not require any model
             if args.with_reid and self.args.model == "auto"
-            else ReID(args.model)
+            else encoder or ReID(args.model)
             if args.with_reid
             else None
         )
@@ -201,11 +328,12 @@ class BOTSORT(BYTETracker):
             return []
         bboxes = results.xywhr if hasattr(results, "xywhr") else results.xywh
         bboxes = np.concatenate([bboxes, np.arange(len(bboxes)).reshape(-1, 1)], axis=-1)
-        if self.args.with_reid and self.encoder is not None:
+        if isinstance(self.encoder, ReID):  # crops are embedded in get_dists(), only where appearance matters
+            self.img = img
+        elif self.args.with_reid and self.encoder is not None:
             features_keep = self.encoder(img, bboxes)
             return [BOTrack(xywh, s, c, f) for (xywh, s, c, f) in zip(bboxes, results.conf, results.cls, features_keep)]
-        else:
-            return [BOTrack(xywh, s, c) for (xywh, s, c) in zip(bboxes, results.conf, results.cls)]
+        return [BOTrack(xywh, s, c) for (xywh, s, c) in zip(bboxes, results.conf, results.cls)]
 
     def get_dists(self, tracks: list[BOTrack], detections: list[BOTrack]) -> np.ndarray:
         """Calculate distances between tracks and detections using IoU and optionally ReID embeddings."""
@@ -216,24 +344,92 @@ class BOTSORT(BYTETracker):
             dists = matching.fuse_score(dists, detections)
 
         if self.args.with_reid and self.encoder is not None:
+            if isinstance(self.encoder, ReID):
+                self.embed(tracks, detections, dists, dists_mask)
             emb_dists = matching.embedding_distance(tracks, detections) / 2.0
             emb_dists[emb_dists > (1 - self.appearance_thresh)] = 1.0
             emb_dists[dists_mask] = 1.0
             dists = np.minimum(dists, emb_dists)
         return dists
 
+    def embed(self, tracks: list[BOTrack], detections: list[BOTrack], dists: np.ndarray, dists_mask: np.ndarray):
+        """Embed the crops of the detections whose appearance can change the association, in one forward pass.
+
+        A detection is not embedded when it is proximate to exactly one track that is proximate to no other detection,
+        their fused IoU-score cost is already below `match_thresh` and the track was embedded less than `reid_refresh`
+        frames ago: the pair is matched whatever the appearance. Detections proximate to no track are embedded since
+        they may start new tracks.
+
+        Args:
+            tracks (list[BOTrack]): Tracks to associate.
+            detections (list[BOTrack]): Detections to associate, those without `curr_feat` are embedded if required.
+            dists (np.ndarray): Motion cost matrix with shape (len(tracks), len(detections)).
+            dists_mask (np.ndarray): Mask of the track-detection pairs that are not proximate.
+        """
+        pending = np.array([d.curr_feat is None for d in detections], dtype=bool)
+        if self.img is None or not pending.any():
+            return
+        near = ~dists_mask
+        unique = near & (near.sum(1, keepdims=True) == 1) & (near.sum(0, keepdims=True) == 1)
+        fresh = np.array(
+            [t.smooth_feat is not None and self.frame_id - t.feat_frame < self.reid_refresh for t in tracks], dtype=bool
+        )
+        pending &= ~(unique & (dists < self.args.match_thresh) & fresh[:, None]).any(0)
+        idx = np.flatnonzero(pending)
+        if len(idx):
+            for i, f in zip(idx, self.encoder(self.img, np.stack([detections[i].xywh for i in idx]))):
+                detections[i].update_features(f)
+
+    def embed_matched(self, detections: list[BOTrack]) -> None:
+        """Embed second-stage detections matched by IoU so their tracks keep updating their appearance."""
+        detections = [d for d in detections if d.curr_feat is None]
+        if isinstance(self.encoder, ReID) and self.img is not None and detections:
+            for d, f in zip(detections, self.encoder(self.img, np.stack([d.xywh for d in detections]))):
+                d.update_features(f)
+
     def multi_predict(self, tracks: list[BOTrack]) -> None:
         """Predict the mean and covariance of multiple object tracks using a shared Kalman filter."""
         BOTrack.multi_predict(tracks)
 
+    def load_state_dict(self, state: dict[str, np.ndarray]) -> None:
+        """Restore the tracker state from the arrays of `state_dict()`, restarting camera motion estimation."""
+        super().load_state_dict(state)
+        self.img = None
+        self.gmc.reset_params()
+
+    def prefetch(self, img: np.ndarray) -> None:
+        """Start estimating the camera motion of a frame in a worker thread if `gmc_prefetch` is enabled."""
+        if self.gmc_prefetch:
+            self.gmc.prefetch(img)
+
     def reset(self) -> None:
         """Reset the BOTSORT tracker to its initial state, clearing all tracked objects and internal states."""
         super().reset()
+        self.bank = FeatureBank()
+        self.img = None
         self.gmc.reset_params()
 
 
 class ReID:
-    """YOLO model as encoder for re-identification."""
+    """YOLO model as encoder for re-identification.
+
+    The trackers of several streams can share one encoder and embed their crops in joint forward passes by running
+    their updates through `run_batched()`.
+
+    Attributes:
+        model (YOLO): Model whose embeddings are used as appearance features.
+        active (int): Number of tracker updates still running inside `run_batched()`.
+        executor (ThreadPoolExecutor | None): Threads running the updates of `run_batched()`, reused across frames.
+        requests (list): Crops waiting for a joint forward pass, each as a `[crops, feats]` pair.
+
+    Methods:
+        embed: Embed a list of crops in one forward pass.
+        run_batched: Run tracker updates concurrently, embedding the crops they request together.
+
+    Examples:
+        >>> encoder = ReID("yolo11n-cls.pt")
+        >>> feats = encoder(img, np.array([[100, 100, 40, 80]]))
+    """
 
     def __init__(self, model: str):
         """Initialize encoder for re-identification.
@@ -244,13 +440,80 @@ class ReID:
         from ultralytics import YOLO
 
         self.model = YOLO(model)
-        self.model(embed=[len(self.model.model.model) - 2 if ".pt" in model else -1], verbose=False, save=False)  # init
+        embed = [len(self.model.model.model) - 2 if ".pt" in model else -1]
+        self.model(np.zeros((32, 32, 3), dtype=np.uint8), embed=embed, verbose=False, save=False)  # init
+        self.cond = Condition()
+        self.active = 0
+        self.requests = []
+        self.executor, self.workers = None, 0
 
     def __call__(self, img: np.ndarray, dets: np.ndarray) -> list[np.ndarray]:
-        """Extract embeddings for detected objects."""
-        feats = self.model.predictor(
-            [save_one_box(det, img, save=False) for det in xywh2xyxy(torch.from_numpy(dets[:, :4]))]
-        )
-        if len(feats) != dets.shape[0] and feats[0].shape[0] == dets.shape[0]:
+        """Extract embeddings for detected objects, jointly with other trackers inside `run_batched()`."""
+        crops = [save_one_box(det, img, save=False) for det in xywh2xyxy(torch.from_numpy(dets[:, :4]))]
+        if not self.active:
+            return self.embed(crops)
+        with self.cond:
+            request = [crops, None]
+            self.requests.append(request)
+            if len(self.requests) == self.active:  # every other update is waiting or done
+                self._flush()
+            while request[1] is None:
+                self.cond.wait()
+        if isinstance(request[1], Exception):
+            raise request[1]
+        return request[1]
+
+    def embed(self, crops: list[np.ndarray]) -> list[np.ndarray]:
+        """Embed a list of crops in one forward pass."""
+        feats = self.model.predictor(crops)
+        if len(feats) != len(crops) and feats[0].shape[0] == len(crops):
             feats = feats[0]  # batched prediction with non-PyTorch backend
         return [f.cpu().numpy() for f in feats]
+
+    def _flush(self):
+        """Embed the crops of all waiting requests together and hand each request its features."""
+        requests, self.requests = self.requests, []
+        try:
+            feats = self.embed([crop for crops, _ in requests for crop in crops])
+        except Exception as e:
+            feats = e
+        i = 0
+        for request in requests:
+            n = len(request[0])
+            request[1] = feats if isinstance(feats, Exception) else feats[i : i + n]
+            i += n
+        self.cond.notify_all()
+
+    def _leave(self):
+        """Mark one update of `run_batched()` as done, flushing the requests of the others if they all wait."""
+        with self.cond:
+            self.active -= 1
+            if self.requests and len(self.requests) == self.active:
+                self._flush()
+
+    def run_batched(self, fns: list[Callable]) -> list:
+        """Run tracker updates concurrently, embedding the crops they request together.
+
+        Every embedding request waits until each other update has also requested crops or finished, so the updates of
+        N streams need one forward pass per association step instead of N.
+
+        Args:
+            fns (list[Callable]): Tracker updates using this encoder, called without arguments.
+
+        Returns:
+            (list): Return values of fns in order.
+        """
+
+        def run(fn):
+            try:
+                return fn()
+            finally:
+                self._leave()
+
+        if len(fns) > self.workers:  # every update needs its own thread, they wait for each other
+            if self.executor is not None:
+                self.executor.shutdown()
+            self.executor, self.workers = ThreadPoolExecutor(len(fns), thread_name_prefix="reid"), len(fns)
+        with self.cond:
+            self.active = len(fns)
+        return list(self.executor.map(run, fns))
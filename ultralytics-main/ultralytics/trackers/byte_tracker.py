@@ -10,7 +10,7 @@ from ..utils import LOGGER
 from ..utils.ops import xywh2ltwh
 from .basetrack import BaseTrack, TrackState
 from .utils import matching
-from .utils.kalman_filter import KalmanFilterXYAH
+from .utils.kalman_filter import KalmanFilterXYAH, StateBank
 
 
 class STrack(BaseTrack):
@@ -23,8 +23,10 @@ class STrack(BaseTrack):
         shared_kalman (KalmanFilterXYAH): Shared Kalman filter used across all STrack instances for prediction.
         _tlwh (np.ndarray): Private attribute to store top-left corner coordinates and width and height of bounding box.
         kalman_filter (KalmanFilterXYAH): Instance of Kalman filter used for this particular object track.
-        mean (np.ndarray): Mean state estimate vector.
-        covariance (np.ndarray): Covariance of state estimate.
+        bank (StateBank | None): Contiguous state storage shared by the tracks of one tracker.
+        slot (int | None): Index of this track's state in the bank, None while the track owns its own arrays.
+        mean (np.ndarray): Mean state estimate vector, a view into the bank while the track holds a slot.
+        covariance (np.ndarray): Covariance of state estimate, a view into the bank while the track holds a slot.
         is_activated (bool): Boolean flag indicating if the track has been activated.
         score (float): Confidence score of the track.
         tracklet_len (int): Length of the tracklet.
@@ -38,7 +40,12 @@ class STrack(BaseTrack):
         predict: Predict the next state of the object using Kalman filter.
         multi_predict: Predict the next states for multiple tracks.
         multi_gmc: Update multiple track states using a homography matrix.
+        multi_update: Correct multiple track states with their matched detections.
+        multi_xyxy: Return the xyxy boxes of multiple tracks, read from their state bank when possible.
+        to_arrays: Return the state of multiple tracks as arrays with one row per track.
+        from_arrays: Recreate tracks from the arrays of `to_arrays()`.
         activate: Activate a new tracklet.
+        detach: Copy the state out of the bank and release its slot.
         re_activate: Reactivate a previously lost tracklet.
         update: Update the state of a matched track.
         convert_coords: Convert bounding box to x-y-aspect-height format.
@@ -51,6 +58,7 @@ class STrack(BaseTrack):
     """
 
     shared_kalman = KalmanFilterXYAH()
+    lost_velocity_dims = (7,)  # state velocities zeroed by multi_predict() while a track is not tracked
 
     def __init__(self, xywh: list[float], score: float, cls: Any):
         """Initialize a new STrack instance.
@@ -66,6 +74,7 @@ class STrack(BaseTrack):
         assert len(xywh) in {5, 6}, f"expected 5 or 6 values but got {len(xywh)}"
         self._tlwh = np.asarray(xywh2ltwh(xywh[:4]), dtype=np.float32)
         self.kalman_filter = None
+        self.bank, self.slot = None, None
         self.mean, self.covariance = None, None
         self.is_activated = False
 
@@ -82,44 +91,113 @@ class STrack(BaseTrack):
             mean_state[7] = 0
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
 
+    @property
+    def mean(self) -> np.ndarray | None:
+        """Return the mean state estimate, a view into the state bank while the track holds a slot."""
+        return self._mean if self.slot is None else self.bank.mean[self.slot]
+
+    @mean.setter
+    def mean(self, mean: np.ndarray | None):
+        """Set the mean state estimate."""
+        if self.slot is None:
+            self._mean = mean
+        else:
+            self.bank.mean[self.slot] = mean
+
+    @property
+    def covariance(self) -> np.ndarray | None:
+        """Return the state covariance, a view into the state bank while the track holds a slot."""
+        return self._covariance if self.slot is None else self.bank.covariance[self.slot]
+
+    @covariance.setter
+    def covariance(self, covariance: np.ndarray | None):
+        """Set the state covariance."""
+        if self.slot is None:
+            self._covariance = covariance
+        else:
+            self.bank.covariance[self.slot] = covariance
+
+    def detach(self):
+        """Copy the state out of the bank and release its slot, i.e. once the track is removed."""
+        if self.slot is not None:
+            self._mean, self._covariance = self.mean.copy(), self.covariance.copy()
+            self.bank.release(self.slot)
+            self.slot = None
+
+    @staticmethod
+    def bank_slots(stracks: list[STrack]) -> tuple[StateBank | None, np.ndarray | None]:
+        """Return the bank shared by all tracks and their slot indices, or (None, None) if they do not share one."""
+        bank, slots = stracks[0].bank, [st.slot for st in stracks]
+        if bank is not None and None not in slots and all(st.bank is bank for st in stracks):
+            return bank, np.array(slots)
+        return None, None
+
     @staticmethod
-    def multi_predict(stracks: list[STrack]):
+    def get_states(stracks: list[STrack]) -> tuple[StateBank | None, np.ndarray | None, np.ndarray, np.ndarray]:
+        """Gather the states of tracks, as one fancy-indexed copy from their shared bank when possible."""
+        bank, slots = STrack.bank_slots(stracks)
+        if bank is not None:
+            return bank, slots, bank.mean[slots], bank.covariance[slots]
+        return None, None, np.asarray([st.mean for st in stracks]), np.asarray([st.covariance for st in stracks])
+
+    @staticmethod
+    def set_states(stracks: list[STrack], bank: StateBank | None, slots, mean: np.ndarray, covariance: np.ndarray):
+        """Scatter states gathered by get_states() back to the tracks."""
+        if bank is not None:
+            bank.mean[slots], bank.covariance[slots] = mean, covariance
+        else:
+            for st, m, c in zip(stracks, mean, covariance):
+                st.mean, st.covariance = m, c
+
+    @classmethod
+    def multi_predict(cls, stracks: list[STrack]):
         """Perform multi-object predictive tracking using Kalman filter for the provided list of STrack instances."""
         if len(stracks) <= 0:
             return
-        multi_mean = np.asarray([st.mean.copy() for st in stracks])
-        multi_covariance = np.asarray([st.covariance for st in stracks])
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_mean[i][7] = 0
-        multi_mean, multi_covariance = STrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-        for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-            stracks[i].mean = mean
-            stracks[i].covariance = cov
+        bank, slots, multi_mean, multi_covariance = cls.get_states(stracks)
+        lost = np.array([st.state != TrackState.Tracked for st in stracks])
+        multi_mean[np.ix_(lost, cls.lost_velocity_dims)] = 0
+        multi_mean, multi_covariance = cls.shared_kalman.multi_predict(multi_mean, multi_covariance)
+        cls.set_states(stracks, bank, slots, multi_mean, multi_covariance)
 
     @staticmethod
     def multi_gmc(stracks: list[STrack], H: np.ndarray = np.eye(2, 3)):
         """Update state tracks positions and covariances using a homography matrix for multiple tracks."""
         if stracks:
-            multi_mean = np.asarray([st.mean.copy() for st in stracks])
-            multi_covariance = np.asarray([st.covariance for st in stracks])
+            bank, slots, multi_mean, multi_covariance = STrack.get_states(stracks)
 
             R = H[:2, :2]
             R8x8 = np.kron(np.eye(4, dtype=float), R)
             t = H[:2, 2]
 
-            for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-                mean = R8x8.dot(mean)
-                mean[:2] += t
-                cov = R8x8.dot(cov).dot(R8x8.transpose())
+            multi_mean = multi_mean @ R8x8.T
+            multi_mean[:, :2] += t
+            multi_covariance = R8x8 @ multi_covariance @ R8x8.T
+            STrack.set_states(stracks, bank, slots, multi_mean, multi_covariance)
+
+    @staticmethod
+    def multi_update(stracks: list[STrack], detections: list[STrack]):
+        """Correct the states of tracks with their matched detections in one batched Kalman filter step.
 
-                stracks[i].mean = mean
-                stracks[i].covariance = cov
+        Follow with update() or re_activate() called with correct=False to update the remaining track attributes.
 
-    def activate(self, kalman_filter: KalmanFilterXYAH, frame_id: int):
-        """Activate a new tracklet using the provided Kalman filter and initialize its state and covariance."""
+        Args:
+            stracks (list[STrack]): Activated tracks sharing one Kalman filter.
+            detections (list[STrack]): Matched detection for each track.
+        """
+        if len(stracks) <= 0:
+            return
+        bank, slots, multi_mean, multi_covariance = STrack.get_states(stracks)
+        measurement = np.asarray([st.convert_coords(det.tlwh) for st, det in zip(stracks, detections)])
+        multi_mean, multi_covariance = stracks[0].kalman_filter.multi_update(multi_mean, multi_covariance, measurement)
+        STrack.set_states(stracks, bank, slots, multi_mean, multi_covariance)
+
+    def activate(self, kalman_filter: KalmanFilterXYAH, frame_id: int, bank: StateBank | None = None):
+        """Activate a new tracklet using the provided Kalman filter and initialize its state in a bank slot."""
         self.kalman_filter = kalman_filter
         self.track_id = self.next_id()
+        self.bank = bank if bank is not None else StateBank(1)
+        self.slot = self.bank.alloc(self)
         self.mean, self.covariance = self.kalman_filter.initiate(self.convert_coords(self._tlwh))
 
         self.tracklet_len = 0
@@ -129,11 +207,12 @@ class STrack(BaseTrack):
         self.frame_id = frame_id
         self.start_frame = frame_id
 
-    def re_activate(self, new_track: STrack, frame_id: int, new_id: bool = False):
+    def re_activate(self, new_track: STrack, frame_id: int, new_id: bool = False, correct: bool = True):
         """Reactivate a previously lost track using new detection data and update its state and attributes."""
-        self.mean, self.covariance = self.kalman_filter.update(
-            self.mean, self.covariance, self.convert_coords(new_track.tlwh)
-        )
+        if correct:  # False if already corrected by multi_update()
+            self.mean, self.covariance = self.kalman_filter.update(
+                self.mean, self.covariance, self.convert_coords(new_track.tlwh)
+            )
         self.tracklet_len = 0
         self.state = TrackState.Tracked
         self.is_activated = True
@@ -145,12 +224,13 @@ class STrack(BaseTrack):
         self.angle = new_track.angle
         self.idx = new_track.idx
 
-    def update(self, new_track: STrack, frame_id: int):
+    def update(self, new_track: STrack, frame_id: int, correct: bool = True):
         """Update the state of a matched track.
 
         Args:
             new_track (STrack): The new track containing updated information.
             frame_id (int): The ID of the current frame.
+            correct (bool): Whether to run the Kalman filter correction, False if already done by multi_update().
 
         Examples:
             Update the state of a track with new detection information
@@ -161,10 +241,10 @@ class STrack(BaseTrack):
         self.frame_id = frame_id
         self.tracklet_len += 1
 
-        new_tlwh = new_track.tlwh
-        self.mean, self.covariance = self.kalman_filter.update(
-            self.mean, self.covariance, self.convert_coords(new_tlwh)
-        )
+        if correct:
+            self.mean, self.covariance = self.kalman_filter.update(
+                self.mean, self.covariance, self.convert_coords(new_track.tlwh)
+            )
         self.state = TrackState.Tracked
         self.is_activated = True
 
@@ -194,6 +274,94 @@ class STrack(BaseTrack):
         ret[2:] += ret[:2]
         return ret
 
+    @staticmethod
+    def state_to_tlwh(mean: np.ndarray) -> np.ndarray:
+        """Convert (N, 8) xyah state means to (N, 4) tlwh boxes."""
+        ret = mean[:, :4].copy()
+        ret[:, 2] *= ret[:, 3]
+        ret[:, :2] -= ret[:, 2:] / 2
+        return ret
+
+    @staticmethod
+    def multi_xyxy(stracks: list[STrack]) -> np.ndarray:
+        """Return the (N, 4) xyxy boxes of tracks, read from their shared state bank in one step when possible.
+
+        Args:
+            stracks (list[STrack]): Tracks or detections of a single STrack subclass.
+
+        Returns:
+            (np.ndarray): Boxes equal to stacking `track.xyxy` for every track.
+        """
+        if not stracks:
+            return np.zeros((0, 4))
+        bank, slots = STrack.bank_slots(stracks)
+        if bank is not None:
+            tlwh = stracks[0].state_to_tlwh(bank.mean[slots])
+        elif all(st.mean is None for st in stracks):  # detections
+            tlwh = np.asarray([st._tlwh for st in stracks], dtype=float)
+        else:
+            tlwh = np.asarray([st.tlwh for st in stracks])
+        tlwh[:, 2:] += tlwh[:, :2]
+        return tlwh
+
+    @staticmethod
+    def to_arrays(stracks: list[STrack]) -> dict[str, np.ndarray]:
+        """Return the state of activated tracks as arrays with one row per track, e.g. to save with `np.savez()`.
+
+        Args:
+            stracks (list[STrack]): Activated tracks.
+
+        Returns:
+            (dict[str, np.ndarray]): Kalman `mean` and `covariance`, last detection box `tlwh` and the track attributes.
+        """
+        n = len(stracks)
+        mean, covariance = STrack.get_states(stracks)[2:] if n else (np.zeros((0, 8)), np.zeros((0, 8, 8)))
+        return {
+            "mean": mean,
+            "covariance": covariance,
+            "tlwh": np.array([t._tlwh for t in stracks], dtype=np.float32).reshape(n, 4),
+            "angle": np.array([np.nan if t.angle is None else t.angle for t in stracks], dtype=np.float32),
+            "track_id": np.array([t.track_id for t in stracks], dtype=np.int64),
+            "state": np.array([t.state for t in stracks], dtype=np.int8),
+            "is_activated": np.array([t.is_activated for t in stracks], dtype=bool),
+            "score": np.array([t.score for t in stracks], dtype=np.float32),
+            "cls": np.array([t.cls for t in stracks], dtype=np.float32),
+            "idx": np.array([t.idx for t in stracks], dtype=np.float32),
+            "end_frame": np.array([t.end_frame for t in stracks], dtype=np.int64),
+            "start_frame": np.array([t.start_frame for t in stracks], dtype=np.int64),
+            "tracklet_len": np.array([t.tracklet_len for t in stracks], dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(
+        cls, arrays: dict[str, np.ndarray], kalman_filter: KalmanFilterXYAH, bank: StateBank
+    ) -> list[STrack]:
+        """Recreate activated tracks from the arrays of `to_arrays()`, with their states in a bank.
+
+        Args:
+            arrays (dict[str, np.ndarray]): Track arrays as returned by `to_arrays()`.
+            kalman_filter (KalmanFilterXYAH): Kalman filter of the tracker the tracks belong to.
+            bank (StateBank): State bank of the tracker the tracks belong to.
+
+        Returns:
+            (list[STrack]): Tracks in the order of the array rows.
+        """
+        tracks = []
+        for i in range(len(arrays["track_id"])):
+            tlwh, angle = arrays["tlwh"][i], arrays["angle"][i]
+            xywh = [*(tlwh[:2] + tlwh[2:] / 2), *tlwh[2:], *([] if np.isnan(angle) else [angle]), arrays["idx"][i]]
+            track = cls(np.array(xywh), arrays["score"][i], arrays["cls"][i])
+            track._tlwh = tlwh.copy()
+            track.kalman_filter, track.bank = kalman_filter, bank
+            track.slot = bank.alloc(track)
+            track.mean, track.covariance = arrays["mean"][i], arrays["covariance"][i]
+            track.track_id, track.state = int(arrays["track_id"][i]), int(arrays["state"][i])
+            track.is_activated = bool(arrays["is_activated"][i])
+            track.frame_id, track.start_frame = int(arrays["end_frame"][i]), int(arrays["start_frame"][i])
+            track.tracklet_len = int(arrays["tracklet_len"][i])
+            tracks.append(track)
+        return tracks
+
     @staticmethod
     def tlwh_to_xyah(tlwh: np.ndarray) -> np.ndarray:
         """Convert bounding box from tlwh format to center-x-center-y-aspect-height (xyah) format."""
@@ -243,9 +411,15 @@ class BYTETracker:
         args (Namespace): Command-line arguments.
         max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
         kalman_filter (KalmanFilterXYAH): Kalman Filter object.
+        bank (StateBank): Contiguous Kalman states of all active tracks.
+        track_cls (type): Track class created by this tracker.
 
     Methods:
+        prefetch: Start per-frame work that does not depend on the detections.
+        embed_matched: Embed detections matched without appearance so their tracks keep updating it.
         update: Update object tracker with new detections.
+        state_dict: Return the tracker state as arrays.
+        load_state_dict: Restore the tracker state from the arrays of `state_dict()`.
         get_kalmanfilter: Return a Kalman filter object for tracking bounding boxes.
         init_track: Initialize object tracking with detections.
         get_dists: Calculate the distance between tracks and detections.
@@ -263,6 +437,8 @@ class BYTETracker:
         >>> tracked_objects = tracker.update(results)
     """
 
+    track_cls = STrack
+
     def __init__(self, args, frame_rate: int = 30):
         """Initialize a BYTETracker instance for object tracking.
 
@@ -278,6 +454,7 @@ class BYTETracker:
         self.args = args
         self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
         self.kalman_filter = self.get_kalmanfilter()
+        self.bank = StateBank()  # contiguous Kalman states of all active tracks
         self.reset_id()
 
     def update(self, results, img: np.ndarray | None = None, feats: np.ndarray | None = None) -> np.ndarray:
@@ -326,14 +503,15 @@ class BYTETracker:
         dists = self.get_dists(strack_pool, detections)
         matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
 
+        STrack.multi_update([strack_pool[i] for i, _ in matches], [detections[i] for _, i in matches])
         for itracked, idet in matches:
             track = strack_pool[itracked]
             det = detections[idet]
             if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
+                track.update(det, self.frame_id, correct=False)
                 activated_stracks.append(track)
             else:
-                track.re_activate(det, self.frame_id, new_id=False)
+                track.re_activate(det, self.frame_id, new_id=False, correct=False)
                 refind_stracks.append(track)
         # Step 3: Second association, with low score detection boxes association the untrack to the low score detections
         detections_second = self.init_track(results_second, feats_second)
@@ -341,14 +519,16 @@ class BYTETracker:
         # TODO
         dists = matching.iou_distance(r_tracked_stracks, detections_second)
         matches, u_track, _u_detection_second = matching.linear_assignment(dists, thresh=0.5)
+        self.embed_matched([detections_second[i] for _, i in matches])
+        STrack.multi_update([r_tracked_stracks[i] for i, _ in matches], [detections_second[i] for _, i in matches])
         for itracked, idet in matches:
             track = r_tracked_stracks[itracked]
             det = detections_second[idet]
             if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
+                track.update(det, self.frame_id, correct=False)
                 activated_stracks.append(track)
             else:
-                track.re_activate(det, self.frame_id, new_id=False)
+                track.re_activate(det, self.frame_id, new_id=False, correct=False)
                 refind_stracks.append(track)
 
         for it in u_track:
@@ -360,8 +540,9 @@ class BYTETracker:
         detections = [detections[i] for i in u_detection]
         dists = self.get_dists(unconfirmed, detections)
         matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
+        STrack.multi_update([unconfirmed[i] for i, _ in matches], [detections[i] for _, i in matches])
         for itracked, idet in matches:
-            unconfirmed[itracked].update(detections[idet], self.frame_id)
+            unconfirmed[itracked].update(detections[idet], self.frame_id, correct=False)
             activated_stracks.append(unconfirmed[itracked])
         for it in u_unconfirmed:
             track = unconfirmed[it]
@@ -372,7 +553,7 @@ class BYTETracker:
             track = detections[inew]
             if track.score < self.args.new_track_thresh:
                 continue
-            track.activate(self.kalman_filter, self.frame_id)
+            track.activate(self.kalman_filter, self.frame_id, self.bank)
             activated_stracks.append(track)
         # Step 5: Update state
         for track in self.lost_stracks:
@@ -390,9 +571,42 @@ class BYTETracker:
         self.removed_stracks.extend(removed_stracks)
         if len(self.removed_stracks) > 1000:
             self.removed_stracks = self.removed_stracks[-999:]  # clip remove stracks to 1000 maximum
+        self.bank.sweep(self.tracked_stracks + self.lost_stracks)  # free slots of removed and duplicate tracks
 
         return np.asarray([x.result for x in self.tracked_stracks if x.is_activated], dtype=np.float32)
 
+    def state_dict(self) -> dict[str, np.ndarray]:
+        """Return the tracker state as arrays, e.g. to save with `np.savez()` and restore with `load_state_dict()`.
+
+        Tracked and lost tracks are kept with their Kalman states, along with the global track ID counter so that a
+        restored tracker continues the same IDs. Removed tracks are dropped as they are never matched again.
+
+        Returns:
+            (dict[str, np.ndarray]): The `frame_id`, the `next_id` counter, the `lost` flag of each track and the track
+                arrays of `STrack.to_arrays()`.
+        """
+        tracks = self.tracked_stracks + self.lost_stracks
+        return {
+            "frame_id": np.array(self.frame_id, dtype=np.int64),
+            "next_id": np.array(BaseTrack._count, dtype=np.int64),
+            "lost": np.arange(len(tracks)) >= len(self.tracked_stracks),
+            **self.track_cls.to_arrays(tracks),
+        }
+
+    def load_state_dict(self, state: dict[str, np.ndarray]) -> None:
+        """Restore the tracker state from the arrays of `state_dict()`, continuing its track IDs.
+
+        Args:
+            state (dict[str, np.ndarray]): Tracker arrays as returned by `state_dict()`.
+        """
+        self.frame_id = int(state["frame_id"])
+        self.bank = type(self.bank)()
+        tracks = self.track_cls.from_arrays(state, self.kalman_filter, self.bank)
+        self.tracked_stracks = [t for t, lost in zip(tracks, state["lost"]) if not lost]
+        self.lost_stracks = [t for t, lost in zip(tracks, state["lost"]) if lost]
+        self.removed_stracks = []
+        BaseTrack._count = max(BaseTrack._count, int(state["next_id"]))  # IDs are shared by all trackers
+
     def get_kalmanfilter(self) -> KalmanFilterXYAH:
         """Return a Kalman filter object for tracking bounding boxes using KalmanFilterXYAH."""
         return KalmanFilterXYAH()
@@ -405,6 +619,12 @@ class BYTETracker:
         bboxes = np.concatenate([bboxes, np.arange(len(bboxes)).reshape(-1, 1)], axis=-1)
         return [STrack(xywh, s, c) for (xywh, s, c) in zip(bboxes, results.conf, results.cls)]
 
+    def prefetch(self, img: np.ndarray) -> None:
+        """Start per-frame work that does not depend on the detections while the detector runs, no-op for ByteTrack."""
+
+    def embed_matched(self, detections: list[STrack]) -> None:
+        """Embed detections matched without appearance so their tracks keep updating it, no-op for ByteTrack."""
+
     def get_dists(self, tracks: list[STrack], detections: list[STrack]) -> np.ndarray:
         """Calculate the distance between tracks and detections using IoU and optionally fuse scores."""
         dists = matching.iou_distance(tracks, detections)
@@ -428,6 +648,7 @@ class BYTETracker:
         self.removed_stracks = []  # type: list[STrack]
         self.frame_id = 0
         self.kalman_filter = self.get_kalmanfilter()
+        self.bank = StateBank()
         self.reset_id()
 
     @staticmethod
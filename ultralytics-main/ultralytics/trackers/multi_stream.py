@@ -0,0 +1,243 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from threading import Event, Lock, Thread
+from typing import Any
+
+import cv2
+import numpy as np
+
+from ultralytics.utils import LOGGER
+
+from .track import build_trackers, load_tracker_cfg, load_trackers, setup_reid, snapshot_trackers, track_results
+
+
+class StreamReader:
+    """Read the frames of one video source in a daemon thread, keeping only the newest unprocessed frame.
+
+    Live sources (streams, webcams) replace a frame that was not taken in time by the next one, counting it as dropped.
+    Video files are read losslessly: the reader waits until each frame is taken before decoding the next one.
+
+    Attributes:
+        source (str | int): Video file, stream URL or webcam index.
+        live (bool): Whether the source is a live stream rather than a video file.
+        fps (float): Frame rate reported by the source, 30 if unknown.
+        frame (np.ndarray | None): Newest frame not yet taken.
+        stamp (float): Capture time of `frame` as `time.perf_counter()` seconds.
+        count (int): Number of frames read.
+        dropped (int): Number of frames replaced before they were taken.
+        done (bool): Whether the source is exhausted or the reader is closed.
+
+    Methods:
+        take: Return the newest frame and its capture time, marking it as taken.
+        close: Stop the reader thread and release the capture.
+
+    Examples:
+        >>> ready = Event()
+        >>> reader = StreamReader("video.mp4", ready)
+        >>> ready.wait()
+        >>> frame, stamp = reader.take()
+    """
+
+    def __init__(self, source: str | int, ready: Event, vid_stride: int = 1):
+        """Open a video source and start reading it in a daemon thread.
+
+        Args:
+            source (str | int): Video file, stream URL or webcam index.
+            ready (Event): Event set whenever a new frame is available or the source ends.
+            vid_stride (int): Video frame-rate stride.
+        """
+        self.source = int(source) if isinstance(source, str) and source.isnumeric() else source
+        self.live = not (isinstance(self.source, str) and os.path.isfile(self.source))
+        self.cap = cv2.VideoCapture(self.source)
+        if not self.cap.isOpened():
+            raise ConnectionError(f"Failed to open {source}")
+        fps = self.cap.get(cv2.CAP_PROP_FPS)  # warning: may return 0 or nan
+        self.fps = max((fps if math.isfinite(fps) else 0) % 100, 0) or 30  # 30 FPS fallback
+        self.vid_stride = vid_stride
+        self.ready = ready
+        self.lock = Lock()
+        self.taken = Event()
+        self.taken.set()
+        self.frame, self.stamp, self.count, self.dropped, self.done = None, 0.0, 0, 0, False
+        self.thread = Thread(target=self.update, daemon=True)
+        self.thread.start()
+
+    def update(self):
+        """Read frames until the source ends or the reader is closed."""
+        n = 0
+        while not self.done:
+            if not self.live:
+                self.taken.wait()  # video files are not real-time, never drop their frames
+                if self.done:
+                    break
+            n += 1
+            if not self.cap.grab():  # .read() = .grab() followed by .retrieve()
+                if self.live and self.cap.open(self.source):
+                    LOGGER.warning(f"Video stream {self.source} unresponsive, re-opened it.")
+                    time.sleep(0.1)
+                    continue
+                break
+            if n % self.vid_stride:
+                continue
+            success, im = self.cap.retrieve()
+            if not success:
+                continue
+            with self.lock:
+                self.dropped += self.frame is not None
+                self.frame, self.stamp = im, time.perf_counter()
+                self.count += 1
+                self.taken.clear()
+            self.ready.set()
+        self.done = True
+        self.ready.set()
+
+    def take(self) -> tuple[np.ndarray | None, float]:
+        """Return the newest frame and its capture time, marking it as taken."""
+        with self.lock:
+            frame, stamp, self.frame = self.frame, self.stamp, None
+            self.taken.set()
+        return frame, stamp
+
+    def close(self):
+        """Stop the reader thread and release the video capture."""
+        self.done = True
+        self.taken.set()
+        if self.thread.is_alive():
+            self.thread.join(timeout=5)
+        self.cap.release()
+
+
+class MultiStreamTracker:
+    """Track objects in many video streams with one shared model, batching the frames that are ready across streams.
+
+    Every stream has its own reader thread and tracker. Unlike `LoadStreams`, which waits until every stream has a
+    frame, each scheduling step runs one forward pass over the streams that have a new frame, oldest capture first and
+    at most `batch` at a time, and hands the detections to the tracker of each stream. A slow or stalled camera
+    therefore never holds back the others, and live cameras that outpace the model drop stale frames rather than
+    building up lag.
+
+    Attributes:
+        model (ultralytics.engine.model.Model): Detection model shared by all streams.
+        readers (list[StreamReader]): One frame reader per stream.
+        trackers (list[BYTETracker]): One tracker per stream.
+        batch (int): Maximum number of frames per forward pass.
+        kwargs (dict): Prediction arguments, e.g. `imgsz`, `conf` or `device`.
+
+    Methods:
+        metrics: Return per-stream throughput, lag and drop counts.
+        close: Stop all reader threads.
+
+    Examples:
+        >>> from ultralytics import YOLO
+        >>> service = MultiStreamTracker(YOLO("yolo11n.pt"), ["rtsp://cam1/live", "rtsp://cam2/live"], imgsz=320)
+        >>> for i, result in service:
+        ...     print(i, result.boxes.id)
+        >>> service.metrics()
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        sources: list[str | int],
+        tracker: str = "bytetrack.yaml",
+        batch: int | None = None,
+        vid_stride: int = 1,
+        **kwargs: Any,
+    ):
+        """Open the streams, prepare the model and create one tracker per stream.
+
+        Args:
+            model (ultralytics.engine.model.Model): Detection, segmentation, pose or OBB model.
+            sources (list[str | int]): Video files, stream URLs or webcam indices.
+            tracker (str): Tracker configuration file.
+            batch (int, optional): Maximum number of frames per forward pass, defaults to the number of streams.
+            vid_stride (int): Video frame-rate stride.
+            **kwargs (Any): Prediction arguments passed to `model.predict()`.
+        """
+        if model.task == "classify":
+            raise ValueError("❌ Classification doesn't support 'mode=track'")
+        self.model = model
+        self.kwargs = {"verbose": False, **kwargs}
+        self.is_obb = model.task == "obb"
+        self.cfg = load_tracker_cfg(tracker)
+        self.model.predict(np.zeros((32, 32, 3), dtype=np.uint8), **self.kwargs)  # build predictor and warm up
+        setup_reid(self.model.predictor, self.cfg)
+
+        self.ready = Event()
+        self.readers = []
+        for i, s in enumerate(sources):
+            self.readers.append(StreamReader(s, self.ready, vid_stride))
+            LOGGER.info(f"{i + 1}/{len(sources)}: {s}... Success ✅ ({self.readers[-1].fps:.2f} FPS)")
+        self.trackers = build_trackers(self.cfg, [r.fps for r in self.readers])
+        if getattr(self.cfg, "snapshot", None) and os.path.isfile(self.cfg.snapshot):
+            load_trackers(self.trackers, self.cfg.snapshot)  # resume track IDs after a restart
+        self.batch = batch or len(self.readers)
+        self.stats = [{"frames": 0, "fps": 0.0, "lag": 0.0, "last": None} for _ in self.readers]
+
+    def __iter__(self):
+        """Yield `(stream_index, result)` for every tracked frame until all streams end, then close the readers."""
+        try:
+            while True:
+                ready = [i for i, r in enumerate(self.readers) if r.frame is not None]
+                if not ready:
+                    if all(r.done for r in self.readers):
+                        return
+                    self.ready.wait(0.1)
+                    self.ready.clear()
+                    continue
+                ready = sorted(ready, key=lambda i: self.readers[i].stamp)[: self.batch]
+                frames, stamps = zip(*(self.readers[i].take() for i in ready))
+                for i, frame in zip(ready, frames):
+                    self.trackers[i].prefetch(frame)
+                results = self.model.predict(list(frames), **self.kwargs)
+                results = track_results([self.trackers[i] for i in ready], results, self.is_obb)
+                snapshot_trackers(self)
+                for i, result, stamp in zip(ready, results, stamps):
+                    result.path = str(self.readers[i].source)
+                    self._update_stats(i, stamp)
+                    yield i, result
+        finally:
+            self.close()
+
+    def _update_stats(self, i: int, stamp: float, alpha: float = 0.1):
+        """Update the exponential moving averages of processed FPS and capture-to-result lag of stream i."""
+        s, now = self.stats[i], time.perf_counter()
+        lag = now - stamp
+        s["lag"] = lag if s["frames"] == 0 else (1 - alpha) * s["lag"] + alpha * lag
+        if s["last"] is not None:
+            fps = 1 / max(now - s["last"], 1e-6)
+            s["fps"] = fps if s["frames"] == 1 else (1 - alpha) * s["fps"] + alpha * fps
+        s["frames"] += 1
+        s["last"] = now
+
+    def metrics(self) -> list[dict[str, Any]]:
+        """Return per-stream metrics.
+
+        Returns:
+            (list[dict[str, Any]]): For every stream its `source`, `source_fps`, the moving-average tracked frame rate
+                `fps` and capture-to-result latency `lag` in seconds, and the counts of `frames` tracked, `read` and
+                `dropped` because a newer frame arrived first.
+        """
+        return [
+            {
+                "source": r.source,
+                "source_fps": r.fps,
+                "fps": s["fps"],
+                "lag": s["lag"],
+                "frames": s["frames"],
+                "read": r.count,
+                "dropped": r.dropped,
+            }
+            for r, s in zip(self.readers, self.stats)
+        ]
+
+    def close(self):
+        """Stop all reader threads and release their video captures, saving a final tracker snapshot if configured."""
+        for r in self.readers:
+            r.close()
+        snapshot_trackers(self, final=True)
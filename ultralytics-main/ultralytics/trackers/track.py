@@ -1,44 +1,44 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from __future__ import annotations
+
+import os
+import weakref
 from functools import partial
 from pathlib import Path
+from threading import Thread
+from types import SimpleNamespace
 
+import numpy as np
 import torch
 
-from ultralytics.utils import YAML, IterableSimpleNamespace
+from ultralytics.utils import LOGGER, YAML, IterableSimpleNamespace
 from ultralytics.utils.checks import check_yaml
 
-from .bot_sort import BOTSORT
+from .bot_sort import BOTSORT, ReID
 from .byte_tracker import BYTETracker
 
 # A mapping of tracker types to corresponding tracker classes
 TRACKER_MAP = {"bytetrack": BYTETracker, "botsort": BOTSORT}
 
 
-def on_predict_start(predictor: object, persist: bool = False) -> None:
-    """Initialize trackers for object tracking during prediction.
-
-    Args:
-        predictor (ultralytics.engine.predictor.BasePredictor): The predictor object to initialize trackers for.
-        persist (bool, optional): Whether to persist the trackers if they already exist.
-
-    Examples:
-        Initialize trackers for a predictor object
-        >>> predictor = SomePredictorClass()
-        >>> on_predict_start(predictor, persist=True)
-    """
-    if predictor.args.task == "classify":
-        raise ValueError("❌ Classification doesn't support 'mode=track'")
+def load_tracker_cfg(tracker: str) -> IterableSimpleNamespace:
+    """Load and validate a tracker configuration file such as 'bytetrack.yaml' or 'botsort.yaml'."""
+    cfg = IterableSimpleNamespace(**YAML.load(check_yaml(tracker)))
+    if cfg.tracker_type not in {"bytetrack", "botsort"}:
+        raise AssertionError(f"Only 'bytetrack' and 'botsort' are supported for now, but got '{cfg.tracker_type}'")
+    return cfg
 
-    if hasattr(predictor, "trackers") and persist:
-        return
 
-    tracker = check_yaml(predictor.args.tracker)
-    cfg = IterableSimpleNamespace(**YAML.load(tracker))
+def setup_reid(predictor: object, cfg: IterableSimpleNamespace) -> None:
+    """Prepare ReID features for BoT-SORT with `model: auto`, hooking the Detect head input of the predictor model.
 
-    if cfg.tracker_type not in {"bytetrack", "botsort"}:
-        raise AssertionError(f"Only 'bytetrack' and 'botsort' are supported for now, but got '{cfg.tracker_type}'")
+    Models without a suitable Detect head fall back to a classification model as the ReID encoder.
 
+    Args:
+        predictor (ultralytics.engine.predictor.BasePredictor): The predictor whose model provides the features.
+        cfg (IterableSimpleNamespace): Tracker configuration, updated in place on fallback.
+    """
     predictor._feats = None  # reset in case used earlier
     if hasattr(predictor, "_hook"):
         predictor._hook.remove()
@@ -58,16 +58,198 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
 
             predictor._hook = predictor.model.model.model[-1].register_forward_pre_hook(pre_hook)
 
+
+def build_trackers(cfg: IterableSimpleNamespace, frame_rates: list[float]) -> list[BYTETracker]:
+    """Create one tracker per stream, sharing a single ReID encoder between them.
+
+    Args:
+        cfg (IterableSimpleNamespace): Tracker configuration.
+        frame_rates (list[float]): Frame rate of every stream.
+
+    Returns:
+        (list[BYTETracker]): One tracker per stream.
+    """
     trackers = []
-    for _ in range(predictor.dataset.bs):
-        tracker = TRACKER_MAP[cfg.tracker_type](args=cfg, frame_rate=30)
-        trackers.append(tracker)
-        if predictor.dataset.mode != "stream":  # only need one tracker for other modes
-            break
-    predictor.trackers = trackers
+    for fps in frame_rates:
+        encoder = getattr(trackers[0], "encoder", None) if trackers else None
+        kwargs = {"encoder": encoder} if isinstance(encoder, ReID) else {}
+        trackers.append(TRACKER_MAP[cfg.tracker_type](args=cfg, frame_rate=fps, **kwargs))
+    return trackers
+
+
+def track_result(tracker: BYTETracker, result: object, is_obb: bool = False) -> object:
+    """Update a tracker with the detections of one result and return the result reduced to the tracked objects.
+
+    Args:
+        tracker (BYTETracker): Tracker of the video the result belongs to.
+        result (ultralytics.engine.results.Results): Detection result of the next frame.
+        is_obb (bool): Whether the result holds oriented boxes.
+
+    Returns:
+        (ultralytics.engine.results.Results): The result with track IDs, or the input result if nothing is tracked.
+    """
+    det = (result.obb if is_obb else result.boxes).cpu().numpy()
+    tracks = tracker.update(det, result.orig_img, getattr(result, "feats", None))
+    if len(tracks) == 0:
+        return result
+    idx = tracks[:, -1].astype(int)
+    result = result[idx]
+    result.update(**{"obb" if is_obb else "boxes": torch.as_tensor(tracks[:, :-1])})
+    return result
+
+
+def track_results(trackers: list[BYTETracker], results: list, is_obb: bool = False) -> list:
+    """Track the results of several streams, one per tracker, embedding their ReID crops in joint forward passes.
+
+    Args:
+        trackers (list[BYTETracker]): Tracker of every stream.
+        results (list[ultralytics.engine.results.Results]): Detection result of the next frame of every stream.
+        is_obb (bool): Whether the results hold oriented boxes.
+
+    Returns:
+        (list[ultralytics.engine.results.Results]): The results with track IDs.
+    """
+    fns = [partial(track_result, tracker, result, is_obb) for tracker, result in zip(trackers, results)]
+    encoder = getattr(trackers[0], "encoder", None)
+    if len(fns) > 1 and isinstance(encoder, ReID) and all(t.encoder is encoder for t in trackers):
+        return encoder.run_batched(fns)
+    return [fn() for fn in fns]
+
+
+def save_trackers(trackers: list[BYTETracker], file: str | Path) -> Thread:
+    """Write the state of trackers to an .npz file in a background thread.
+
+    The state arrays are gathered on the calling thread, so the trackers can keep updating while the file is written.
+    The file is replaced atomically, a crash during the write keeps the previous snapshot.
+
+    Args:
+        trackers (list[BYTETracker]): Trackers to save, e.g. one per stream.
+        file (str | Path): Snapshot file.
+
+    Returns:
+        (Thread): The writer thread, join it to wait for the file.
+    """
+    state = {f"{i}.{k}": v for i, t in enumerate(trackers) for k, v in t.state_dict().items()}
+    file = Path(file)
+
+    def write():
+        tmp = file.with_name(f"{file.name}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, **state)
+        os.replace(tmp, file)
+
+    thread = Thread(target=write, daemon=True)
+    thread.start()
+    return thread
+
+
+def load_trackers(trackers: list[BYTETracker], file: str | Path) -> None:
+    """Restore the state of trackers from a snapshot written by `save_trackers()`.
+
+    Args:
+        trackers (list[BYTETracker]): Trackers to restore in the order they were saved, extra trackers stay empty.
+        file (str | Path): Snapshot file.
+    """
+    states = [{} for _ in trackers]
+    with np.load(file, allow_pickle=False) as data:
+        for key in data.files:
+            i, k = key.split(".", 1)
+            if int(i) < len(trackers):
+                states[int(i)][k] = data[key]
+    for tracker, state in zip(trackers, states):
+        if state:
+            tracker.load_state_dict(state)
+    LOGGER.info(f"Restored {sum(len(s.get('track_id', [])) for s in states)} tracks from {file}")
+
+
+def snapshot_trackers(owner: object, final: bool = False) -> None:
+    """Save the state of `owner.trackers` every `snapshot_interval` calls if a `snapshot` file is configured.
+
+    Called once per tracked batch. A periodic snapshot is skipped while the previous one is still being written.
+
+    Args:
+        owner (object): Predictor or tracking service holding the `trackers`.
+        final (bool): Save now and wait for the file, e.g. when the stream ends.
+    """
+    trackers = getattr(owner, "trackers", None)
+    file = getattr(trackers[0].args, "snapshot", None) if trackers else None
+    if not file:
+        return
+    thread = getattr(owner, "snapshot_thread", None)
+    if final:
+        if thread is not None:
+            thread.join()
+        save_trackers(trackers, file).join()
+        return
+    owner.snapshot_step = getattr(owner, "snapshot_step", 0) + 1
+    if owner.snapshot_step % getattr(trackers[0].args, "snapshot_interval", 300) == 0:
+        if thread is None or not thread.is_alive():
+            owner.snapshot_thread = save_trackers(trackers, file)
+
+
+def on_predict_start(predictor: object, persist: bool = False) -> None:
+    """Initialize trackers for object tracking during prediction.
+
+    Args:
+        predictor (ultralytics.engine.predictor.BasePredictor): The predictor object to initialize trackers for.
+        persist (bool, optional): Whether to persist the trackers if they already exist.
+
+    Examples:
+        Initialize trackers for a predictor object
+        >>> predictor = SomePredictorClass()
+        >>> on_predict_start(predictor, persist=True)
+    """
+    if predictor.args.task == "classify":
+        raise ValueError("❌ Classification doesn't support 'mode=track'")
+
+    if hasattr(predictor, "trackers") and persist:
+        _flush_on_teardown(predictor)
+        return
+
+    cfg = load_tracker_cfg(predictor.args.tracker)
+    setup_reid(predictor, cfg)
+
+    n = predictor.dataset.bs if predictor.dataset.mode == "stream" else 1  # only need one tracker for other modes
+    predictor.trackers = build_trackers(cfg, [30] * n)
+    if persist and getattr(cfg, "snapshot", None) and Path(cfg.snapshot).is_file():
+        load_trackers(predictor.trackers, cfg.snapshot)  # resume track IDs of a previous run
+    if hasattr(predictor, "snapshot_owner"):
+        predictor.snapshot_owner.trackers = predictor.trackers
+    if persist:
+        _flush_on_teardown(predictor)
     predictor.vid_path = [None] * predictor.dataset.bs  # for determining when to reset tracker on new video
 
 
+def _flush_on_teardown(predictor: object) -> None:
+    """Save a final snapshot of persisted trackers once the predictor is garbage collected or the interpreter exits.
+
+    Snapshot state lives on a separate owner object so that the finalizer does not keep the predictor alive.
+    """
+    if hasattr(predictor, "snapshot_owner") or not getattr(predictor.trackers[0].args, "snapshot", None):
+        return
+    predictor.snapshot_owner = SimpleNamespace(trackers=predictor.trackers)
+    weakref.finalize(predictor, snapshot_trackers, predictor.snapshot_owner, True)
+
+
+def on_predict_batch_start(predictor: object) -> None:
+    """Start the detection-independent tracker work of a batch, such as camera motion estimation, before inference.
+
+    Args:
+        predictor (ultralytics.engine.predictor.BasePredictor): The predictor object about to run inference on a batch.
+
+    Examples:
+        Prefetch camera motion for the current batch
+        >>> predictor = SomePredictorClass()
+        >>> on_predict_batch_start(predictor)
+    """
+    im0s = predictor.batch[1]
+    if predictor.dataset.mode == "stream":
+        for tracker, im in zip(predictor.trackers, im0s):
+            tracker.prefetch(im)
+    elif len(im0s) == 1:  # a single tracker can only follow one frame per batch
+        predictor.trackers[0].prefetch(im0s[0])
+
+
 def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None:
     """Postprocess detected boxes and update with object tracking.
 
@@ -89,15 +271,25 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
             tracker.reset()
             predictor.vid_path[i if is_stream else 0] = vid_path
 
-        det = (result.obb if is_obb else result.boxes).cpu().numpy()
-        tracks = tracker.update(det, result.orig_img, getattr(result, "feats", None))
-        if len(tracks) == 0:
-            continue
-        idx = tracks[:, -1].astype(int)
-        predictor.results[i] = result[idx]
+        if not is_stream:
+            predictor.results[i] = track_result(tracker, result, is_obb)
+    if is_stream:
+        predictor.results = track_results(predictor.trackers, predictor.results, is_obb)
+    snapshot_trackers(getattr(predictor, "snapshot_owner", predictor))
+
+
+def on_predict_end(predictor: object, persist: bool = False) -> None:
+    """Save a final tracker state snapshot if a `snapshot` file is configured and the tracked stream has ended.
 
-        update_args = {"obb" if is_obb else "boxes": torch.as_tensor(tracks[:, :-1])}
-        predictor.results[i].update(**update_args)
+    With `persist=True` the trackers carry over to the next predict call, e.g. `model.track(frame, persist=True)` once
+    per frame, so only the periodic background snapshots are written and the final one is saved at predictor teardown.
+
+    Args:
+        predictor (ultralytics.engine.predictor.BasePredictor): The predictor object that finished predicting.
+        persist (bool, optional): Whether the trackers persist across predict calls.
+    """
+    if not persist:
+        snapshot_trackers(getattr(predictor, "snapshot_owner", predictor), final=True)
 
 
 def register_tracker(model: object, persist: bool) -> None:
@@ -113,4 +305,6 @@ def register_tracker(model: object, persist: bool) -> None:
         >>> register_tracker(model, persist=True)
     """
     model.add_callback("on_predict_start", partial(on_predict_start, persist=persist))
+    model.add_callback("on_predict_batch_start", on_predict_batch_start)
     model.add_callback("on_predict_postprocess_end", partial(on_predict_postprocess_end, persist=persist))
+    model.add_callback("on_predict_end", partial(on_predict_end, persist=persist))
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import copy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
@@ -14,10 +16,11 @@ class GMC:
     """Generalized Motion Compensation (GMC) class for tracking and object detection in video frames.
 
     This class provides methods for tracking and detecting objects based on several tracking algorithms including ORB,
-    SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency.
+    SIFT, ECC, Sparse Optical Flow and KLT keypoint tracking. It also supports downscaling of frames for computational
+    efficiency.
 
     Attributes:
-        method (str): The tracking method to use. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
+        method (str): The tracking method to use. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'klt', 'none'.
         downscale (int): Factor by which to downscale the frames for processing.
         prevFrame (np.ndarray): Previous frame for tracking.
         prevKeyPoints (list): Keypoints from the previous frame.
@@ -26,9 +29,11 @@ class GMC:
 
     Methods:
         apply: Apply the chosen method to a raw frame and optionally use provided detections.
+        prefetch: Start estimating the motion of a frame in a worker thread before its detections are available.
         apply_ecc: Apply the ECC algorithm to a raw frame.
         apply_features: Apply feature-based methods like ORB or SIFT to a raw frame.
         apply_sparseoptflow: Apply the Sparse Optical Flow method to a raw frame.
+        apply_klt: Track keypoints across frames, re-detecting only when too few inliers remain.
         reset_params: Reset the internal parameters of the GMC object.
 
     Examples:
@@ -45,7 +50,8 @@ class GMC:
         """Initialize a Generalized Motion Compensation (GMC) object with tracking method and downscale factor.
 
         Args:
-            method (str): The tracking method to use. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
+            method (str): The tracking method to use. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'klt',
+                'none'.
             downscale (int): Downscale factor for processing frames.
         """
         super().__init__()
@@ -74,6 +80,14 @@ class GMC:
                 maxCorners=1000, qualityLevel=0.01, minDistance=1, blockSize=3, useHarrisDetector=False, k=0.04
             )
 
+        elif self.method == "klt":
+            self.feature_params = dict(maxCorners=400, qualityLevel=0.01, minDistance=8, blockSize=3)
+            self.lk_params = dict(
+                winSize=(21, 21), maxLevel=3, criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03)
+            )
+            self.min_points = 100  # re-detect keypoints when fewer inliers remain
+            self.still_thresh = 0.5  # mean absolute background change (gray levels) below which the camera is still
+
         elif self.method in {"none", "None", None}:
             self.method = None
         else:
@@ -82,7 +96,27 @@ class GMC:
         self.prevFrame = None
         self.prevKeyPoints = None
         self.prevDescriptors = None
+        self.prevThumb = None
         self.initializedFirstFrame = False
+        self.executor = None  # worker thread for prefetch()
+        self.pending = deque()  # (frame, future) of prefetched frames in order
+        self.last_detections = None
+        self.applied = self._state()  # state after the last applied frame
+
+    def prefetch(self, raw_frame: np.ndarray) -> None:
+        """Start estimating the motion of a frame in a worker thread while the detector runs on it.
+
+        Unlike `apply()`, the estimate masks moving objects with the detections of the previous frame, as those of this
+        frame are not available yet. `apply()` called next with the same frame object returns the prefetched result;
+        for any other frame the pending estimates are discarded and the motion is computed from the last applied frame.
+
+        Args:
+            raw_frame (np.ndarray): The raw frame to be processed, with shape (H, W, C).
+        """
+        if self.method is None:
+            return
+        self.executor = self.executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="gmc")
+        self.pending.append((raw_frame, self.executor.submit(self._prefetched, raw_frame, self.last_detections)))
 
     def apply(self, raw_frame: np.ndarray, detections: list | None = None) -> np.ndarray:
         """Apply object detection on a raw frame using the specified method.
@@ -101,12 +135,37 @@ class GMC:
             >>> print(transformation_matrix.shape)
             (2, 3)
         """
+        if self.pending and self.pending[0][0] is raw_frame:  # prefetched from the state of the last applied frame
+            H, self.applied = self.pending.popleft()[1].result()
+        else:
+            if self.pending:  # prefetched estimates moved the state past the last applied frame, roll it back
+                applied = self.applied
+                self.reset_params()
+                self.__dict__.update(applied)
+            H = self._apply(raw_frame, detections)
+            self.applied = self._state()
+        self.last_detections = detections
+        return H
+
+    def _state(self) -> dict:
+        """Return the attributes that carry the previous frame from one estimate to the next."""
+        keys = ("prevFrame", "prevKeyPoints", "prevDescriptors", "prevThumb", "initializedFirstFrame")
+        return {k: getattr(self, k) for k in keys}
+
+    def _prefetched(self, raw_frame: np.ndarray, detections: list | None = None) -> tuple[np.ndarray, dict]:
+        """Estimate the motion of a prefetched frame, returning it with the state it leaves behind."""
+        return self._apply(raw_frame, detections), self._state()
+
+    def _apply(self, raw_frame: np.ndarray, detections: list | None = None) -> np.ndarray:
+        """Dispatch a frame to the chosen method."""
         if self.method in {"orb", "sift"}:
             return self.apply_features(raw_frame, detections)
         elif self.method == "ecc":
             return self.apply_ecc(raw_frame)
         elif self.method == "sparseOptFlow":
             return self.apply_sparseoptflow(raw_frame)
+        elif self.method == "klt":
+            return self.apply_klt(raw_frame, detections)
         else:
             return np.eye(2, 3)
 
@@ -332,9 +391,85 @@ class GMC:
 
         return H
 
+    def apply_klt(self, raw_frame: np.ndarray, detections: list | None = None) -> np.ndarray:
+        """Estimate camera motion by tracking the inlier keypoints of the previous frame into the current one.
+
+        Unlike `apply_sparseoptflow()`, keypoints are not re-detected every frame: the RANSAC inliers are tracked into
+        the next frame, and corners are only detected again, outside of detection boxes, when fewer than `min_points`
+        inliers remain. While the background of a 1/8 scale thumbnail stays unchanged relative to the last reference
+        frame the camera is considered still and the estimation is skipped, so slow drift accumulates until detected.
+
+        Args:
+            raw_frame (np.ndarray): The raw frame to be processed, with shape (H, W, C).
+            detections (list, optional): Detection boxes in xyxy format, excluded from keypoint detection.
+
+        Returns:
+            (np.ndarray): Transformation matrix with shape (2, 3).
+
+        Examples:
+            >>> gmc = GMC(method="klt")
+            >>> H = gmc.apply_klt(np.zeros((480, 640, 3), dtype=np.uint8))
+        """
+        height, width, c = raw_frame.shape
+        frame = cv2.cvtColor(raw_frame, cv2.COLOR_BGR2GRAY) if c == 3 else raw_frame
+        H = np.eye(2, 3)
+
+        # Downscale image for computational efficiency
+        if self.downscale > 1.0:
+            frame = cv2.resize(frame, (width // self.downscale, height // self.downscale))
+            width, height = width // self.downscale, height // self.downscale
+
+        # Background mask excluding borders and detected objects
+        mask = np.zeros_like(frame)
+        mask[int(0.02 * height) : int(0.98 * height), int(0.02 * width) : int(0.98 * width)] = 255
+        if detections is not None:
+            for det in detections:
+                tlbr = (np.asarray(det[:4]) / self.downscale).astype(np.int_)
+                mask[max(tlbr[1], 0) : tlbr[3], max(tlbr[0], 0) : tlbr[2]] = 0
+
+        # Skip estimation while the background is unchanged
+        thumb_size = (max(width // 8, 1), max(height // 8, 1))
+        thumb = cv2.resize(frame, thumb_size, interpolation=cv2.INTER_AREA).astype(np.int16)
+        thumb_mask = cv2.resize(mask, thumb_size, interpolation=cv2.INTER_NEAREST) > 0
+        if self.initializedFirstFrame and thumb_mask.any():
+            if np.abs(thumb - self.prevThumb)[thumb_mask].mean() < self.still_thresh:
+                return H
+
+        points = np.empty((0, 1, 2), dtype=np.float32)
+        if self.initializedFirstFrame and len(self.prevKeyPoints):
+            points, status, _ = cv2.calcOpticalFlowPyrLK(
+                self.prevFrame, frame, self.prevKeyPoints, None, **self.lk_params
+            )
+            tracked = status[:, 0] == 1
+            prevPoints, points = self.prevKeyPoints[tracked], points[tracked]
+            if len(prevPoints) > 4:
+                M, inliers = cv2.estimateAffinePartial2D(prevPoints, points, cv2.RANSAC)
+                if M is not None:
+                    H = M
+                    H[:, 2] *= self.downscale  # scale translation back to original resolution
+                    points = points[inliers[:, 0] == 1]
+            else:
+                LOGGER.warning("not enough matching points")
+
+        # Re-detect keypoints only when too few inliers remain
+        if len(points) < self.min_points:
+            corners = cv2.goodFeaturesToTrack(frame, mask=mask, **self.feature_params)
+            points = corners if corners is not None else points
+
+        self.prevFrame, self.prevKeyPoints, self.prevThumb = frame, points, thumb
+        self.initializedFirstFrame = True
+        return H
+
     def reset_params(self) -> None:
         """Reset the internal parameters including previous frame, keypoints, and descriptors."""
+        for _, future in self.pending:
+            if not future.cancel():
+                future.exception()  # wait for a running estimation, it updates the state reset below
+        self.pending.clear()
         self.prevFrame = None
         self.prevKeyPoints = None
         self.prevDescriptors = None
+        self.prevThumb = None
         self.initializedFirstFrame = False
+        self.last_detections = None
+        self.applied = self._state()
@@ -185,8 +185,8 @@ class KalmanFilterXYAH:
         ]
         sqr = np.square(np.r_[std_pos, std_vel]).T
 
-        motion_cov = [np.diag(sqr[i]) for i in range(len(mean))]
-        motion_cov = np.asarray(motion_cov)
+        motion_cov = np.zeros((len(mean), 8, 8))
+        motion_cov[:, range(8), range(8)] = sqr  # batched np.diag()
 
         mean = np.dot(mean, self._motion_mat.T)
         left = np.dot(self._motion_mat, covariance).transpose((1, 0, 2))
@@ -194,6 +194,56 @@ class KalmanFilterXYAH:
 
         return mean, covariance
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray):
+        """Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            mean (np.ndarray): Projected means with shape (N, 4).
+            covariance (np.ndarray): Projected covariances with shape (N, 4, 4).
+        """
+        std = np.stack(
+            [
+                self._std_weight_position * mean[:, 3],
+                self._std_weight_position * mean[:, 3],
+                1e-1 * np.ones_like(mean[:, 3]),
+                self._std_weight_position * mean[:, 3],
+            ],
+            1,
+        )
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        covariance[:, range(4), range(4)] += np.square(std)  # add innovation covariance
+        return mean @ self._update_mat.T, covariance
+
+    def multi_update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
+        """Run Kalman filter correction step for multiple object states (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional predicted state means.
+            covariance (np.ndarray): The Nx8x8 predicted state covariances.
+            measurement (np.ndarray): The Nx4 dimensional measurements in the same format as update().
+
+        Returns:
+            new_mean (np.ndarray): Measurement-corrected state means with shape (N, 8).
+            new_covariance (np.ndarray): Measurement-corrected state covariances with shape (N, 8, 8).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean, covariance = np.zeros((5, 8)) + [0, 0, 1, 1, 0, 0, 0, 0], np.tile(np.eye(8), (5, 1, 1))
+            >>> new_mean, new_covariance = kf.multi_update(mean, covariance, np.ones((5, 4)))
+        """
+        projected_mean, projected_cov = self.multi_project(mean, covariance)
+        # K = P H^T S^-1, solved as S K^T = H P since S and P are symmetric
+        kalman_gain = np.linalg.solve(projected_cov, self._update_mat @ covariance).transpose(0, 2, 1)
+        innovation = measurement - projected_mean
+
+        new_mean = mean + (kalman_gain @ innovation[..., None])[..., 0]
+        new_covariance = covariance - kalman_gain @ projected_cov @ kalman_gain.transpose(0, 2, 1)
+        return new_mean, new_covariance
+
     def update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
         """Run Kalman filter correction step.
 
@@ -449,8 +499,8 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
         ]
         sqr = np.square(np.r_[std_pos, std_vel]).T
 
-        motion_cov = [np.diag(sqr[i]) for i in range(len(mean))]
-        motion_cov = np.asarray(motion_cov)
+        motion_cov = np.zeros((len(mean), 8, 8))
+        motion_cov[:, range(8), range(8)] = sqr  # batched np.diag()
 
         mean = np.dot(mean, self._motion_mat.T)
         left = np.dot(self._motion_mat, covariance).transpose((1, 0, 2))
@@ -458,6 +508,22 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
 
         return mean, covariance
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray):
+        """Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            mean (np.ndarray): Projected means with shape (N, 4).
+            covariance (np.ndarray): Projected covariances with shape (N, 4, 4).
+        """
+        std = self._std_weight_position * mean[:, [2, 3, 2, 3]]
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        covariance[:, range(4), range(4)] += np.square(std)  # add innovation covariance
+        return mean @ self._update_mat.T, covariance
+
     def update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
         """Run Kalman filter correction step.
 
@@ -479,3 +545,67 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
             >>> new_mean, new_covariance = kf.update(mean, covariance, measurement)
         """
         return super().update(mean, covariance, measurement)
+
+
+class StateBank:
+    """Contiguous storage for the Kalman filter states of many tracks, with slot reuse.
+
+    Tracks keep a slot index into the (N, 8) mean and (N, 8, 8) covariance arrays so that prediction, camera motion
+    compensation and correction can run as single batched operations over all tracks. Released slots are reused by new
+    tracks and the arrays grow by doubling when full.
+
+    Attributes:
+        mean (np.ndarray): State means with shape (capacity, 8).
+        covariance (np.ndarray): State covariances with shape (capacity, 8, 8).
+        owners (dict): Mapping of used slot to the track that owns it.
+
+    Methods:
+        alloc: Reserve a slot for a track.
+        release: Free a slot.
+        sweep: Release the slots of all tracks that are not in the given live tracks.
+
+    Examples:
+        >>> bank = StateBank()
+        >>> slot = bank.alloc(track)
+        >>> bank.mean[slot], bank.covariance[slot] = KalmanFilterXYAH().initiate(np.array([10, 10, 0.5, 20]))
+    """
+
+    def __init__(self, capacity: int = 64, ndim: int = 8):
+        """Initialize the bank with room for a number of tracks.
+
+        Args:
+            capacity (int): Initial number of slots.
+            ndim (int): State dimension.
+        """
+        self.mean = np.zeros((capacity, ndim))
+        self.covariance = np.zeros((capacity, ndim, ndim))
+        self.free = list(range(capacity - 1, -1, -1))
+        self.owners = {}
+
+    def __len__(self) -> int:
+        """Return the number of used slots."""
+        return len(self.owners)
+
+    def alloc(self, owner=None) -> int:
+        """Reserve a slot, growing the arrays if required, and return its index."""
+        if not self.free:
+            n = len(self.mean)
+            self.mean = np.concatenate([self.mean, np.zeros_like(self.mean)])
+            self.covariance = np.concatenate([self.covariance, np.zeros_like(self.covariance)])
+            self.free = list(range(2 * n - 1, n - 1, -1))
+        slot = self.free.pop()
+        self.owners[slot] = owner
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Free a slot for reuse."""
+        if slot in self.owners:
+            del self.owners[slot]
+            self.free.append(slot)
+
+    def sweep(self, live: list) -> None:
+        """Detach and release the slots of all owners that are not in live, i.e. removed or merged tracks."""
+        keep = {id(t) for t in live}
+        for slot, owner in list(self.owners.items()):
+            if id(owner) not in keep:
+                owner.detach() if hasattr(owner, "detach") else self.release(slot)
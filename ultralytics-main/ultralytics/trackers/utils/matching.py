@@ -1,7 +1,11 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from __future__ import annotations
+
 import numpy as np
 import scipy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial.distance import cdist
 
 from ultralytics.utils.metrics import batch_probiou, bbox_ioa
@@ -16,10 +20,17 @@ except (ImportError, AssertionError, AttributeError):
     check_requirements("lap>=0.5.12")  # https://github.com/gatagat/lap
     import lap
 
+SPLIT_SIZE = 256  # solve assignments with more rows and columns than this per connected component
+GATE_SIZE = 160000  # compute IoU only for grid-gated candidate pairs when there are more box pairs than this
+
 
 def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = True):
     """Perform linear assignment using either the scipy or lap.lapjv method.
 
+    Large problems solved with lap.lapjv are first split into the connected components of the graph of pairs cheaper
+    than `thresh`, since no other pair can be assigned. In crowded scenes these components are small, so the solve
+    scales with the number of overlapping pairs rather than cubically with the number of tracks.
+
     Args:
         cost_matrix (np.ndarray): The matrix containing cost values for assignments, with shape (N, M).
         thresh (float): Threshold for considering an assignment valid.
@@ -38,6 +49,9 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     if cost_matrix.size == 0:
         return np.empty((0, 2), dtype=int), tuple(range(cost_matrix.shape[0])), tuple(range(cost_matrix.shape[1]))
 
+    if use_lap and min(cost_matrix.shape) > SPLIT_SIZE:
+        return split_assignment(cost_matrix, thresh)
+
     if use_lap:
         # Use lap.lapjv
         # https://github.com/gatagat/lap
@@ -60,6 +74,104 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     return matches, unmatched_a, unmatched_b
 
 
+def split_assignment(cost_matrix: np.ndarray, thresh: float):
+    """Solve a thresholded assignment with lap.lapjv independently per connected component of the candidate pairs.
+
+    Args:
+        cost_matrix (np.ndarray): The matrix containing cost values for assignments, with shape (N, M).
+        thresh (float): Threshold for considering an assignment valid.
+
+    Returns:
+        matched_indices (np.ndarray): Array of matched indices of shape (K, 2), sorted by the first index.
+        unmatched_a (np.ndarray): Array of unmatched indices from the first set, with shape (L,).
+        unmatched_b (np.ndarray): Array of unmatched indices from the second set, with shape (M,).
+
+    Examples:
+        >>> cost_matrix = np.random.rand(100, 100)
+        >>> matched_indices, unmatched_a, unmatched_b = split_assignment(cost_matrix, thresh=0.1)
+    """
+    n, m = cost_matrix.shape
+    rows, cols = np.nonzero(cost_matrix < thresh)
+    graph = coo_matrix((np.ones(len(rows), dtype=bool), (rows, cols + n)), shape=(n + m, n + m))
+    k, labels = connected_components(graph, directed=False)
+    la, lb = labels[:n], labels[n:]
+    na, nb = np.bincount(la, minlength=k), np.bincount(lb, minlength=k)
+
+    # Components of one row and one column are a single candidate pair, matched without solving
+    single = (na[la[rows]] == 1) & (nb[lb[cols]] == 1)
+    matches = [np.stack([rows[single], cols[single]], 1)]
+    ia, ib = np.argsort(la, kind="stable"), np.argsort(lb, kind="stable")
+    oa, ob = np.cumsum(na) - na, np.cumsum(nb) - nb  # component offsets into ia, ib
+    for c in np.nonzero((na > 0) & (nb > 0) & ((na > 1) | (nb > 1)))[0].tolist():
+        ra, cb = ia[oa[c] : oa[c] + na[c]], ib[ob[c] : ob[c] + nb[c]]
+        _, x, _ = lap.lapjv(cost_matrix[np.ix_(ra, cb)], extend_cost=True, cost_limit=thresh)
+        matches.append(np.stack([ra[x >= 0], cb[x[x >= 0]]], 1))
+    matches = np.concatenate(matches)
+    matches = matches[np.argsort(matches[:, 0])]
+    return matches, np.setdiff1d(np.arange(n), matches[:, 0]), np.setdiff1d(np.arange(m), matches[:, 1])
+
+
+def gated_iou(box1: np.ndarray, box2: np.ndarray, eps: float = 1e-7) -> np.ndarray:
+    """Calculate the IoU matrix of two sets of boxes, evaluating only pairs that share a cell of a coarse grid.
+
+    The grid cell is as large as the largest box, so every box touches at most 2x2 cells and overlapping boxes always
+    share one. The result equals `bbox_ioa(box1, box2, iou=True)` at a cost proportional to the number of nearby pairs.
+
+    Args:
+        box1 (np.ndarray): Boxes of shape (N, 4) in x1y1x2y2 format.
+        box2 (np.ndarray): Boxes of shape (M, 4) in x1y1x2y2 format.
+        eps (float, optional): A small value to avoid division by zero.
+
+    Returns:
+        (np.ndarray): IoU matrix of shape (N, M), zero for pairs in different cells.
+    """
+    boxes = np.concatenate([box1, box2])
+    size = max(float((boxes[:, 2:] - boxes[:, :2]).max()), 1.0)
+    lo = np.floor(boxes[:, :2] / size).astype(np.int64)
+    hi = np.floor(boxes[:, 2:] / size).astype(np.int64)
+    lo, hi = lo - lo.min(0), hi - lo.min(0)
+    width = int(hi[:, 1].max()) + 1
+
+    # Key every box by each of the (up to 2x2) cells it covers
+    dx, dy = np.array([0, 1, 0, 1]), np.array([0, 0, 1, 1])
+    cx, cy = lo[:, :1] + dx, lo[:, 1:] + dy
+    covered = (cx <= hi[:, :1]) & (cy <= hi[:, 1:])
+    idx = np.nonzero(covered)[0]
+    keys = (cx * width + cy)[covered]
+    n = len(box1)
+    ka, ia = keys[idx < n], idx[idx < n]
+    kb, ib = keys[idx >= n], idx[idx >= n] - n
+
+    # Join box1 and box2 entries that share a cell
+    order = np.argsort(kb, kind="stable")
+    kb, ib = kb[order], ib[order]
+    start, stop = np.searchsorted(kb, ka, "left"), np.searchsorted(kb, ka, "right")
+    counts = stop - start
+    i = np.repeat(ia, counts)
+    j = ib[np.repeat(start - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+    pairs = np.unique(i * len(box2) + j)
+    i, j = pairs // len(box2), pairs % len(box2)
+
+    # Same arithmetic as bbox_ioa() on the candidate pairs
+    a, b = box1[i], box2[j]
+    inter_area = (np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0])).clip(0) * (
+        np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1])
+    ).clip(0)
+    area = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1]) + (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1]) - inter_area
+    ious = np.zeros((len(box1), len(box2)), dtype=box1.dtype)
+    ious[i, j] = inter_area / (area + eps)
+    return ious
+
+
+def track_boxes(tracks: list) -> list | np.ndarray:
+    """Return the boxes of tracks for IoU matching, xywha for rotated tracks and xyxy otherwise."""
+    if tracks and isinstance(tracks[0], np.ndarray):
+        return tracks
+    if any(track.angle is not None for track in tracks):
+        return [track.xywha if track.angle is not None else track.xyxy for track in tracks]
+    return tracks[0].multi_xyxy(tracks) if tracks else []
+
+
 def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     """Compute cost based on Intersection over Union (IoU) between tracks.
 
@@ -80,8 +192,7 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
         atlbrs = atracks
         btlbrs = btracks
     else:
-        atlbrs = [track.xywha if track.angle is not None else track.xyxy for track in atracks]
-        btlbrs = [track.xywha if track.angle is not None else track.xyxy for track in btracks]
+        atlbrs, btlbrs = track_boxes(atracks), track_boxes(btracks)
 
     ious = np.zeros((len(atlbrs), len(btlbrs)), dtype=np.float32)
     if len(atlbrs) and len(btlbrs):
@@ -91,10 +202,10 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
                 np.ascontiguousarray(btlbrs, dtype=np.float32),
             ).numpy()
         else:
-            ious = bbox_ioa(
+            iou_fn = gated_iou if len(atlbrs) * len(btlbrs) > GATE_SIZE else lambda a, b: bbox_ioa(a, b, iou=True)
+            ious = iou_fn(
                 np.ascontiguousarray(atlbrs, dtype=np.float32),
                 np.ascontiguousarray(btlbrs, dtype=np.float32),
-                iou=True,
             )
     return 1 - ious  # cost matrix
 
@@ -117,15 +228,33 @@ def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -
         >>> detections = [BaseTrack(...), BaseTrack(...)]  # List of detection objects with embedding features
         >>> cost_matrix = embedding_distance(tracks, detections, metric="cosine")
     """
-    cost_matrix = np.zeros((len(tracks), len(detections)), dtype=np.float32)
+    cost_matrix = np.ones((len(tracks), len(detections)), dtype=np.float32)
     if cost_matrix.size == 0:
         return cost_matrix
-    det_features = np.asarray([track.curr_feat for track in detections], dtype=np.float32)
-    # for i, track in enumerate(tracks):
-    # cost_matrix[i, :] = np.maximum(0.0, cdist(track.smooth_feat.reshape(1,-1), det_features, metric))
-    track_features = np.asarray([track.smooth_feat for track in tracks], dtype=np.float32)
-    cost_matrix = np.maximum(0.0, cdist(track_features, det_features, metric))  # Normalized features
-    return cost_matrix
+    bank, slots = tracks[0].bank_slots(tracks) if hasattr(tracks[0], "bank_slots") else (None, None)
+    if getattr(bank, "feat", None) is not None:
+        track_features = bank.feat[slots]  # one gather from the contiguous feature matrix, zero rows without feature
+    else:
+        track_features = [track.smooth_feat for track in tracks]
+    det_features = [track.curr_feat for track in detections]
+    dim = next((len(f) for f in (*det_features, *track_features) if f is not None), 0)
+    if dim == 0:
+        return cost_matrix  # no features, e.g. crops not embedded
+    track_features, det_features = _stack_features(track_features, dim), _stack_features(det_features, dim)
+    if metric == "cosine":  # normalized features, missing (zero) features get the maximum distance 1
+        return np.maximum(0.0, 1.0 - track_features @ det_features.T)
+    return np.maximum(0.0, cdist(track_features, det_features, metric))
+
+
+def _stack_features(feats: list | np.ndarray, dim: int) -> np.ndarray:
+    """Stack feature vectors into an (N, dim) float32 array, using zero rows for missing features."""
+    if isinstance(feats, np.ndarray):
+        return feats.astype(np.float32, copy=False)
+    out = np.zeros((len(feats), dim), dtype=np.float32)
+    for i, f in enumerate(feats):
+        if f is not None:
+            out[i] = f
+    return out
 
 
 def fuse_score(cost_matrix: np.ndarray, detections: list) -> np.ndarray:
@@ -148,6 +277,5 @@ def fuse_score(cost_matrix: np.ndarray, detections: list) -> np.ndarray:
         return cost_matrix
     iou_sim = 1 - cost_matrix
     det_scores = np.array([det.score for det in detections])
-    det_scores = np.expand_dims(det_scores, axis=0).repeat(cost_matrix.shape[0], axis=0)
-    fuse_sim = iou_sim * det_scores
+    fuse_sim = iou_sim * det_scores[None]  # broadcast over tracks
     return 1 - fuse_sim  # fuse_cost
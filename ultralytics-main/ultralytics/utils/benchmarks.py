@@ -6,6 +6,11 @@ Usage:
     from ultralytics.utils.benchmarks import ProfileModels, benchmark
     ProfileModels(['yolo11n.yaml', 'yolov8s.yaml']).run()
     benchmark(model='yolo11n.pt', imgsz=160)
+    startup_benchmark(model='yolo11n.pt')
+    onnx_io_binding_benchmark(model='yolo11n.pt', imgsz=320)
+    dataset_scan_benchmark(n=100000, change=0.01)
+    augment_benchmark(data='coco8.yaml', imgsz=640)
+    video_benchmark('video.mp4', vid_stride=2)
 
 Format                  | `format=argument`         | Model
 ---                     | ---                       | ---
@@ -35,6 +40,8 @@ import os
 import platform
 import re
 import shutil
+import subprocess
+import sys
 import time
 from pathlib import Path
 
@@ -225,6 +232,291 @@ def benchmark(
     return df_display
 
 
+def startup_benchmark(model=WEIGHTS_DIR / "yolo11n.pt", imgsz=160, device="cpu", runs=3):
+    """Benchmark import time and cold-start latency in fresh interpreters, i.e. for autoscaling or worker restarts.
+
+    Each measurement runs in a new Python process so that no module, checkpoint or page cache state from this process
+    leaks into the timings. The fused deploy artifact from save_fused_checkpoint() is created next to the model if
+    missing and compared against the regular checkpoint.
+
+    Args:
+        model (str | Path): Path to a *.pt model file.
+        imgsz (int): Image size for the first prediction.
+        device (str): Device to run the first prediction on.
+        runs (int): Number of fresh processes per measurement, the median is reported.
+
+    Returns:
+        (dict): Median seconds for 'import torch', 'import ultralytics' (excluding torch) and cold start to the first
+            result for the regular and fused checkpoints.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import startup_benchmark
+        >>> startup_benchmark(model="yolo11n.pt")
+    """
+    from ultralytics.nn.tasks import save_fused_checkpoint
+
+    model = Path(YOLO(model).ckpt_path)  # resolve and download if required
+    fused = model.with_suffix(".fused.pt")
+    if not fused.is_file() or fused.stat().st_mtime < model.stat().st_mtime:
+        save_fused_checkpoint(model, fused)
+
+    def run(code):
+        """Return the median of the elapsed seconds printed by code across fresh interpreters."""
+        t = "import time; t = time.perf_counter(); "
+        cmd = [sys.executable, "-c", t + code + "; print(time.perf_counter() - t)"]
+        return float(np.median([float(subprocess.check_output(cmd, text=True).split()[-1]) for _ in range(runs)]))
+
+    predict = "; import numpy as np; YOLO({!r}).predict(np.zeros((640, 640, 3), np.uint8), imgsz={}, device={!r})"
+    results = {"import torch": run("import torch")}
+    results["import ultralytics"] = run("from ultralytics import YOLO") - results["import torch"]
+    results["cold start"] = run("from ultralytics import YOLO" + predict.format(str(model), imgsz, device))
+    results["cold start (fused)"] = run("from ultralytics import YOLO" + predict.format(str(fused), imgsz, device))
+    LOGGER.info("\n".join(f"{k:<20}{v * 1e3:>9.1f} ms" for k, v in results.items()))
+    return results
+
+
+def onnx_io_binding_benchmark(model=WEIGHTS_DIR / "yolo11n.pt", imgsz=640, device="cpu", runs=100):
+    """Benchmark AutoBackend ONNX Runtime inference with IO binding against plain `session.run()`.
+
+    IO binding writes the outputs into rotating preallocated buffers, whereas `session.run()` allocates new numpy
+    outputs that are then converted to torch tensors, as AutoBackend does for models exported with dynamic shapes.
+
+    Args:
+        model (str | Path): Path to a *.pt model file, exported to a static ONNX model of size imgsz.
+        imgsz (int): Image size of the export and the benchmark input.
+        device (str): Device to run inference on.
+        runs (int): Number of timed inferences per method, the median is reported.
+
+    Returns:
+        (dict[str, float]): Median milliseconds per inference for 'session.run' and 'io binding'.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import onnx_io_binding_benchmark
+        >>> onnx_io_binding_benchmark(model="yolo11n.pt", imgsz=320)
+    """
+    from ultralytics.nn.autobackend import AutoBackend
+
+    device = select_device(device, verbose=False)
+    backend = AutoBackend(YOLO(model).export(format="onnx", imgsz=imgsz, device=device), device=device)
+    session, name = backend.session, backend.session.get_inputs()[0].name
+    im = torch.rand(1, 3, imgsz, imgsz, device=device)
+
+    def run():
+        """Run inference with session.run() on numpy inputs and outputs, converted to torch tensors."""
+        return [torch.from_numpy(x).to(device) for x in session.run(backend.output_names, {name: im.cpu().numpy()})]
+
+    def median_ms(fn):
+        """Return the median milliseconds of fn over runs calls after a few warmup calls."""
+        for _ in range(3):
+            fn()
+        t = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            fn()
+            t.append(time.perf_counter() - t0)
+        return float(np.median(t)) * 1e3
+
+    results = {"session.run": median_ms(run), "io binding": median_ms(lambda: backend(im))}
+    LOGGER.info("\n".join(f"{k:<16}{v:>9.2f} ms" for k, v in results.items()))
+    return results
+
+
+def dataset_scan_benchmark(n=20000, change=0.01, dir=None):
+    """Benchmark YOLO label cache scans of a synthetic dataset after changing a fraction of its files.
+
+    A dataset of n identical small images with one label each is written to dir, then the labels are loaded with a full
+    scan, from the unchanged cache, and after rewriting the labels of a fraction of the images and adding as many new
+    images, which only verifies the changed and new files.
+
+    Args:
+        n (int): Number of images in the synthetic dataset.
+        change (float): Fraction of label files to modify, with as many images added.
+        dir (str | Path, optional): Directory to write the dataset to, a temporary directory if None.
+
+    Returns:
+        (dict): Seconds for the 'full scan', 'unchanged' cache load and 'incremental' scan after the change.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import dataset_scan_benchmark
+        >>> dataset_scan_benchmark(n=100000, change=0.01)
+    """
+    import tempfile
+
+    import cv2
+
+    from ultralytics.data import YOLODataset
+
+    with tempfile.TemporaryDirectory(dir=dir) as tmp:
+        images, labels = Path(tmp) / "images" / "train", Path(tmp) / "labels" / "train"
+        images.mkdir(parents=True)
+        labels.mkdir(parents=True)
+        jpg = cv2.imencode(".jpg", np.full((64, 64, 3), 114, dtype=np.uint8))[1].tobytes()
+
+        def add(i):
+            """Write image i and its label file."""
+            (images / f"{i:07d}.jpg").write_bytes(jpg)
+            (labels / f"{i:07d}.txt").write_text("0 0.5 0.5 0.2 0.2\n")
+
+        for i in range(n):
+            add(i)
+        dataset = YOLODataset(img_path=str(images), data={"names": {0: "item"}}, augment=False, imgsz=64)
+        cache = labels.parent / "train.cache"
+
+        def scan():
+            """Return the seconds to get the labels of all current images."""
+            dataset.im_files = dataset.get_img_files(str(images))
+            t = time.perf_counter()
+            dataset.get_labels()
+            return time.perf_counter() - t
+
+        cache.unlink()
+        results = {"full scan": scan(), "unchanged": scan()}
+        m = max(round(n * change), 1)
+        for i in np.random.default_rng(0).choice(n, m, replace=False):
+            (labels / f"{i:07d}.txt").write_text("0 0.5 0.5 0.2 0.2\n0 0.3 0.3 0.1 0.1\n")
+        for i in range(n, n + m):
+            add(i)
+        results["incremental"] = scan()
+    LOGGER.info(
+        f"Label scan of {n} images, {m} modified and {m} added:\n"
+        + "\n".join(f"{k:<14}{v * 1e3:>10.1f} ms" for k, v in results.items())
+    )
+    return results
+
+
+def augment_benchmark(data="coco8.yaml", imgsz=640, n=200):
+    """Benchmark training augmentation throughput of a single dataloader worker with the default hyperparameters.
+
+    Samples are drawn from the training dataset with the default augmentation pipeline, once with the mosaic tiles
+    warped directly into the output image (the default) and once with the 2x2 mosaic canvas drawn and warped as a whole.
+    Images are cached in RAM first so that decoding does not dominate the timings.
+
+    Args:
+        data (str): Dataset YAML file.
+        imgsz (int): Training image size.
+        n (int): Number of samples to time per mode.
+
+    Returns:
+        (dict): Samples per second of a single worker for the 'fused' and 'canvas' mosaic modes.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import augment_benchmark
+        >>> augment_benchmark(data="coco8.yaml", imgsz=640)
+    """
+    from ultralytics.cfg import get_cfg
+    from ultralytics.data import build_yolo_dataset
+    from ultralytics.data.augment import Mosaic
+    from ultralytics.data.utils import check_det_dataset
+
+    cfg = get_cfg(overrides={"imgsz": imgsz, "cache": "ram"})
+    data = check_det_dataset(data)
+    dataset = build_yolo_dataset(cfg, data["train"], batch=16, data=data, mode="train")
+
+    def mosaics(transform):
+        """Yield all Mosaic transforms nested in a transform pipeline."""
+        if isinstance(transform, Mosaic):
+            yield transform
+        for t in getattr(transform, "transforms", []):
+            yield from mosaics(t)
+        if getattr(transform, "pre_transform", None) is not None:
+            yield from mosaics(transform.pre_transform)
+
+    results = {}
+    for mode in "fused", "canvas":
+        for m in mosaics(dataset.transforms):
+            m.fuse = mode == "fused"
+        for i in range(min(n, 10)):  # warmup
+            dataset[i % len(dataset)]
+        t = time.perf_counter()
+        for i in range(n):
+            dataset[i % len(dataset)]
+        results[mode] = n / (time.perf_counter() - t)
+    LOGGER.info(
+        f"Augmentation of {n} samples at imgsz={imgsz}, single worker:\n"
+        + "\n".join(f"{k:<8}{v:>10.1f} samples/s" for k, v in results.items())
+    )
+    return results
+
+
+def video_benchmark(
+    path: str,
+    vid_stride: int = 1,
+    backends: tuple[str, ...] = ("cv2", "pyav"),
+    write: bool = True,
+    infer_ms: float = 0.0,
+):
+    """Benchmark video decoding and encoding throughput of the threaded backends against in-loop `cv2` I/O.
+
+    Args:
+        path (str): Video file to decode.
+        vid_stride (int): Return every `vid_stride`-th frame.
+        backends (tuple[str, ...]): Threaded decoding backends to compare, skipped if unavailable.
+        write (bool): Whether to also encode the decoded frames to a temporary MJPG video.
+        infer_ms (float): Simulated per-frame inference time that leaves the CPU idle, as with GPU inference, during
+            which the threaded backends decode and encode.
+
+    Returns:
+        (dict[str, float]): Frames per second returned to the consumer for each configuration.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import video_benchmark
+        >>> video_benchmark("video.mp4", vid_stride=2)
+    """
+    import tempfile
+
+    import cv2
+
+    from ultralytics.data.video import VideoReader, VideoWriter
+
+    def consume(read, writer):
+        """Return the frames per second read, with optional simulated inference and encoding of each frame."""
+        n, t = 0, time.perf_counter()
+        while True:
+            success, im = read()
+            if not success:
+                break
+            n += 1
+            if infer_ms:
+                time.sleep(infer_ms / 1000)
+            if writer is not None:
+                writer.write(im)
+        if writer is not None:
+            writer.release()
+        return n / (time.perf_counter() - t)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+
+        def open_writer(cls, name):
+            """Return a video writer of class cls for the input frame size in the temporary directory, or None."""
+            if not write:
+                return None
+            cap = cv2.VideoCapture(path)
+            size = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            cap.release()
+            return cls(str(Path(tmp) / f"{name}.avi"), cv2.VideoWriter_fourcc(*"MJPG"), 30, size)
+
+        cap = cv2.VideoCapture(path)
+
+        def read():
+            """Read the next frame in the loop with grab() and retrieve(), as LoadImagesAndVideos did."""
+            return cap.retrieve() if all(cap.grab() for _ in range(vid_stride)) else (False, None)
+
+        results["cv2 (in-loop)"] = consume(read, open_writer(cv2.VideoWriter, "baseline"))
+        cap.release()
+        for backend in backends:
+            try:
+                reader = VideoReader(path, vid_stride=vid_stride, backend=backend)
+            except Exception as e:
+                LOGGER.warning(f"Skipping '{backend}' video backend: {e}")
+                continue
+            results[f"{backend} (threaded)"] = consume(reader.read, open_writer(VideoWriter, backend))
+            reader.release()
+    for k, v in results.items():
+        LOGGER.info(f"{k:<16} {v:8.1f} FPS")
+    return results
+
+
 class RF100Benchmark:
     """Benchmark YOLO model performance across various formats for speed and accuracy.
 
@@ -58,23 +58,23 @@ def box_iou(box1: torch.Tensor, box2: torch.Tensor, eps: float = 1e-7) -> torch.
     """Calculate intersection-over-union (IoU) of boxes.
 
     Args:
-        box1 (torch.Tensor): A tensor of shape (N, 4) representing N bounding boxes in (x1, y1, x2, y2) format.
-        box2 (torch.Tensor): A tensor of shape (M, 4) representing M bounding boxes in (x1, y1, x2, y2) format.
+        box1 (torch.Tensor): A tensor of shape (..., N, 4) representing N bounding boxes in (x1, y1, x2, y2) format.
+        box2 (torch.Tensor): A tensor of shape (..., M, 4) representing M bounding boxes in (x1, y1, x2, y2) format.
         eps (float, optional): A small value to avoid division by zero.
 
     Returns:
-        (torch.Tensor): An NxM tensor containing the pairwise IoU values for every element in box1 and box2.
+        (torch.Tensor): An (..., N, M) tensor containing the pairwise IoU values for every element in box1 and box2.
 
     References:
         https://github.com/pytorch/vision/blob/main/torchvision/ops/boxes.py
     """
     # NOTE: Need .float() to get accurate iou values
     # inter(N,M) = (rb(N,M,2) - lt(N,M,2)).clamp(0).prod(2)
-    (a1, a2), (b1, b2) = box1.float().unsqueeze(1).chunk(2, 2), box2.float().unsqueeze(0).chunk(2, 2)
-    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(2)
+    (a1, a2), (b1, b2) = box1.float().unsqueeze(-2).chunk(2, -1), box2.float().unsqueeze(-3).chunk(2, -1)
+    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(-1)
 
     # IoU = inter / (area1 + area2 - inter)
-    return inter / ((a2 - a1).prod(2) + (b2 - b1).prod(2) - inter + eps)
+    return inter / ((a2 - a1).prod(-1) + (b2 - b1).prod(-1) - inter + eps)
 
 
 def bbox_iou(
@@ -191,13 +191,13 @@ def _get_covariance_matrix(boxes: torch.Tensor) -> tuple[torch.Tensor, torch.Ten
     """Generate covariance matrix from oriented bounding boxes.
 
     Args:
-        boxes (torch.Tensor): A tensor of shape (N, 5) representing rotated bounding boxes, with xywhr format.
+        boxes (torch.Tensor): A tensor of shape (..., N, 5) representing rotated bounding boxes, with xywhr format.
 
     Returns:
         (torch.Tensor): Covariance matrices corresponding to original rotated bounding boxes.
     """
     # Gaussian bounding boxes, ignore the center points (the first two columns) because they are not needed here.
-    gbbs = torch.cat((boxes[:, 2:4].pow(2) / 12, boxes[:, 4:]), dim=-1)
+    gbbs = torch.cat((boxes[..., 2:4].pow(2) / 12, boxes[..., 4:]), dim=-1)
     a, b, c = gbbs.split(1, dim=-1)
     cos = c.cos()
     sin = c.sin()
@@ -255,12 +255,13 @@ def batch_probiou(obb1: torch.Tensor | np.ndarray, obb2: torch.Tensor | np.ndarr
     """Calculate the probabilistic IoU between oriented bounding boxes.
 
     Args:
-        obb1 (torch.Tensor | np.ndarray): A tensor of shape (N, 5) representing ground truth obbs, with xywhr format.
-        obb2 (torch.Tensor | np.ndarray): A tensor of shape (M, 5) representing predicted obbs, with xywhr format.
+        obb1 (torch.Tensor | np.ndarray): A tensor of shape (..., N, 5) representing ground truth obbs, with xywhr
+            format.
+        obb2 (torch.Tensor | np.ndarray): A tensor of shape (..., M, 5) representing predicted obbs, with xywhr format.
         eps (float, optional): A small value to avoid division by zero.
 
     Returns:
-        (torch.Tensor): A tensor of shape (N, M) representing obb similarities.
+        (torch.Tensor): A tensor of shape (..., N, M) representing obb similarities.
 
     References:
         https://arxiv.org/pdf/2106.06072v1.pdf
@@ -269,9 +270,9 @@ def batch_probiou(obb1: torch.Tensor | np.ndarray, obb2: torch.Tensor | np.ndarr
     obb2 = torch.from_numpy(obb2) if isinstance(obb2, np.ndarray) else obb2
 
     x1, y1 = obb1[..., :2].split(1, dim=-1)
-    x2, y2 = (x.squeeze(-1)[None] for x in obb2[..., :2].split(1, dim=-1))
+    x2, y2 = (x.squeeze(-1).unsqueeze(-2) for x in obb2[..., :2].split(1, dim=-1))
     a1, b1, c1 = _get_covariance_matrix(obb1)
-    a2, b2, c2 = (x.squeeze(-1)[None] for x in _get_covariance_matrix(obb2))
+    a2, b2, c2 = (x.squeeze(-1).unsqueeze(-2) for x in _get_covariance_matrix(obb2))
 
     t1 = (
         ((a1 + a2) * (y1 - y2).pow(2) + (b1 + b2) * (x1 - x2).pow(2)) / ((a1 + a2) * (b1 + b2) - (c1 + c2).pow(2) + eps)
@@ -751,6 +752,7 @@ def ap_per_class(
     names: dict[int, str] = {},
     eps: float = 1e-16,
     prefix: str = "",
+    n: np.ndarray | None = None,
 ) -> tuple:
     """Compute the average precision per class for object detection evaluation.
 
@@ -765,6 +767,8 @@ def ap_per_class(
         names (dict[int, str], optional): Dictionary of class names to plot PR curves.
         eps (float, optional): A small value to avoid division by zero.
         prefix (str, optional): A prefix string for saving the plot files.
+        n (np.ndarray, optional): Number of detections aggregated in each row, in which case `tp` holds true positive
+            counts instead of booleans. Used for histogram statistics from `ConfidenceHistogram`.
 
     Returns:
         tp (np.ndarray): True positive counts at threshold given by max F1 metric for each class.
@@ -783,6 +787,7 @@ def ap_per_class(
     # Sort by objectness
     i = np.argsort(-conf)
     tp, conf, pred_cls = tp[i], conf[i], pred_cls[i]
+    n = np.ones(len(i)) if n is None else n[i]
 
     # Find unique classes
     unique_classes, nt = np.unique(target_cls, return_counts=True)
@@ -796,12 +801,12 @@ def ap_per_class(
     for ci, c in enumerate(unique_classes):
         i = pred_cls == c
         n_l = nt[ci]  # number of labels
-        n_p = i.sum()  # number of predictions
+        n_p = n[i].sum()  # number of predictions
         if n_p == 0 or n_l == 0:
             continue
 
         # Accumulate FPs and TPs
-        fpc = (1 - tp[i]).cumsum(0)
+        fpc = (n[i, None] - tp[i]).cumsum(0)
         tpc = tp[i].cumsum(0)
 
         # Recall
@@ -1002,6 +1007,90 @@ class Metric(SimpleClass):
         ]
 
 
+class ConfidenceHistogram:
+    """Fixed-size accumulator of detection statistics for streaming average precision.
+
+    Instead of keeping one row per prediction, predictions are binned per class by confidence and only the number of
+    predictions and true positives per bin are stored, so memory is O(nc * bins * niou) regardless of the dataset size.
+    Bins are reported at their lower confidence edge, which makes precision and recall exact at every edge and AP an
+    approximation whose error shrinks as `bins` grows.
+
+    Attributes:
+        nc (int): Number of classes.
+        bins (int): Number of confidence bins in [0, 1].
+        n (np.ndarray): Number of predictions per class and bin, shape (nc, bins).
+        tp (dict[str, np.ndarray]): True positive counts per class, bin and IoU threshold for each `tp*` statistic,
+            shape (nc, bins, niou).
+        nt_per_class (np.ndarray): Number of targets per class.
+        nt_per_image (np.ndarray): Number of images containing each class.
+
+    Methods:
+        update: Add the statistics of one image.
+        merge: Add the counts of another histogram, e.g. gathered from another rank.
+        stats: Return the accumulated counts as `ap_per_class` inputs.
+
+    Examples:
+        >>> hist = ConfidenceHistogram(nc=80, keys=["tp"], niou=10)
+        >>> hist.update(stat)  # same dict as DetMetrics.update_stats()
+        >>> s = hist.stats()
+        >>> results = ap_per_class(s["tp"], s["conf"], s["pred_cls"], s["target_cls"], n=s["n"])
+    """
+
+    def __init__(self, nc: int, keys: list[str], niou: int = 10, bins: int = 1000):
+        """Initialize empty histograms.
+
+        Args:
+            nc (int): Number of classes.
+            keys (list[str]): Names of the true positive statistics to accumulate, e.g. ['tp', 'tp_m'].
+            niou (int): Number of IoU thresholds.
+            bins (int): Number of confidence bins.
+        """
+        self.nc, self.bins = nc, bins
+        self.n = np.zeros((nc, bins), dtype=np.int64)
+        self.tp = {k: np.zeros((nc, bins, niou), dtype=np.int64) for k in keys}
+        self.nt_per_class = np.zeros(nc, dtype=np.int64)
+        self.nt_per_image = np.zeros(nc, dtype=np.int64)
+
+    def update(self, stat: dict[str, np.ndarray]) -> None:
+        """Add the statistics of one image.
+
+        Args:
+            stat (dict[str, np.ndarray]): Per-image statistics with 'conf', 'pred_cls', 'target_cls', 'target_img' and
+                one (N, niou) boolean array for each key in `self.tp`.
+        """
+        if len(stat["conf"]):
+            c = stat["pred_cls"].astype(int)
+            b = np.clip((stat["conf"] * self.bins).astype(int), 0, self.bins - 1)
+            np.add.at(self.n, (c, b), 1)
+            for k, v in self.tp.items():
+                np.add.at(v, (c, b), stat[k])
+        self.nt_per_class += np.bincount(stat["target_cls"].astype(int), minlength=self.nc)[: self.nc]
+        self.nt_per_image += np.bincount(stat["target_img"].astype(int), minlength=self.nc)[: self.nc]
+
+    def merge(self, other: ConfidenceHistogram | None) -> None:
+        """Add the counts of another histogram with the same shape."""
+        if other is None:
+            return
+        self.n += other.n
+        for k, v in self.tp.items():
+            v += other.tp[k]
+        self.nt_per_class += other.nt_per_class
+        self.nt_per_image += other.nt_per_image
+
+    def stats(self) -> dict[str, np.ndarray]:
+        """Return the non-empty bins as rows in the layout of `DetMetrics.stats`, plus their counts 'n'."""
+        c, b = np.nonzero(self.n)
+        classes = np.arange(self.nc)
+        return {
+            **{k: v[c, b] for k, v in self.tp.items()},
+            "conf": b / self.bins,
+            "pred_cls": c.astype(float),
+            "n": self.n[c, b],
+            "target_cls": np.repeat(classes, self.nt_per_class).astype(float),
+            "target_img": np.repeat(classes, self.nt_per_image).astype(float),
+        }
+
+
 class DetMetrics(SimpleClass, DataExportMixin):
     """Utility class for computing detection metrics such as precision, recall, and mean average precision (mAP).
 
@@ -1014,6 +1103,8 @@ class DetMetrics(SimpleClass, DataExportMixin):
             target classes, and target images.
         nt_per_class: Number of targets per class.
         nt_per_image: Number of targets per image.
+        bins (int): Number of confidence bins for streaming statistics, 0 keeps exact per-prediction statistics.
+        hist (ConfidenceHistogram | None): Streaming statistics used instead of `stats` when `bins` > 0.
 
     Methods:
         update_stats: Update statistics by appending new values to existing stat collections.
@@ -1044,14 +1135,24 @@ class DetMetrics(SimpleClass, DataExportMixin):
         self.stats = dict(tp=[], conf=[], pred_cls=[], target_cls=[], target_img=[])
         self.nt_per_class = None
         self.nt_per_image = None
+        self.bins = 0
+        self.hist = None
 
     def update_stats(self, stat: dict[str, Any]) -> None:
         """Update statistics by appending new values to existing stat collections.
 
+        With `bins` > 0 the values are added to a `ConfidenceHistogram` instead, keeping memory bounded.
+
         Args:
             stat (dict[str, any]): Dictionary containing new statistical values to append. Keys should match existing
                 keys in self.stats.
         """
+        if self.bins:
+            if self.hist is None:
+                keys = [k for k in self.stats if k.startswith("tp")]
+                self.hist = ConfidenceHistogram(len(self.names), keys, niou=stat["tp"].shape[1], bins=self.bins)
+            self.hist.update(stat)
+            return
         for k in self.stats.keys():
             self.stats[k].append(stat[k])
 
@@ -1065,8 +1166,15 @@ class DetMetrics(SimpleClass, DataExportMixin):
 
         Returns:
             (dict[str, np.ndarray]): Dictionary containing concatenated statistics arrays.
+
+        Notes:
+            Statistics are not cleared, so this may also be called mid-run to read partial results, which is cheap
+            with streaming statistics (`bins` > 0).
         """
-        stats = {k: np.concatenate(v, 0) for k, v in self.stats.items()}  # to numpy
+        if self.hist is not None:
+            stats = self.hist.stats()
+        else:
+            stats = {k: np.concatenate(v, 0) for k, v in self.stats.items()}  # to numpy
         if not stats:
             return stats
         results = ap_per_class(
@@ -1079,6 +1187,7 @@ class DetMetrics(SimpleClass, DataExportMixin):
             names=self.names,
             on_plot=on_plot,
             prefix="Box",
+            n=stats.get("n"),
         )[2:]
         self.box.nc = len(self.names)
         self.box.update(results)
@@ -1090,6 +1199,7 @@ class DetMetrics(SimpleClass, DataExportMixin):
         """Clear the stored statistics."""
         for v in self.stats.values():
             v.clear()
+        self.hist = None
 
     @property
     def keys(self) -> list[str]:
@@ -1230,6 +1340,7 @@ class SegmentMetrics(DetMetrics):
             save_dir=save_dir,
             names=self.names,
             prefix="Mask",
+            n=stats.get("n"),
         )[2:]
         self.seg.nc = len(self.names)
         self.seg.update(results_mask)
@@ -1368,6 +1479,7 @@ class PoseMetrics(DetMetrics):
             save_dir=save_dir,
             names=self.names,
             prefix="Pose",
+            n=stats.get("n"),
         )[2:]
         self.pose.nc = len(self.names)
         self.pose.update(results_pose)
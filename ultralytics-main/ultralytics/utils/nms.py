@@ -23,6 +23,7 @@ def non_max_suppression(
     max_time_img: float = 0.05,
     max_nms: int = 30000,
     max_wh: int = 7680,
+    topk_per_det: int = 0,
     rotated: bool = False,
     end2end: bool = False,
     return_idxs: bool = False,
@@ -46,6 +47,8 @@ def non_max_suppression(
         max_time_img (float): Maximum time in seconds for processing one image.
         max_nms (int): Maximum number of boxes for NMS.
         max_wh (int): Maximum box width and height in pixels.
+        topk_per_det (int): Keep at most `max_det * topk_per_det` top-scoring candidates per image before NMS, useful
+            for dense scenes where most candidates are suppressed anyway. 0 keeps up to `max_nms` candidates.
         rotated (bool): Whether to handle Oriented Bounding Boxes (OBB).
         end2end (bool): Whether the model is end-to-end and doesn't require NMS.
         return_idxs (bool): Whether to return the indices of kept detections.
@@ -80,6 +83,7 @@ def non_max_suppression(
     # min_wh = 2  # (pixels) minimum box width and height
     time_limit = 2.0 + max_time_img * bs  # seconds to quit after
     multi_label &= nc > 1  # multiple labels per box (adds 0.5ms/img)
+    k = min(max_nms, max_det * topk_per_det) if topk_per_det > 0 else max_nms  # max candidates per image for NMS
 
     prediction = prediction.transpose(-1, -2)  # shape(1,84,6300) to shape(1,6300,84)
     if not rotated:
@@ -108,37 +112,34 @@ def non_max_suppression(
         if not x.shape[0]:
             continue
 
-        # Detections matrix nx6 (xyxy, conf, cls)
+        # Detections matrix nx6 (xyxy, conf, cls), built only from the top-k candidates
         box, cls, mask = x.split((4, nc, extra), 1)
 
         if multi_label:
             i, j = torch.where(cls > conf_thres)
-            x = torch.cat((box[i], x[i, 4 + j, None], j[:, None].float(), mask[i]), 1)
-            if return_idxs:
-                xk = xk[i]
+            conf = cls[i, j]
         else:  # best class only
-            conf, j = cls.max(1, keepdim=True)
-            filt = conf.view(-1) > conf_thres
-            x = torch.cat((box, conf, j.float(), mask), 1)[filt]
-            if return_idxs:
-                xk = xk[filt]
+            conf, j = cls.max(1)
+            i = torch.where(conf > conf_thres)[0]
+            conf = conf[i]
+            j = j[i]
 
         # Filter by class
         if classes is not None:
-            filt = (x[:, 5:6] == classes).any(1)
-            x = x[filt]
-            if return_idxs:
-                xk = xk[filt]
+            filt = (j[:, None] == classes).any(1)
+            i, j, conf = i[filt], j[filt], conf[filt]
 
         # Check shape
-        n = x.shape[0]  # number of boxes
+        n = i.shape[0]  # number of boxes
         if not n:  # no boxes
             continue
-        if n > max_nms:  # excess boxes
-            filt = x[:, 4].argsort(descending=True)[:max_nms]  # sort by confidence and remove excess boxes
-            x = x[filt]
-            if return_idxs:
-                xk = xk[filt]
+        if n > k:  # excess boxes, select top-k by confidence before gathering boxes and masks
+            filt = conf.topk(k).indices
+            i, j, conf = i[filt], j[filt], conf[filt]
+
+        x = torch.cat((box[i], conf[:, None], j[:, None].float(), mask[i]), 1)
+        if return_idxs:
+            xk = xk[i]
 
         c = x[:, 5:6] * (0 if agnostic else max_wh)  # classes
         scores = x[:, 4]  # scores
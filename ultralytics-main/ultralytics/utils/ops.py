@@ -484,18 +484,56 @@ def process_mask(protos, masks_in, bboxes, shape, upsample: bool = False):
             are the height and width of the input image. The mask is applied to the bounding boxes.
     """
     c, mh, mw = protos.shape  # CHW
-    masks = (masks_in @ protos.float().view(c, -1)).view(-1, mh, mw)  # CHW
-
     width_ratio = mw / shape[1]
     height_ratio = mh / shape[0]
     ratios = torch.tensor([[width_ratio, height_ratio, width_ratio, height_ratio]], device=bboxes.device)
+    if upsample and not protos.is_cuda and shape[0] % mh == 0 and shape[1] % mw == 0:
+        return process_mask_roi(protos, masks_in, bboxes * ratios, shape)  # faster on CPU, same crops as crop_mask()
 
+    masks = (masks_in @ protos.float().view(c, -1)).view(-1, mh, mw)  # CHW
     masks = crop_mask(masks, boxes=bboxes * ratios)  # CHW
     if upsample:
         masks = F.interpolate(masks[None], shape, mode="bilinear")[0]  # CHW
     return masks.gt_(0.0).byte()
 
 
+def process_mask_roi(protos, masks_in, boxes, shape):
+    """Decode and upsample each mask only inside its bounding box.
+
+    Equivalent to cropping the full-resolution prototype masks with `crop_mask()` on CPU and upsampling all of them,
+    but the matrix product and the bilinear upsampling only run over each box region plus a one-pixel margin of
+    prototype zeros, and no float masks of the input size are ever allocated.
+
+    Args:
+        protos (torch.Tensor): Mask prototypes with shape (mask_dim, mask_h, mask_w).
+        masks_in (torch.Tensor): Mask coefficients with shape (N, mask_dim) where N is number of masks after NMS.
+        boxes (torch.Tensor): Bounding boxes with shape (N, 4) in prototype pixel coordinates.
+        shape (tuple): Input image size as (height, width), an integer multiple of the prototype size.
+
+    Returns:
+        (torch.Tensor): Binary mask tensor with shape (N, H, W).
+    """
+    c, mh, mw = protos.shape  # CHW
+    sy, sx = shape[0] // mh, shape[1] // mw
+    protos = protos.float()
+    masks = torch.zeros((len(masks_in), *shape), dtype=torch.uint8, device=protos.device)
+    # Same pixels as crop_mask(): rounded boxes below 50 masks, else r >= x1 and r < x2, i.e. ceil() of both bounds
+    boxes = boxes.round() if len(masks_in) < 50 else boxes.ceil()
+    for i, (x1, y1, x2, y2) in enumerate(boxes.int().tolist()):
+        x1, y1, x2, y2 = max(x1, 0), max(y1, 0), min(x2, mw), min(y2, mh)
+        if x2 <= x1 or y2 <= y1:
+            continue
+        # Margin of zeros so bilinear sampling across the box edges matches upsampling the full cropped mask
+        left, top, right, bottom = max(x1 - 1, 0), max(y1 - 1, 0), min(x2 + 1, mw), min(y2 + 1, mh)
+        roi = protos.new_zeros((1, 1, bottom - top, right - left))
+        roi[0, 0, y1 - top : y2 - top, x1 - left : x2 - left] = (
+            masks_in[i] @ protos[:, y1:y2, x1:x2].reshape(c, -1)
+        ).view(y2 - y1, x2 - x1)
+        roi = F.interpolate(roi, scale_factor=(sy, sx), mode="bilinear")[0, 0]
+        masks[i, top * sy : bottom * sy, left * sx : right * sx] = roi > 0.0
+    return masks
+
+
 def process_mask_native(protos, masks_in, bboxes, shape):
     """Apply masks to bounding boxes using mask head output with native upsampling.
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 import warnings
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -166,6 +167,54 @@ class Colors:
 colors = Colors()  # create instance for 'from utils.plots import colors'
 
 
+@lru_cache(maxsize=1024)
+def label_size(label: str, sf: float, tf: int) -> tuple[int, int]:
+    """Return the cv2 text width and padded label box height of a label, cached for Annotator.box_labels()."""
+    (w, h), _ = cv2.getTextSize(label, 0, fontScale=sf, thickness=tf)
+    return w, h + 3  # add pixels to pad text
+
+
+@lru_cache(maxsize=1024)
+def label_patch(label: str, sf: float, tf: int, color: tuple, txt_color: tuple, outside: bool):
+    """Rasterize a filled cv2 label once so that Annotator.box_labels() can blit it instead of calling cv2.putText().
+
+    The patch holds the label box exactly as box_label() draws it: text anti-aliased over the fill color. Pixels just
+    outside of the box, i.e. the anti-aliased box edge and text descenders, are returned as a blend bg * a + c.
+
+    Args:
+        label (str): Label text, i.e. 'person 0.87'.
+        sf (float): Font scale.
+        tf (int): Font thickness.
+        color (tuple): Label box fill color (B, G, R).
+        txt_color (tuple): Text color.
+        outside (bool): Whether the label sits above the box (text baseline 2 pixels above the box bottom edge).
+
+    Returns:
+        w (int): Label box width.
+        h (int): Label box height including padding.
+        patch (np.ndarray): Label box pixels with shape (h + 1, w + 1, 3).
+        spill (tuple[np.ndarray, np.ndarray]): Y and x offsets from the box top-left of the pixels outside the box.
+        a (np.ndarray): Background weight of the spill pixels with shape (K, 1).
+        c (np.ndarray): Color term of the spill pixels with shape (K, 3).
+    """
+    w, h = label_size(label, sf, tf)
+    m = h  # canvas margin for descenders and stroke thickness
+    org = (m, m + (h - 2 if outside else h - 1))
+    box, text = np.zeros((2, h + 1 + 2 * m, w + 1 + 2 * m), np.uint8)
+    cv2.rectangle(box, (m, m), (m + w, m + h), 255, -1, cv2.LINE_AA)
+    cv2.putText(text, label, org, 0, sf, 255, thickness=tf, lineType=cv2.LINE_AA)
+    patch = np.full((*box.shape, 3), color, np.uint8)
+    cv2.putText(patch, label, org, 0, sf, txt_color, thickness=tf, lineType=cv2.LINE_AA)
+
+    inside = np.zeros_like(box, bool)
+    inside[m : m + h + 1, m : m + w + 1] = True
+    y, x = np.nonzero(((box > 0) | (text > 0)) & ~inside)
+    ab, at = box[y, x, None] / 255, text[y, x, None] / 255
+    a = (1 - ab) * (1 - at)
+    c = np.array(color) * ab * (1 - at) + np.array(txt_color) * at
+    return w, h, patch[m : m + h + 1, m : m + w + 1], (y - m, x - m), a.astype(np.float32), c.astype(np.float32)
+
+
 class Annotator:
     """Ultralytics Annotator for train/val mosaics and JPGs and predictions annotations.
 
@@ -359,6 +408,67 @@ class Annotator:
                     lineType=cv2.LINE_AA,
                 )
 
+    def box_labels(
+        self, boxes, labels: list | None = None, colors: list | None = None, txt_color: tuple = (255, 255, 255)
+    ):
+        """Draw many bounding boxes and labels at once with the same look as repeated box_label() calls.
+
+        Boxes are drawn with one cv2.polylines() call per color and labels are blitted from patches cached by
+        label_patch(), so text is only rasterized once per (label, color, font scale, thickness). Labels are drawn after
+        all boxes so that they are never covered by another box, which is the only visual difference to repeated
+        box_label() calls where boxes overlap labels. PIL annotators fall back to box_label().
+
+        Args:
+            boxes (np.ndarray | torch.Tensor): Boxes as (N, 4) xyxy or (N, 4, 2) polygon points.
+            labels (list[str | None], optional): Label per box, None or empty to skip.
+            colors (list[tuple], optional): Box color per box (B, G, R), defaults to gray.
+            txt_color (tuple, optional): Label text color (R, G, B) for colors without a preset contrast color.
+
+        Examples:
+            >>> annotator = Annotator(im0)
+            >>> annotator.box_labels(np.array([[10, 20, 30, 40], [50, 60, 70, 80]]), ["person 0.90", "car 0.80"])
+        """
+        if isinstance(boxes, torch.Tensor):
+            boxes = boxes.cpu().numpy()
+        boxes = np.asarray(boxes)
+        labels = labels or [None] * len(boxes)
+        colors = [tuple(c) for c in colors] if colors else [(128, 128, 128)] * len(boxes)
+        if self.pil:
+            for box, label, color in zip(boxes.tolist(), labels, colors):
+                self.box_label(box, label, color, txt_color)
+            return
+        if not len(boxes):
+            return
+
+        pts = boxes.astype(int)
+        rect = pts.ndim == 2
+        if rect:  # xyxy to the corner order used by cv2.rectangle()
+            x1, y1, x2, y2 = pts.T
+            pts = np.stack((x1, y1, x2, y1, x2, y2, x1, y2), 1).reshape(-1, 4, 2)
+        groups = {}
+        for p, color in zip(pts, colors):
+            groups.setdefault(color, []).append(p)
+        for color, p in groups.items():
+            cv2.polylines(self.im, p, True, color, self.lw, cv2.LINE_AA if rect else cv2.LINE_8)
+
+        ih, iw = self.im.shape[:2]
+        for (x, y), label, color in zip(pts[:, 0].tolist(), labels, colors):
+            if not label:
+                continue
+            outside = y >= label_size(label, self.sf, self.tf)[1]  # label fits outside box
+            tc = self.get_txt_color(color, txt_color)
+            w, h, patch, (sy, sx), a, c = label_patch(label, self.sf, self.tf, color, tc, outside)
+            x = min(x, iw - w)  # keep label inside the right side of image
+            y0 = y - h if outside else y
+            x1, y1 = max(x, 0), max(y0, 0)
+            roi = self.im[y1 : y0 + h + 1, x1 : x + w + 1]
+            roi[:] = patch[y1 - y0 : y1 - y0 + roi.shape[0], x1 - x : x1 - x + roi.shape[1]]
+            sy, sx = sy + y0, sx + x
+            if x < h or y0 < h or x + w + h >= iw or y0 + 2 * h >= ih:  # near image border, spill may be outside
+                k = (sy >= 0) & (sy < ih) & (sx >= 0) & (sx < iw)
+                sy, sx, a, c = sy[k], sx[k], a[k], c[k]
+            self.im[sy, sx] = self.im[sy, sx] * a + c + 0.5  # blend anti-aliased edges and text spilling outside
+
     def masks(self, masks, colors, im_gpu: torch.Tensor = None, alpha: float = 0.5, retina_masks: bool = False):
         """Plot masks on image.
 
@@ -374,10 +484,12 @@ class Annotator:
             self.im = np.asarray(self.im).copy()
         if im_gpu is None:
             assert isinstance(masks, np.ndarray), "`masks` must be a np.ndarray if `im_gpu` is not provided."
-            overlay = self.im.copy()
-            for i, mask in enumerate(masks):
-                overlay[mask.astype(bool)] = colors[i]
-            self.im = cv2.addWeighted(self.im, 1 - alpha, overlay, alpha, 0)
+            if len(masks):
+                overlay = self.im.copy()
+                covered = masks.any(0)
+                label = len(masks) - 1 - masks[::-1].argmax(0)  # label map of the last mask covering each pixel
+                overlay[covered] = np.asarray(colors, dtype=np.uint8)[label[covered]]
+                self.im = cv2.addWeighted(self.im, 1 - alpha, overlay, alpha, 0)
         else:
             assert isinstance(masks, torch.Tensor), "'masks' must be a torch.Tensor if 'im_gpu' is provided."
             if len(masks) == 0:
@@ -395,15 +507,12 @@ class Annotator:
                     torch.from_numpy(self.im).to(masks.device).permute(2, 0, 1).flip(0).contiguous().float() / 255.0
                 )
 
-            colors = torch.tensor(colors, device=masks.device, dtype=torch.float32) / 255.0  # shape(n,3)
-            colors = colors[:, None, None]  # shape(n,1,1,3)
-            masks = masks.unsqueeze(3)  # shape(n,h,w,1)
-            masks_color = masks * (colors * alpha)  # shape(n,h,w,3)
-            inv_alpha_masks = (1 - masks * alpha).cumprod(0)  # shape(n,h,w,1)
-            mcs = masks_color.max(dim=0).values  # shape(n,h,w,3)
+            colors = torch.tensor(colors, device=masks.device, dtype=torch.float32) * (alpha / 255.0)  # shape(n,3)
+            covered, label = masks.to(torch.uint8).max(0)  # label map of the first mask covering each pixel, (h,w)
+            covered = covered.bool()[..., None]  # shape(h,w,1)
 
             im_gpu = im_gpu.flip(dims=[0]).permute(1, 2, 0).contiguous()  # shape(h,w,3)
-            im_gpu = im_gpu * inv_alpha_masks[-1] + mcs
+            im_gpu = torch.where(covered, im_gpu * (1 - alpha) + colors[label], im_gpu)
             self.im[:] = (im_gpu * 255).byte().cpu().numpy()
         if self.pil:
             # Convert im back to PIL and update draw
@@ -887,7 +996,7 @@ def plot_results(file: str = "path/to/results.csv", dir: str = "", on_plot: Call
                 for c in data.columns:
                     if "loss" in c:
                         loss_keys.append(c)
-                    elif "metric" in c:
+                    elif "metric" in c and c != "metrics/val_subset":  # skip the subset validation flag
                         metric_keys.append(c)
                 loss_mid, metric_mid = len(loss_keys) // 2, len(metric_keys) // 2
                 columns = (
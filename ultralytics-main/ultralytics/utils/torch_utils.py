@@ -7,6 +7,8 @@ import gc
 import math
 import os
 import random
+import shutil
+import threading
 import time
 from contextlib import contextmanager
 from copy import deepcopy
@@ -375,6 +377,7 @@ def model_info_for_loggers(trainer):
     if trainer.args.profile:  # profile ONNX and TensorRT times
         from ultralytics.utils.benchmarks import ProfileModels
 
+        trainer.checkpoint_writer.wait()
         results = ProfileModels([trainer.last], device=trainer.device).run()[0]
         results.pop("model/name")
     else:  # only return PyTorch times from most recent validation
@@ -718,9 +721,12 @@ def strip_optimizer(f: str | Path = "best.pt", s: str = "", updates: dict[str, A
     x["train_args"] = {k: v for k, v in args.items() if k in DEFAULT_CFG_KEYS}  # strip non-default keys
     # x['model'].args = x['train_args']
 
-    # Save
+    # Save atomically, f may be hard-linked to other checkpoints by CheckpointWriter
     combined = {**metadata, **x, **(updates or {})}
-    torch.save(combined, s or f)  # combine dicts (prefer to the right)
+    out = Path(s or f)
+    tmp = out.with_name(f"{out.name}.tmp")
+    torch.save(combined, tmp)  # combine dicts (prefer to the right)
+    os.replace(tmp, out)
     mb = os.path.getsize(s or f) / 1e6  # file size
     LOGGER.info(f"Optimizer stripped from {f},{f' saved as {s},' if s else ''} {mb:.1f}MB")
     return combined
@@ -743,6 +749,129 @@ def convert_optimizer_state_dict_to_fp16(state_dict):
     return state_dict
 
 
+def optimizer_state_dict_to_cpu(optimizer: torch.optim.Optimizer) -> dict[str, Any]:
+    """Return a CPU copy of an optimizer state_dict with FP32 state tensors as FP16.
+
+    Equivalent to `convert_optimizer_state_dict_to_fp16(deepcopy(optimizer.state_dict()))` on CPU, but each state tensor
+    is copied once, directly to its CPU FP16 destination, instead of duplicated on the device first.
+
+    Args:
+        optimizer (torch.optim.Optimizer): Optimizer to snapshot.
+
+    Returns:
+        (dict): Optimizer state dictionary that shares no tensors with the optimizer.
+    """
+    state_dict = optimizer.state_dict()
+    state = {
+        i: {
+            k: v.to("cpu", torch.float16 if k != "step" and v.dtype is torch.float32 else v.dtype, copy=True)
+            if isinstance(v, torch.Tensor)
+            else deepcopy(v)
+            for k, v in x.items()
+        }
+        for i, x in state_dict["state"].items()
+    }
+    return {"state": state, "param_groups": deepcopy(state_dict["param_groups"])}
+
+
+class CheckpointWriter:
+    """Serialize and write training checkpoints in a background thread so that saving does not stall training.
+
+    Each checkpoint is serialized once and written atomically via a temporary file and os.replace(), so readers never
+    see a partial file. While a write is running, a newer checkpoint supersedes queued older ones for the files they
+    share (i.e. last.pt), so only the newest pending state is written to each file. Further files of the same
+    checkpoint, i.e. best.pt when it equals last.pt, are hard links to the first one if `link=True`, falling back to a
+    copy.
+
+    Attributes:
+        link (bool): Whether to hard-link further files of a checkpoint instead of copying them.
+        error (Exception | None): First write error, raised by the next `save` or `wait` call.
+
+    Methods:
+        save: Queue a checkpoint to be written to one or more files.
+        wait: Block until all queued checkpoints are written.
+
+    Examples:
+        >>> writer = CheckpointWriter()
+        >>> writer.save({"epoch": 0, "ema": model}, ["weights/last.pt", "weights/best.pt"])
+        >>> writer.wait()
+    """
+
+    def __init__(self, link: bool = True):
+        """Initialize the writer, the background thread is started on demand and exits when the queue is empty.
+
+        Args:
+            link (bool): Hard-link further files of a checkpoint to the first one instead of copying them.
+        """
+        self.link = link
+        self.error = None
+        self._jobs = []  # queued [ckpt, files], oldest first
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def save(self, ckpt: dict[str, Any], files: list[str | Path]) -> None:
+        """Queue a checkpoint to be written to files, superseding queued checkpoints for the same files.
+
+        The checkpoint must not share mutable state with training, i.e. hold CPU copies of tensors and modules.
+
+        Args:
+            ckpt (dict): Checkpoint dictionary to serialize with torch.save().
+            files (list[str | Path]): Destination files.
+        """
+        self._raise()
+        files = [Path(f) for f in files]
+        with self._lock:
+            for job in self._jobs:
+                job[1] = [f for f in job[1] if f not in files]
+            self._jobs = [job for job in self._jobs if job[1]] + [[ckpt, files]]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="CheckpointWriter")  # non-daemon, finish on exit
+                self._thread.start()
+
+    def wait(self) -> None:
+        """Block until all queued checkpoints are written, raising the first write error if any."""
+        while (thread := self._thread) is not None:
+            thread.join()
+        self._raise()
+
+    def _raise(self) -> None:
+        """Raise and clear the stored write error."""
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _run(self) -> None:
+        """Write queued checkpoints until the queue is empty."""
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    self._thread = None
+                    return
+                ckpt, files = self._jobs.pop(0)
+            try:
+                self._write(ckpt, files)
+            except Exception as e:
+                LOGGER.warning(f"Checkpoint save to {', '.join(map(str, files))} failed: {e}")
+                self.error = self.error or e
+
+    def _write(self, ckpt: dict[str, Any], files: list[Path]) -> None:
+        """Serialize a checkpoint to the first file and link or copy it to the others, each atomically."""
+        for i, f in enumerate(files):
+            f.parent.mkdir(parents=True, exist_ok=True)
+            tmp = f.with_name(f"{f.name}.tmp")
+            tmp.unlink(missing_ok=True)
+            if i == 0:
+                torch.save(ckpt, tmp)
+            else:
+                try:
+                    if not self.link:
+                        raise OSError("hard links disabled")
+                    os.link(files[0], tmp)
+                except OSError:
+                    shutil.copyfile(files[0], tmp)
+            os.replace(tmp, f)
+
+
 @contextmanager
 def cuda_memory_usage(device=None):
     """Monitor and manage CUDA memory usage.